@@ -2,6 +2,7 @@
 import logging
 import hashlib
 import json
+import time
 from pathlib import Path
 from backend.app.config import get_settings
 from typing import Dict, Any, Optional
@@ -26,14 +27,26 @@ class CacheManager:
         )
         return hashlib.md5(key_str.encode()).hexdigest()
     
-    def get(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Retrieve cached response."""
+    def get(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        max_age_seconds: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Retrieve cached response (ignoring entries older than max_age_seconds, if given)."""
         hash_key = self._hash_key(endpoint, params)
         cache_file = self.cache_dir / f"{hash_key}.json"
         
         if not cache_file.exists():
             return None
         
+        if max_age_seconds is not None:
+            try:
+                if time.time() - cache_file.stat().st_mtime > max_age_seconds:
+                    return None
+            except OSError:
+                return None
+        
         try:
             with open(cache_file, "r") as f:
                 cached = json.load(f)
@@ -11,7 +11,7 @@ from kg.candidate_ranker import CandidateRanker, RankingStrategy
 from kg.pathway_integrator import PathwayIntegrator
 from kg.ppi_integrator import PPIIntegrator
 from kg.clinical_trial_parser import trial_parser
-from kg.neo4j_client import Neo4jClient
+from kg.neo4j_client import Neo4jAsyncClient
 from kg.utils import normalize_phase, normalize_drug_id  # ← NEW IMPORT
 
 logger = logging.getLogger(__name__)
@@ -90,7 +90,8 @@ class HybridDrugDiscoveryV2:
         disease_targets = []
         neo4j = None
         try:
-            neo4j = Neo4jClient()
+            neo4j = Neo4jAsyncClient()
+            await neo4j.ensure_schema()
             disease_targets = await ingest_opentargets_for_disease(
                 disease_name=disease_context.corrected_name,
                 neo4j_client=neo4j,
@@ -117,7 +118,7 @@ class HybridDrugDiscoveryV2:
         finally:
             if neo4j:
                 try:
-                    neo4j.close()
+                    await neo4j.close()
                 except Exception as close_error:
                     logger.warning(f"Failed to close Neo4j connection: {close_error}")
         # Track 2: MECHANISTIC REPURPOSING (PRIMARY SOURCE)
@@ -196,6 +197,8 @@ class HybridDrugDiscoveryV2:
             import traceback
             logger.error(traceback.format_exc())
             target_drugs = []
+        finally:
+            await repurposing_engine.aclose()
 
 
         # =================================================================
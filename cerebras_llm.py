@@ -1,14 +1,32 @@
 import asyncio
+import contextvars
 import json
 import logging
 import os
+import random
 import time
-from typing import Any, Dict, List, Optional, Union
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying (rate limits and transient server errors)
+_RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+# Client owned by the current generate_sync call (its loop is torn down afterwards)
+_CALL_CLIENT: contextvars.ContextVar[Optional[httpx.AsyncClient]] = contextvars.ContextVar(
+    "cerebras_call_client", default=None
+)
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Retry transport errors and transient statuses; fail fast on other 4xx."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in _RETRYABLE_STATUS
+    return isinstance(exc, httpx.TransportError)
+
 
 class _CompatResponse:
     """Mimic the original llm_client response shape with a .text attribute."""
@@ -37,13 +55,37 @@ class CerebrasLLM:
         self.max_retries = int(os.environ.get("CEREBRAS_LLM_RETRIES", "3"))
         self.backoff = float(os.environ.get("CEREBRAS_LLM_BACKOFF", "2"))
 
+        # Pooled client reused across async calls; generate_sync uses its own
+        # short-lived client, so this one stays on the application's loop.
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the client for this call: generate_sync's own, else the pooled one."""
+        call_client = _CALL_CLIENT.get()
+        if call_client is not None:
+            return call_client
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = self._new_client()
+            self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled async client."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
     async def generate(
         self,
         prompt: Union[str, List[Dict[str, Any]]],
         temperature: float = 0.0,
         stream: bool = False,
+        json_mode: bool = False,
     ) -> _CompatResponse:
-        """Async generation with retry + backoff."""
+        """Async generation with retry + backoff (json_mode forces a JSON object reply)."""
         attempt = 0
         last_err: Optional[Exception] = None
 
@@ -54,6 +96,7 @@ class CerebrasLLM:
                     prompt=prompt,
                     temperature=temperature,
                     stream=stream,
+                    json_mode=json_mode,
                 )
 
                 latency = time.time() - start
@@ -75,7 +118,13 @@ class CerebrasLLM:
             except Exception as e:  # pragma: no cover - network dependent
                 last_err = e
                 attempt += 1
-                sleep_for = self.backoff**attempt
+                if not _is_retryable(e):
+                    logger.warning(f"Cerebras LLM call failed with non-retryable error: {e}")
+                    break
+                if attempt >= self.max_retries:
+                    break
+                # Jittered exponential backoff so concurrent callers don't retry in lockstep
+                sleep_for = self.backoff**attempt * random.uniform(0.5, 1.5)
                 logger.warning(
                     f"Cerebras LLM attempt {attempt}/{self.max_retries} failed: {e}. "
                     f"Retrying in {sleep_for:.1f}s"
@@ -83,9 +132,29 @@ class CerebrasLLM:
                 await asyncio.sleep(sleep_for)
 
         raise RuntimeError(
-            f"Cerebras LLM failed after {self.max_retries} attempts"
+            f"Cerebras LLM failed after {attempt} attempt(s)"
         ) from last_err
 
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+
+    async def _generate_with_own_client(
+        self,
+        prompt: Union[str, List[Dict[str, Any]]],
+        temperature: float,
+        stream: bool,
+    ) -> _CompatResponse:
+        """generate() on a client that is closed before the sync call's loop goes away."""
+        async with self._new_client() as client:
+            token = _CALL_CLIENT.set(client)
+            try:
+                return await self.generate(prompt, temperature=temperature, stream=stream)
+            finally:
+                _CALL_CLIENT.reset(token)
+
     def generate_sync(
         self,
         prompt: Union[str, List[Dict[str, Any]]],
@@ -101,14 +170,14 @@ class CerebrasLLM:
                 try:
                     asyncio.set_event_loop(new_loop)
                     return new_loop.run_until_complete(
-                        self.generate(prompt, temperature=temperature, stream=stream)
+                        self._generate_with_own_client(prompt, temperature=temperature, stream=stream)
                     )
                 finally:
                     new_loop.close()
                     asyncio.set_event_loop(loop)
             # We have a loop object but it's not running; use it directly.
             return loop.run_until_complete(
-                self.generate(prompt, temperature=temperature, stream=stream)
+                self._generate_with_own_client(prompt, temperature=temperature, stream=stream)
             )
         except RuntimeError:
             # No current loop in this thread; create one.
@@ -116,19 +185,19 @@ class CerebrasLLM:
             try:
                 asyncio.set_event_loop(new_loop)
                 return new_loop.run_until_complete(
-                    self.generate(prompt, temperature=temperature, stream=stream)
+                    self._generate_with_own_client(prompt, temperature=temperature, stream=stream)
                 )
             finally:
                 new_loop.close()
 
-    async def _generate_once(
+    def _build_request(
         self,
         prompt: Union[str, List[Dict[str, Any]]],
         temperature: float,
         stream: bool,
-    ) -> (str, Optional[Dict[str, Any]]):
-        
-        """Single Cerebras /chat/completions call, returns (text, usage)."""
+        json_mode: bool = False,
+    ) -> (str, Dict[str, str], Dict[str, Any]):
+        """Build (url, headers, payload) for a /chat/completions call."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -161,40 +230,85 @@ class CerebrasLLM:
             "temperature": temperature,
             "stream": stream,
         }
+        if json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        return url, headers, payload
 
-        async with httpx.AsyncClient(timeout=self.timeout, headers=headers) as client:
-            if stream:
-                full_text = ""
-                usage: Optional[Dict[str, Any]] = None
-                async with client.stream("POST", url, json=payload) as resp:
-                    resp.raise_for_status()
-                    async for line in resp.aiter_lines():
-                        if not line or not line.startswith("data:"):
-                            continue
-                        data_str = line.removeprefix("data:").strip()
-                        if data_str == "[DONE]":
-                            break
-                        try:
-                            data = json.loads(data_str)
-                        except json.JSONDecodeError:
-                            continue
-                        choice = (data.get("choices") or [{}])[0]
-                        delta = (choice.get("delta") or {}).get("content") or ""
-                        full_text += delta
-                        if "usage" in data:
-                            usage = data["usage"]
-                return full_text, usage
-
-            resp = await client.post(url, json=payload)
+    async def _stream_events(
+        self, url: str, headers: Dict[str, str], payload: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield parsed server-sent event payloads from a streaming call."""
+        client = self._get_client()
+        async with client.stream("POST", url, json=payload, headers=headers) as resp:
             resp.raise_for_status()
-            data = resp.json()
-            text = (
-                (data.get("choices") or [{}])[0]
-                .get("message", {})
-                .get("content", "")
-            )
-            usage = data.get("usage")
-            return text, usage
+            async for line in resp.aiter_lines():
+                if not line or not line.startswith("data:"):
+                    continue
+                data_str = line.removeprefix("data:").strip()
+                if data_str == "[DONE]":
+                    break
+                try:
+                    yield json.loads(data_str)
+                except json.JSONDecodeError:
+                    continue
+
+    @staticmethod
+    def _event_delta(data: Dict[str, Any]) -> str:
+        """Extract the content delta from one streamed event."""
+        choice = (data.get("choices") or [{}])[0]
+        return (choice.get("delta") or {}).get("content") or ""
+
+    async def generate_stream(
+        self,
+        prompt: Union[str, List[Dict[str, Any]]],
+        temperature: float = 0.0,
+        json_mode: bool = False,
+    ) -> AsyncIterator[str]:
+        """Yield content deltas as they arrive (no retry: output is already partially consumed)."""
+        url, headers, payload = self._build_request(
+            prompt, temperature=temperature, stream=True, json_mode=json_mode
+        )
+        # aclosing: when the caller stops early, close the HTTP stream with us
+        async with aclosing(self._stream_events(url, headers, payload)) as events:
+            async for data in events:
+                delta = self._event_delta(data)
+                if delta:
+                    yield delta
+
+    async def _generate_once(
+        self,
+        prompt: Union[str, List[Dict[str, Any]]],
+        temperature: float,
+        stream: bool,
+        json_mode: bool = False,
+    ) -> (str, Optional[Dict[str, Any]]):
+        
+        """Single Cerebras /chat/completions call, returns (text, usage)."""
+        url, headers, payload = self._build_request(
+            prompt, temperature=temperature, stream=stream, json_mode=json_mode
+        )
+
+        if stream:
+            # Accumulate deltas in a list; join once at the end
+            chunks: List[str] = []
+            usage: Optional[Dict[str, Any]] = None
+            async for data in self._stream_events(url, headers, payload):
+                chunks.append(self._event_delta(data))
+                if "usage" in data:
+                    usage = data["usage"]
+            return "".join(chunks), usage
+
+        client = self._get_client()
+        resp = await client.post(url, json=payload, headers=headers)
+        resp.raise_for_status()
+        data = resp.json()
+        text = (
+            (data.get("choices") or [{}])[0]
+            .get("message", {})
+            .get("content", "")
+        )
+        usage = data.get("usage")
+        return text, usage
 
 
 _cerebras_llm = CerebrasLLM()
@@ -204,9 +318,30 @@ async def generate(
     prompt: Union[str, List[Dict[str, Any]]],
     temperature: float = 0.0,
     stream: bool = False,
+    json_mode: bool = False,
 ):
     """Public async API matching the old signature (returns object with .text)."""
-    return await _cerebras_llm.generate(prompt, temperature=temperature, stream=stream)
+    return await _cerebras_llm.generate(
+        prompt, temperature=temperature, stream=stream, json_mode=json_mode
+    )
+
+
+async def generate_stream(
+    prompt: Union[str, List[Dict[str, Any]]],
+    temperature: float = 0.0,
+    json_mode: bool = False,
+) -> AsyncIterator[str]:
+    """Public async streaming API: yields text deltas as they arrive."""
+    async with aclosing(_cerebras_llm.generate_stream(
+        prompt, temperature=temperature, json_mode=json_mode
+    )) as stream:
+        async for delta in stream:
+            yield delta
+
+
+async def aclose() -> None:
+    """Close the shared Cerebras HTTP client (call on application shutdown)."""
+    await _cerebras_llm.aclose()
 
 
 def generate_sync(
@@ -9,13 +9,24 @@ Then merges, deduplicates, and enriches the results.
 """
 
 import logging
+import sys
 from typing import List, Dict, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _is_biologic(drug_type: Optional[str]) -> bool:
+    """Classify a drug type as biologic once at ingest time."""
+    return bool(drug_type) and "antibody" in drug_type.lower()
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    """Intern low-cardinality strings (gene symbols, drug types) shared across candidates."""
+    return sys.intern(value) if value else value
+
+
+@dataclass(slots=True)
 class DrugCandidate:
     """Standardized drug candidate representation."""
     drug_id: str
@@ -30,6 +41,7 @@ class DrugCandidate:
     indication: str = ""
     composite_score: float = 0.0
     sources: List[str] = field(default_factory=list)
+    is_biologic: bool = False
     
     def __hash__(self):
         return hash((self.drug_id, self.target_symbol))
@@ -60,16 +72,18 @@ class HybridDrugDiscovery:
             drugs: List of drug dicts from direct_disease_drugs.py
         """
         for drug in drugs:
+            drug_type = sys.intern(drug.get("drug_type") or "Unknown")
             candidate = DrugCandidate(
                 drug_id=drug.get("drug_id", ""),
                 drug_name=drug.get("drug_name", ""),
-                target_symbol=drug.get("target_symbol"),
+                target_symbol=_intern_optional(drug.get("target_symbol")),
                 target_name=drug.get("target_name"),
-                drug_type=drug.get("drug_type", "Unknown"),
+                drug_type=drug_type,
                 phase=drug.get("phase", 0),
                 source="direct",
                 has_clinical_evidence=True,
-                sources=["opentargets_known_drugs"]
+                sources=["opentargets_known_drugs"],
+                is_biologic=_is_biologic(drug_type)
             )
             self.direct_drugs.append(candidate)
         
@@ -83,18 +97,20 @@ class HybridDrugDiscovery:
             drugs: List of drug dicts from ingest_chembl.py
         """
         for drug in drugs:
+            drug_type = sys.intern(drug.get("drug_type") or "Unknown")
             candidate = DrugCandidate(
                 drug_id=drug.get("drug_id", ""),
                 drug_name=drug.get("drug_name", ""),
-                target_symbol=drug.get("target_symbol"),
+                target_symbol=_intern_optional(drug.get("target_symbol")),
                 target_name=drug.get("target_name"),
-                drug_type=drug.get("drug_type", "Unknown"),
+                drug_type=drug_type,
                 phase=drug.get("phase", 0),
                 source="indirect",
                 has_clinical_evidence=drug.get("has_clinical_evidence", False),
                 mechanism=drug.get("mechanism", ""),
                 indication=drug.get("indication", ""),
-                sources=[drug.get("source", "")]
+                sources=[drug.get("source", "")],
+                is_biologic=_is_biologic(drug_type)
             )
             self.indirect_drugs.append(candidate)
         
@@ -228,14 +244,14 @@ class HybridDrugDiscovery:
             if drug.phase < min_phase:
                 continue
             
-            # Biologic filter
-            if exclude_biologics and "antibody" in drug.drug_type.lower():
-                continue
-            
             # Clinical evidence filter
             if require_clinical_evidence and not drug.has_clinical_evidence:
                 continue
             
+            # Biologic filter (classified once at ingest)
+            if exclude_biologics and drug.is_biologic:
+                continue
+            
             filtered.append(drug)
         
         logger.info(
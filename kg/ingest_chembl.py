@@ -1,5 +1,4 @@
 """Multi-source drug aggregator with OpenTargets primary, ChEMBL fallback."""
-import json  # Add this with other imports
 from json import JSONDecodeError
 import logging
 import httpx
@@ -11,6 +10,7 @@ from agents.base import cache_manager
 from kg.therapeutic_area_mapper import classify_disease_therapeutic_area, TherapeuticAreaMapper
 from kg.dgidb_graphql import fetch_dgidb_drugs_graphql
 from kg.drug_mechanism_explainer import DrugMechanismExplainer
+from kg.utils import json_loads, json_dumps
 
 
 logger = logging.getLogger(__name__)
@@ -215,7 +215,7 @@ async def _fetch_opentargets_drugs(
                 logger.warning(f"OpenTargets API returned {response.status_code}")
                 return []
             
-            data = response.json()
+            data = json_loads(response.content)
             targets = data.get("data", {}).get("targets", [])
             
             all_drugs = []  # Before filtering
@@ -448,6 +448,20 @@ async def _fetch_chembl_drugs(
 # ============================================================================
 # MAIN AGGREGATOR: Multi-Source with Fallback Chain
 # ============================================================================
+MECHANISM_EXPLANATION_CONCURRENCY = 4  # Concurrent LLM calls (rate-limit guard)
+
+# Shared explainer: built once (model setup) and reused across ingest calls
+_explainer: Optional[DrugMechanismExplainer] = None
+
+
+def _get_explainer() -> DrugMechanismExplainer:
+    """Return the shared DrugMechanismExplainer, creating it on first use."""
+    global _explainer
+    if _explainer is None:
+        _explainer = DrugMechanismExplainer()
+    return _explainer
+
+
 async def ingest_drugs_multisource(
     targets: List[Union[Dict, str]],
     neo4j_client,
@@ -486,25 +500,40 @@ async def ingest_drugs_multisource(
                 ensembl_ids.append(ensembl)
                 target_map[symbol] = ensembl
     
+    # Order-preserving dedup so repeated targets don't inflate OT/DGIdb queries
+    gene_symbols = list(dict.fromkeys(gene_symbols))
+    ensembl_ids = list(dict.fromkeys(ensembl_ids))
+    
     all_drugs = []
     covered_targets = set()
     
-    # ===== STAGE 1: OpenTargets (Primary) - NOW WITH FILTERING! =====
+    # ===== STAGE 1 + 2: OpenTargets (Primary) and DGIdb (Secondary) run concurrently =====
+    # DGIdb is queried speculatively for every symbol; rows for targets that
+    # OpenTargets already covers are discarded afterwards (gap filling).
+    async def _no_drugs() -> List[Dict]:
+        return []
+    
     if ensembl_ids:
         logger.info(f"📊 Stage 1: Querying OpenTargets for {len(ensembl_ids)} targets...")
-        ot_drugs = await _fetch_opentargets_drugs(ensembl_ids, disease_name, min_phase)
-        all_drugs.extend(ot_drugs)
-        covered_targets.update({d["target_symbol"] for d in ot_drugs})
+    if gene_symbols:
+        logger.info(f"📊 Stage 2: Querying DGIdb for {len(gene_symbols)} targets (concurrently)...")
+    
+    ot_drugs, dgidb_drugs = await asyncio.gather(
+        _fetch_opentargets_drugs(ensembl_ids, disease_name, min_phase) if ensembl_ids else _no_drugs(),
+        _fetch_dgidb_drugs(gene_symbols, min_phase) if gene_symbols else _no_drugs()
+    )
+    
+    all_drugs.extend(ot_drugs)
+    covered_targets.update(d["target_symbol"] for d in ot_drugs)
+    if ensembl_ids:
         logger.info(f"✓ OpenTargets covered {len(covered_targets)} targets with {len(ot_drugs)} drugs")
     
-    # ===== STAGE 2: DGIdb (Secondary) =====
-    missing = [s for s in gene_symbols if s not in covered_targets]
-    if missing:
-        logger.info(f"📊 Stage 2: Querying DGIdb for {len(missing)} remaining targets...")
-        dgidb_drugs = await _fetch_dgidb_drugs(missing, min_phase)
-        all_drugs.extend(dgidb_drugs)
-        covered_targets.update({d["target_symbol"] for d in dgidb_drugs})
-        logger.info(f"✓ DGIdb covered {len({d['target_symbol'] for d in dgidb_drugs})} additional targets")
+    gap_drugs = [d for d in dgidb_drugs if d["target_symbol"] not in covered_targets]
+    if gap_drugs:
+        all_drugs.extend(gap_drugs)
+        dgidb_targets = {d["target_symbol"] for d in gap_drugs}
+        covered_targets.update(dgidb_targets)
+        logger.info(f"✓ DGIdb covered {len(dgidb_targets)} additional targets")
     
     # ===== STAGE 3: ChEMBL (Tertiary Fallback) - OPTIONAL =====
     # Uncomment if you want ChEMBL as ultimate fallback
@@ -513,43 +542,12 @@ async def ingest_drugs_multisource(
     #     logger.info(f"📊 Stage 3: Querying ChEMBL for {len(missing)} remaining targets...")
     #     # ... ChEMBL code ...
 
-    if enable_reasoning and disease_context:
-        logger.info(f"💊 Generating mechanism explanations for {len(unique_drugs)} drugs...")
-        
-        explainer = DrugMechanismExplainer()
-        
-        for drug in unique_drugs[:10]:  # Limit to top 10 to save API calls
-            try:
-                mechanism_explanation = await explainer.explain_drug_mechanism(
-                    drug_name=drug.get("drug_name"),
-                    drug_moa=drug.get("mechanism", "Unknown"),
-                    drug_phase=str(drug.get("phase", 0)),
-                    target_symbol=drug.get("target_symbol"),
-                    target_pathways="...",  # Get from pathway integrator
-                    disease_name=disease_name,
-                    disease_mechanism=disease_context.description
-                )
-                
-                # Store in Neo4j
-                neo4j_client.add_drug_mechanism(
-                    drug_id=drug.get("drug_id"),
-                    mechanism_json=json.dumps(mechanism_explanation)
-                )
-                
-                logger.info(f"   ✓ {drug['drug_name']}: Mechanism explained")
-                
-            except Exception as e:
-                logger.warning(f"   ⚠️ Could not explain {drug['drug_name']}: {e}")
-    
     # ===== Deduplicate and Ingest to Neo4j =====
-    seen = set()
-    unique_drugs = []
-    
+    # Single dict-keyed pass; setdefault keeps the first-seen drug per key
+    unique_by_key = {}
     for drug in all_drugs:
-        key = (drug.get("drug_name", ""), drug.get("target_symbol", ""))
-        if key not in seen:
-            seen.add(key)
-            unique_drugs.append(drug)
+        unique_by_key.setdefault((drug.get("drug_name", ""), drug.get("target_symbol", "")), drug)
+    unique_drugs = list(unique_by_key.values())
     
     logger.info(f"📊 Total unique drugs: {len(unique_drugs)} (from {len(all_drugs)} raw)")
     
@@ -575,10 +573,51 @@ async def ingest_drugs_multisource(
         })
         
         # ✅ Use create_candidate_target_modulation
-    neo4j_client.batch_create_candidates(candidates_data)
+    await neo4j_client.batch_create_candidates(candidates_data)
+    
+    # ===== Mechanism explanations (after dedup, run concurrently) =====
+    if enable_reasoning and disease_context:
+        drugs_to_explain = unique_drugs[:10]  # Limit to top 10 to save API calls
+        logger.info(f"💊 Generating mechanism explanations for {len(drugs_to_explain)} drugs...")
+        
+        explainer = _get_explainer()
+        semaphore = asyncio.Semaphore(MECHANISM_EXPLANATION_CONCURRENCY)
+        
+        async def _explain(drug: Dict) -> Dict:
+            async with semaphore:
+                return await explainer.explain_drug_mechanism(
+                    drug_name=drug.get("drug_name"),
+                    drug_moa=drug.get("mechanism", "Unknown"),
+                    drug_phase=str(drug.get("phase", 0)),
+                    target_symbol=drug.get("target_symbol"),
+                    target_pathways="...",  # Get from pathway integrator
+                    disease_name=disease_name,
+                    disease_mechanism=disease_context.description
+                )
         
+        explanations = await asyncio.gather(
+            *[_explain(drug) for drug in drugs_to_explain],
+            return_exceptions=True
+        )
         
+        mechanism_rows = []
+        for drug, mechanism_explanation in zip(drugs_to_explain, explanations):
+            if isinstance(mechanism_explanation, Exception):
+                logger.warning(f"   ⚠️ Could not explain {drug['drug_name']}: {mechanism_explanation}")
+                continue
+            
+            mechanism_rows.append({
+                "drug_id": drug.get("drug_id", drug.get("drug_name")),
+                "mechanism_json": json_dumps(mechanism_explanation)
+            })
+            logger.info(f"   ✓ {drug['drug_name']}: Mechanism explained")
         
+        # Store in Neo4j with a single UNWIND write
+        try:
+            await neo4j_client.batch_add_drug_mechanisms(mechanism_rows)
+        except Exception as e:
+            logger.warning(f"   ⚠️ Could not store drug mechanisms: {e}")
+    
     logger.info(f"✅ Multi-source ingestion complete: {len(unique_drugs)} compounds")
     return unique_drugs
 
@@ -1,110 +1,320 @@
 """Production-grade Open Targets integration with TARGET VALIDATION."""
 
 import logging
+import os
 import httpx
 import asyncio
+import heapq
+import math
+import re
 import numpy as np
-from typing import List, Dict, Optional
+from operator import itemgetter
+from typing import List, Dict, Optional, Tuple
 from agents.base import cache_manager
 from tenacity import retry, stop_after_attempt, wait_exponential
 from backend.app.config import get_settings
 from kg.disease_resolver import disease_resolver
-from kg.mechanism_reasoner import MechanismReasoner
-import json
+from kg.utils import HTTP2_AVAILABLE, json_loads
+
+try:
+    import brotli  # noqa: F401  (enables httpx br decoding)
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
 
 
 logger = logging.getLogger(__name__)
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=8))
-async def _query_opentargets_targets_paginated(disease_id: str, page_size: int = 100) -> List[Dict]:
-    """
-    Fetch ALL target associations with pagination.
-    Returns: Complete list of all association rows
-    """
-    settings = get_settings()
-    
-    query = """
-    query DiseaseTargets($efoId: String!, $size: Int!, $index: Int!) {
-        disease(efoId: $efoId) {
-            associatedTargets(
-                page: {index: $index, size: $size},
-                orderByScore: "score DESC",
-                enableIndirect: true
-            ) {
-                count
-                rows {
-                    target {
+# Shared pooled client: avoids a TCP+TLS handshake per OpenTargets page
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared OpenTargets HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,  # multiplex parallel page fetches on one connection
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            headers={
+                "Accept-Encoding": "gzip, br" if BROTLI_AVAILABLE else "gzip",
+                "Content-Type": "application/json",
+            }
+        )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """Close the shared OpenTargets HTTP client (call on application shutdown)."""
+    global _CLIENT
+    if _CLIENT is not None and not _CLIENT.is_closed:
+        await _CLIENT.aclose()
+    _CLIENT = None
+
+
+# Disk cache for OpenTargets disease payloads (static across sessions).
+# Set OT_CACHE_BUST=1 to bypass cached entries and refetch.
+OPENTARGETS_CACHE_TTL_SECONDS = 7 * 86400
+
+
+def _opentargets_cache_get(endpoint: str, params: Dict) -> Optional[Dict]:
+    """Read a cached OpenTargets payload unless the cache is busted."""
+    if os.getenv("OT_CACHE_BUST", "").lower() in ("1", "true", "yes"):
+        return None
+    return cache_manager.get(endpoint, params, max_age_seconds=OPENTARGETS_CACHE_TTL_SECONDS)
+
+
+# In-process memo of approved-drug mechanisms per disease (static within a session);
+# a hit lets a re-fetch skip the knownDrugs half of the bundle query
+_KNOWN_MECH_CACHE: Dict[str, Dict[str, int]] = {}
+
+
+# Pagination limits: pages after the first are fetched concurrently
+OPENTARGETS_PAGE_CONCURRENCY = 8
+OPENTARGETS_MAX_PAGES = 500  # Safety limit: 50,000 associations at page_size=100
+PATHWAY_VALIDATION_CONCURRENCY = 8  # Concurrent Reactome validations per disease
+
+# Selection set shared by the paginated targets query and the disease bundle query
+_ASSOCIATED_TARGETS_FIELDS = """
+            count
+            rows {
+                target {
+                    id
+                    approvedSymbol
+                    approvedName
+                    biotype
+                    proteinIds {
                         id
-                        approvedSymbol
-                        approvedName
-                        biotype
-                        proteinIds {
-                            id
-                            source
-                        }
-                        tractability {
-                            label
-                            modality
-                            value
-                        }
+                        source
                     }
+                    tractability {
+                        label
+                        modality
+                        value
+                    }
+                }
+                score
+                datatypeScores {
+                    id
                     score
-                    datatypeScores {
-                        id
-                        score
+                }
+            }
+"""
+
+_KNOWN_DRUGS_FIELDS = """
+            rows {
+                drug {
+                    name
+                    mechanismsOfAction {
+                        rows {
+                            mechanismOfAction
+                            targets {
+                                approvedSymbol
+                            }
+                        }
                     }
                 }
+                phase
             }
-        }
+"""
+
+_DISEASE_TARGETS_QUERY = """
+query DiseaseTargets($efoId: String!, $size: Int!, $index: Int!) {
+    disease(efoId: $efoId) {
+        associatedTargets(
+            page: {index: $index, size: $size},
+            orderByScore: "score DESC",
+            enableIndirect: true
+        ) {%s}
+    }
+}
+""" % _ASSOCIATED_TARGETS_FIELDS
+
+# One round trip for page 0 of the targets AND the known-drug mechanisms
+_DISEASE_BUNDLE_QUERY = """
+query DiseaseBundle($efoId: String!, $size: Int!) {
+    disease(efoId: $efoId) {
+        associatedTargets(
+            page: {index: 0, size: $size},
+            orderByScore: "score DESC",
+            enableIndirect: true
+        ) {%s}
+        knownDrugs(freeTextQuery: "", size: 50) {%s}
     }
+}
+""" % (_ASSOCIATED_TARGETS_FIELDS, _KNOWN_DRUGS_FIELDS)
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=8))
+async def _fetch_targets_page(
+    client: httpx.AsyncClient,
+    disease_id: str,
+    page_index: int,
+    page_size: int
+) -> Optional[Dict]:
     """
+    Fetch a single page of disease → target associations.
+    Returns: The associatedTargets object ({count, rows}) or None if the disease is unknown
+    """
+    settings = get_settings()
+    variables = {"efoId": disease_id, "size": page_size, "index": page_index}
+    response = await client.post(
+        settings.opentargets_gql_url,
+        json={"query": _DISEASE_TARGETS_QUERY, "variables": variables}
+    )
     
-    all_rows = []
-    total_count = None
-    page_index = 0
-    
-    async with httpx.AsyncClient(timeout=30.0, http2=False, follow_redirects=True) as client:
-        while True:
-            variables = {"efoId": disease_id, "size": page_size, "index": page_index}
-            response = await client.post(
-                settings.opentargets_gql_url,
-                json={"query": query, "variables": variables},
-                headers={"Content-Type": "application/json"}
-            )
-            
-            response.raise_for_status()
-            data = response.json()
-            
-            disease_obj = data.get("data", {}).get("disease", {})
-            if not disease_obj:
-                break
-            
-            assoc = disease_obj.get("associatedTargets", {})
-            rows = assoc.get("rows", [])
-            
-            if total_count is None:
-                total_count = assoc.get("count", 0)
-                logger.info(f"📊 Total associations: {total_count}")
-            
-            if not rows:
-                break
-            
-            all_rows.extend(rows)
-            logger.info(f"   Fetched page {page_index + 1}: {len(all_rows)}/{total_count} associations")
-            
-            # Stop if we've fetched everything
-            if len(all_rows) >= total_count:
-                break
-            
-            page_index += 1
-            
-            # Safety limit: max 500 pages (50,000 associations)
-            if page_index >= 500:
-                logger.warning(f"⚠️ Reached safety limit of 500 pages")
-                break
+    response.raise_for_status()
+    data = json_loads(response.content)
+    
+    payload = data.get("data") or {}
+    disease_obj = payload.get("disease")
+    if not disease_obj:
+        return None
+    
+    return disease_obj.get("associatedTargets") or {}
+
+
+async def _fetch_remaining_target_pages(
+    client: httpx.AsyncClient,
+    disease_id: str,
+    first_page: Optional[Dict],
+    page_size: int
+) -> Tuple[List[Dict], bool]:
+    """
+    Given page 0 of associatedTargets, fetch every remaining page concurrently.
+    
+    Each page is compacted as soon as it arrives (see _compact_association_row),
+    so the bulky datatypeScores/tractability lists never accumulate in memory.
+    Returns: (compact association rows in score order, whether every page was fetched)
+    """
+    if not first_page:
+        return [], False
+    
+    total_count = first_page.get("count", 0)
+    all_rows = [_compact_association_row(row) for row in first_page.get("rows", [])]
+    logger.info(f"📊 Total associations: {total_count}")
+    
+    if not all_rows or len(all_rows) >= total_count:
+        logger.info(f"✅ Fetched {len(all_rows)} total associations")
+        return all_rows, True
+    
+    n_pages = math.ceil(total_count / page_size)
+    if n_pages > OPENTARGETS_MAX_PAGES:
+        logger.warning(f"⚠️ Reached safety limit of {OPENTARGETS_MAX_PAGES} pages")
+        n_pages = OPENTARGETS_MAX_PAGES
+    
+    semaphore = asyncio.Semaphore(OPENTARGETS_PAGE_CONCURRENCY)
+    
+    async def _fetch_bounded(page_index: int) -> Optional[Dict]:
+        async with semaphore:
+            return await _fetch_targets_page(client, disease_id, page_index, page_size)
+    
+    pages = await asyncio.gather(
+        *[_fetch_bounded(i) for i in range(1, n_pages)],
+        return_exceptions=True
+    )
+    
+    # gather preserves order, so rows stay sorted by score
+    extend_rows = all_rows.extend
+    complete = True
+    for page_index, page in enumerate(pages, start=1):
+        if isinstance(page, Exception) or page is None:
+            logger.warning(f"⚠️ Failed to fetch page {page_index + 1}: {page}")
+            complete = False
+            continue
+        extend_rows(map(_compact_association_row, page.get("rows") or ()))
+    
+    logger.info(f"✅ Fetched {len(all_rows)} total associations ({n_pages} pages)")
+    return all_rows, complete
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=8))
+async def _post_disease_bundle(
+    client: httpx.AsyncClient,
+    disease_id: str,
+    page_size: int
+) -> Tuple[Dict, bool]:
+    """
+    POST the combined targets + knownDrugs query.
+    Returns: (disease object, whether the knownDrugs half resolved without GraphQL errors)
+    """
+    settings = get_settings()
+    response = await client.post(
+        settings.opentargets_gql_url,
+        json={"query": _DISEASE_BUNDLE_QUERY, "variables": {"efoId": disease_id, "size": page_size}}
+    )
+    response.raise_for_status()
+    data = json_loads(response.content)
+    
+    known_drugs_ok = True
+    for error in data.get("errors") or ():
+        if "knownDrugs" in (error.get("path") or ()):
+            logger.warning(f"⚠️ knownDrugs failed for {disease_id}: {error.get('message')}")
+            known_drugs_ok = False
+    
+    payload = data.get("data") or {}
+    return payload.get("disease") or {}, known_drugs_ok
+
+
+async def _fetch_disease_bundle(disease_id: str, page_size: int = 100) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    Fetch all target associations plus known-drug mechanisms for a disease.
+    
+    Page 0 of associatedTargets and knownDrugs share one aliased GraphQL
+    request; the remaining target pages are then fetched concurrently.
+    Returns: (all association rows, mechanism_of_action -> frequency)
+    """
+    cache_params = {"disease_id": disease_id, "page_size": page_size}
+    cached = _opentargets_cache_get("opentargets_disease_bundle", cache_params)
+    if cached is not None:
+        _KNOWN_MECH_CACHE[disease_id] = cached["known_mechanisms"]
+        return [_compact_association_row(row) for row in cached["rows"]], cached["known_mechanisms"]
+    
+    client = await _get_client()
+    mechanism_counts = _KNOWN_MECH_CACHE.get(disease_id)
+    known_drugs_ok = True
+    if mechanism_counts is None:
+        try:
+            disease_obj, known_drugs_ok = await _post_disease_bundle(client, disease_id, page_size)
+        except Exception as e:
+            # Known drugs only seed mechanism priors; never let them sink the ingest
+            logger.warning(f"⚠️ Disease bundle query failed, continuing without known drugs: {e}")
+            disease_obj, known_drugs_ok = {}, False
+            first_page = await _fetch_targets_page(client, disease_id, 0, page_size)
+        else:
+            first_page = disease_obj.get("associatedTargets")
+        
+        known_drugs_obj = disease_obj.get("knownDrugs") or {}
+        known_drugs = known_drugs_obj.get("rows") or []
+        mechanism_counts = _count_approved_mechanisms(known_drugs)
+        logger.info(f"📚 Bootstrapped {len(mechanism_counts)} mechanism classes from approved drugs")
+        if known_drugs_ok:
+            _KNOWN_MECH_CACHE[disease_id] = mechanism_counts
+    else:
+        # Mechanisms already known this session: fetch page 0 of the targets alone
+        first_page = await _fetch_targets_page(client, disease_id, 0, page_size)
+    
+    all_rows, complete = await _fetch_remaining_target_pages(
+        client, disease_id, first_page, page_size
+    )
     
-    logger.info(f"✅ Fetched {len(all_rows)} total associations")
-    return all_rows
+    # Cache (compact rows) before scoring mutates them; a partial target list
+    # (some page failed after retries) or missing known drugs is used for this
+    # run but never cached
+    if all_rows and complete and known_drugs_ok:
+        cache_manager.set(
+            "opentargets_disease_bundle",
+            cache_params,
+            {"rows": all_rows, "known_mechanisms": mechanism_counts}
+        )
+    return all_rows, mechanism_counts
+
+
+# Already-normalized IDs (e.g. EFO_0000384) and the PREFIX/NUMBERS split point
+_NORMALIZED_DISEASE_ID_RE = re.compile(r"[A-Za-z]+_\d+")
+_DISEASE_ID_SPLIT_RE = re.compile(r"(\D*)(\d.*)", re.DOTALL)
 
 
 def normalize_disease_id(disease_id: str) -> str:
@@ -112,175 +322,159 @@ def normalize_disease_id(disease_id: str) -> str:
     if not disease_id:
         return disease_id
     
-    if "_" in disease_id and disease_id.count("_") == 1:
-        parts = disease_id.split("_")
-        if parts[0].isalpha() and parts[1].isdigit():
-            return disease_id
+    if _NORMALIZED_DISEASE_ID_RE.fullmatch(disease_id):
+        return disease_id
     
     clean_id = disease_id.replace(":", "").replace("_", "")
     
-    for i, char in enumerate(clean_id):
-        if char.isdigit():
-            prefix = clean_id[:i]
-            numbers = clean_id[i:]
-            return f"{prefix}_{numbers}"
+    match = _DISEASE_ID_SPLIT_RE.fullmatch(clean_id)
+    if match:
+        return f"{match.group(1)}_{match.group(2)}"
     
     return disease_id
 
 
+# Small-molecule tractability bucket -> numeric score
+_TRACT_SM_SCORES = {
+    "Approved": 1.0,
+    "Clinical Precedence": 0.7,
+    "Phase 3": 0.7,
+    "Phase 2": 0.7,
+    "Phase 1": 0.7,
+    "Discovery Precedence": 0.4,
+    "Predicted Tractable": 0.2,
+}
+
+# Composite weights for (base, evidence diversity, tractability)
+_COMPOSITE_WEIGHTS = np.array([0.7, 0.2, 0.1])
+
+
+def _compact_association_row(row: Dict) -> Dict:
+    """
+    Reduce a raw associatedTargets row to the fields used downstream.
+    
+    The per-row scoring inputs (evidence diversity, small-molecule tractability)
+    are extracted here so the nested datatypeScores/tractability lists can be
+    dropped while paginating. Idempotent: compact rows are returned unchanged.
+    """
+    if "evidence_count" in row:
+        return row
+    
+    target = row.get("target", {})
+    tractability = target.get("tractability", [])
+    
+    return {
+        "target": {
+            "id": target.get("id"),
+            "approvedSymbol": target.get("approvedSymbol"),
+            "approvedName": target.get("approvedName"),
+            "biotype": target.get("biotype"),
+            "proteinIds": target.get("proteinIds", []),
+        },
+        "score": row.get("score", 0.0),
+        # Dimension 2: Evidence diversity (number of data types)
+        "evidence_count": sum(1 for d in row.get("datatypeScores", []) if d.get("score", 0) > 0),
+        # Dimension 3: Tractability (converted to numeric)
+        "tract_score": max(
+            (_TRACT_SM_SCORES.get(t.get("value", ""), 0.0) for t in tractability if t.get("modality") == "SM"),
+            default=0.0
+        ),
+    }
+
+
 def _calculate_multi_dimensional_scores(rows: List[Dict]) -> List[Dict]:
     """
     Calculate normalized scores across multiple dimensions using statistical methods.
+    Expects compact rows (see _compact_association_row).
     Returns: List of rows with added 'composite_score' and dimension scores
     """
     if not rows:
         return []
     
-    # Extract raw scores for each dimension
+    # Extract raw scores for each dimension in a single pass
     base_scores = []
     evidence_diversity = []
     tractability_scores = []
     
     for row in rows:
-        # Dimension 1: Base association score
-        base_scores.append(row.get("score", 0.0))
-        
-        # Dimension 2: Evidence diversity (number of data types)
-        datatype_scores = row.get("datatypeScores", [])
-        evidence_count = len([d for d in datatype_scores if d.get("score", 0) > 0])
-        evidence_diversity.append(evidence_count)
-        
-        # Dimension 3: Tractability (converted to numeric)
-        target = row.get("target", {})
-        tractability = target.get("tractability", [])
-        tract_score = 0.0
-        
-        for tract in tractability:
-            if tract.get("modality") == "SM":
-                value = tract.get("value", "")
-                if value == "Approved":
-                    tract_score = max(tract_score, 1.0)
-                elif value in ["Clinical Precedence", "Phase 3", "Phase 2", "Phase 1"]:
-                    tract_score = max(tract_score, 0.7)
-                elif value == "Discovery Precedence":
-                    tract_score = max(tract_score, 0.4)
-                elif value == "Predicted Tractable":
-                    tract_score = max(tract_score, 0.2)
-        
-        tractability_scores.append(tract_score)
-    
-    # Convert to numpy arrays
-    base_scores = np.array(base_scores)
-    evidence_diversity = np.array(evidence_diversity)
-    tractability_scores = np.array(tractability_scores)
-    
-    # Normalize using Min-Max scaling (0-1 range)
-    def normalize(arr):
-        if arr.max() == arr.min():
-            return np.zeros_like(arr)
-        return (arr - arr.min()) / (arr.max() - arr.min())
-    
-    base_norm = normalize(base_scores)
-    evidence_norm = normalize(evidence_diversity)
-    tract_norm = tractability_scores  # Already 0-1
+        base_scores.append(row.get("score", 0.0))  # Dimension 1: Base association score
+        evidence_diversity.append(row.get("evidence_count", 0))
+        tractability_scores.append(row.get("tract_score", 0.0))
+    
+    # Convert to numpy arrays (fromiter avoids an intermediate object array)
+    n = len(rows)
+    base_scores = np.fromiter(base_scores, dtype=np.float64, count=n)
+    evidence_diversity = np.fromiter(evidence_diversity, dtype=np.float64, count=n)
+    tractability_scores = np.fromiter(tractability_scores, dtype=np.float64, count=n)
+    
+    # Normalize in place using Min-Max scaling (0-1 range)
+    def normalize_(arr):
+        lo, hi = arr.min(), arr.max()
+        if hi == lo:
+            arr.fill(0.0)
+        else:
+            np.subtract(arr, lo, out=arr)
+            np.divide(arr, hi - lo, out=arr)
+        return arr
+    
+    # Columns: composite, base_norm, evidence_norm, tract_norm (tractability already 0-1)
+    scores = np.empty((n, 4), dtype=np.float64)
+    scores[:, 1] = normalize_(base_scores)
+    scores[:, 2] = normalize_(evidence_diversity)
+    scores[:, 3] = tractability_scores
     
     # Composite score with weights (evidence-based weights)
     # Base score: 70% (most important)
     # Evidence diversity: 20% (multi-source validation)
     # Tractability: 10% (drugability)
-    composite_scores = (
-        base_norm * 0.7 +
-        evidence_norm * 0.2 +
-        tract_norm * 0.1
-    )
+    scores[:, 0] = scores[:, 1:] @ _COMPOSITE_WEIGHTS
     
-    # Add scores back to rows
-    for i, row in enumerate(rows):
-        row['composite_score'] = float(composite_scores[i])
-        row['base_score_norm'] = float(base_norm[i])
-        row['evidence_norm'] = float(evidence_norm[i])
-        row['tract_norm'] = float(tract_norm[i])
+    # Add scores back to rows (tolist converts to Python floats in one pass)
+    for row, (composite, base_norm, evidence_norm, tract_norm) in zip(rows, scores.tolist()):
+        row['composite_score'] = composite
+        row['base_score_norm'] = base_norm
+        row['evidence_norm'] = evidence_norm
+        row['tract_norm'] = tract_norm
     
     return rows
 
 
-async def _fetch_known_drugs_for_disease(disease_id: str) -> Dict[str, int]:
-    """
-    Fetch approved drugs for this disease to learn valid mechanisms.
-    Returns: Dict of mechanism_of_action -> frequency
-    """
-    settings = get_settings()
-    query = """
-    query KnownDrugs($efoId: String!) {
-      disease(efoId: $efoId) {
-        knownDrugs(freeTextQuery: "", size: 50) {
-          rows {
-            drug {
-              name
-              mechanismsOfAction {
-                rows {
-                  mechanismOfAction
-                  targets {
-                    approvedSymbol
-                  }
-                }
-              }
-            }
-            phase
-          }
-        }
-      }
-    }
-    """
-    
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            settings.opentargets_gql_url,
-            json={"query": query, "variables": {"efoId": disease_id}},
-            headers={"Content-Type": "application/json"}
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        # Count mechanisms in approved drugs (phase 4)
-        mechanism_counts = {}
-        disease_obj = data.get("data", {}).get("disease", {})
-        known_drugs = disease_obj.get("knownDrugs", {}).get("rows", [])
-        
-        for row in known_drugs:
-            if row.get("phase") == 4:  # Only FDA-approved
-                drug = row.get("drug", {})
-                moas = drug.get("mechanismsOfAction", {}).get("rows", [])
-                for moa in moas:
-                    moa_text = moa.get("mechanismOfAction", "")
-                    if moa_text:
-                        mechanism_counts[moa_text] = mechanism_counts.get(moa_text, 0) + 1
-        
-        logger.info(f"📚 Bootstrapped {len(mechanism_counts)} mechanism classes from approved drugs")
-        return mechanism_counts
+def _count_approved_mechanisms(known_drug_rows: List[Dict]) -> Dict[str, int]:
+    """Count mechanisms of action across approved (phase 4) known drugs."""
+    mechanism_counts = {}
+    
+    for row in known_drug_rows:
+        if row.get("phase") == 4:  # Only FDA-approved
+            drug = row.get("drug") or {}
+            moa_obj = drug.get("mechanismsOfAction") or {}
+            for moa in moa_obj.get("rows") or ():
+                moa_text = moa.get("mechanismOfAction", "")
+                if moa_text:
+                    mechanism_counts[moa_text] = mechanism_counts.get(moa_text, 0) + 1
+    
+    return mechanism_counts
+
+
+# UniProt source priority: Swiss-Prot (reviewed) > TrEMBL (unreviewed) > any other uniprot
+_UNIPROT_SOURCE_PRIORITY = {"uniprot_swissprot": 0, "uniprot_trembl": 1}
 
 
 def _extract_uniprot_id(protein_ids: List[Dict]) -> Optional[str]:
-    """Extract UniProt accession from proteinIds list."""
-    if not protein_ids:
-        return None
-    
-    # Prefer Swiss-Prot (reviewed)
-    for pid in protein_ids:
-        if pid.get("source") == "uniprot_swissprot":
-            return pid.get("id")
-    
-    # Fallback to TrEMBL (unreviewed)
-    for pid in protein_ids:
-        if pid.get("source") == "uniprot_trembl":
-            return pid.get("id")
-    
-    # Last resort: any uniprot
-    for pid in protein_ids:
-        if "uniprot" in pid.get("source", "").lower():
-            return pid.get("id")
+    """Extract UniProt accession from proteinIds list (single pass, best source wins)."""
+    best_rank = 3
+    best_id = None
+    
+    for pid in protein_ids or ():
+        source = pid.get("source", "")
+        rank = _UNIPROT_SOURCE_PRIORITY.get(source)
+        if rank is None:
+            rank = 2 if "uniprot" in source.lower() else 3
+        if rank < best_rank:
+            best_rank, best_id = rank, pid.get("id")
+            if rank == 0:
+                break
     
-    return None
+    return best_id
 
 
 def _filter_by_percentile(scored_rows: List[Dict], top_percent: float = 2.0, min_targets: int = 10, max_targets: int = 30) -> List[Dict]:
@@ -299,24 +493,28 @@ def _filter_by_percentile(scored_rows: List[Dict], top_percent: float = 2.0, min
     if not scored_rows:
         return []
     
-    # Sort by composite score
-    scored_rows.sort(key=lambda x: x['composite_score'], reverse=True)
-    
     # Calculate percentile cutoff
     n_targets = max(min_targets, int(len(scored_rows) * (top_percent / 100)))
     n_targets = min(n_targets, max_targets)
     
-    # Additional filter: Must be protein-coding and have base score > 0
-    filtered = []
-    for row in scored_rows:
-        target = row.get("target", {})
-        biotype = target.get("biotype", "")
-        base_score = row.get("score", 0.0)
-        
-        if biotype == "protein_coding" and base_score > 0:
-            filtered.append(row)
-            if len(filtered) >= n_targets:
-                break
+    def _accept(ranked_rows: List[Dict]) -> List[Dict]:
+        # Additional filter: Must be protein-coding and have base score > 0
+        accepted = []
+        for row in ranked_rows:
+            target = row.get("target", {})
+            if target.get("biotype", "") == "protein_coding" and row.get("score", 0.0) > 0:
+                accepted.append(row)
+                if len(accepted) >= n_targets:
+                    break
+        return accepted
+    
+    # Partial top-K selection (O(n log k)); over-fetch to leave room for the biotype filter
+    score_key = itemgetter("composite_score")
+    filtered = _accept(heapq.nlargest(n_targets * 3, scored_rows, key=score_key))
+    
+    # Rare case: too many non-coding rows near the top - fall back to a full ranking
+    if len(filtered) < n_targets and len(scored_rows) > n_targets * 3:
+        filtered = _accept(sorted(scored_rows, key=score_key, reverse=True))
     
     logger.info(f"📊 Percentile filter: Top {top_percent}% = {n_targets} targets, after filtering: {len(filtered)}")
     return filtered
@@ -346,8 +544,8 @@ async def ingest_opentargets_for_disease(
     from kg.pathway_mechanism_validator import pathway_validator
     from kg.target_validator import validate_targets_for_disease
     
-    # STEP 1: Fetch raw targets from OpenTargets
-    all_rows = await _query_opentargets_targets_paginated(disease_id, page_size=100)
+    # STEP 1: Fetch raw targets + known-drug mechanisms from OpenTargets (one bundled request)
+    all_rows, known_mechanisms = await _fetch_disease_bundle(disease_id, page_size=100)
     
     if not all_rows:
         logger.warning(f"❌ No targets found in OpenTargets for {disease_id}")
@@ -361,13 +559,8 @@ async def ingest_opentargets_for_disease(
     
     logger.info(f"   Filtered to top {len(top_rows)} targets")
     
-    # STEP 1.5: Bootstrap mechanism classes from known drugs
-    try:
-        known_mechanisms = await _fetch_known_drugs_for_disease(disease_id)
-        logger.info(f"   Learned mechanisms: {list(known_mechanisms.keys())[:5]}...")
-    except Exception as e:
-        logger.warning(f"⚠️ Bootstrapping failed: {e}")
-        known_mechanisms = {}
+    # STEP 1.5: Mechanism classes bootstrapped from known drugs (fetched with the bundle)
+    logger.info(f"   Learned mechanisms: {list(known_mechanisms.keys())[:5]}...")
     
     # STEP 3: Build target data list
     target_data_list = []
@@ -387,16 +580,23 @@ async def ingest_opentargets_for_disease(
         logger.info(f"🧬 Validating mechanisms for {len(target_data_list)} targets...")
         
         mechanistically_valid = []
+        semaphore = asyncio.Semaphore(PATHWAY_VALIDATION_CONCURRENCY)
+        
+        async def _validate_pathway(target_data: Dict):
+            async with semaphore:
+                return await pathway_validator.validate_mechanism(
+                    target_symbol=target_data["symbol"],
+                    disease_context=disease_context
+                )
         
-        for target_data in target_data_list:
+        # Validate pathway overlap for all targets concurrently
+        pathway_results = await asyncio.gather(
+            *[_validate_pathway(t) for t in target_data_list]
+        )
+        
+        for target_data, pathway_result in zip(target_data_list, pathway_results):
             symbol = target_data["symbol"]
             
-            # Validate pathway overlap
-            pathway_result = await pathway_validator.validate_mechanism(
-                target_symbol=symbol,
-                disease_context=disease_context
-            )
-            
             if pathway_result.decision == "KEEP":
                 target_data["mechanism_score"] = pathway_result.confidence
                 target_data["mechanism_reasoning"] = pathway_result.reasoning
@@ -432,45 +632,35 @@ async def ingest_opentargets_for_disease(
     # STEP 6: NOW save to Neo4j (validated targets only)
     logger.info(f"💾 Saving {len(evidence_validated)} validated targets to Neo4j...")
     
+    rows = []
     final_targets = []
-    
-        # STEP 6: NOW save to Neo4j (validated targets only)
-    logger.info(f"💾 Saving {len(evidence_validated)} validated targets to Neo4j...")
-
-    def save_target_worker(target_data):
-        """Helper to run blocking Neo4j calls in a thread."""
+    for target_data in evidence_validated:
         symbol = target_data["symbol"]
         ensembl_id = target_data.get("ensembl_id", "")
         
-        # Create target node
-        neo4j_client.create_target_node(
-            target_id=ensembl_id,
-            target_symbol=symbol,
-            target_name=""
-        )
-        
-        # Create validated association
-        neo4j_client.create_target_disease_association(
-            target_id=ensembl_id,
-            disease_id=disease_id,
-            score=target_data.get("validation_score", target_data.get("composite_score", 0.5)),
-            evidence="OpenTargets + DisGeNET + Pathway (validated)",
-            mechanism_score=target_data.get("mechanism_score", 0.0)
-        )
+        rows.append({
+            "target_id": ensembl_id,
+            "symbol": symbol,
+            "name": "",
+            "disease_id": disease_id,
+            "score": target_data.get("validation_score", target_data.get("composite_score", 0.5)),
+            "evidence": "OpenTargets + DisGeNET + Pathway (validated)",
+            "mechanism_score": target_data.get("mechanism_score", 0.0)
+        })
         
-        # Return the formatted dict for final_targets
-        return {
+        final_targets.append({
             "symbol": symbol,
             "uniprot_id": target_data.get("uniprot_id"),
             "ensembl_id": ensembl_id,
             "validation_score": target_data.get("validation_score", 0.5),
             "mechanism_score": target_data.get("mechanism_score", 0.0),
             "pathway_jaccard": target_data.get("pathway_jaccard", 0.0)
-        }
-
-    # 🚀 PARALLEL SAVE: Execute writes concurrently using threads
-    tasks = [asyncio.to_thread(save_target_worker, t) for t in evidence_validated]
-    final_targets = await asyncio.gather(*tasks)
+        })
+    
+    # Disease node first (associations MATCH it), then one UNWIND write for all
+    # target nodes + associations, on the async driver
+    await neo4j_client.batch_create_diseases([{"id": disease_id, "name": disease_name}])
+    await neo4j_client.batch_create_target_and_association(rows)
     
     logger.info(f"   ✅ Saved {len(final_targets)} validated targets to Neo4j")
     
@@ -2,7 +2,8 @@ import os
 import json
 import httpx
 import asyncio
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional
+from kg.utils import json_loads
 
 class LLMClient:
     """
@@ -17,9 +18,53 @@ class LLMClient:
         self.model = model_name
         self.base_url = "http://localhost:11434/api/chat"
         self.timeout = 180.0
+        # Lazily-created pooled client, reused across generate() calls
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._client: Optional[httpx.Client] = None
+        # Request fields shared by every call; only messages/temperature vary
+        self._payload_template = {
+            "model": self.model,
+            "stream": False,
+            "format": "json",  # NATIVE JSON ENFORCEMENT
+            "options": {
+                "temperature": 0.0,
+                "num_ctx": 4096,  # Increased context window
+            }
+        }
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client, creating it on first use."""
+        if self._aclient is None or self._aclient.is_closed:
+            self._aclient = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=8)
+            )
+        return self._aclient
+
+    def _get_sync_client(self) -> httpx.Client:
+        """Return the pooled blocking client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(timeout=self.timeout)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled clients."""
+        if self._aclient is not None and not self._aclient.is_closed:
+            await self._aclient.aclose()
+        self._aclient = None
+        if self._client is not None and not self._client.is_closed:
+            self._client.close()
+        self._client = None
 
     def _prepare_payload(self, prompt: Union[str, List[Dict]], temperature: float) -> Dict:
         """Constructs the payload for Ollama /api/chat."""
+        # Fast path: raw string prompt (the common case)
+        if isinstance(prompt, str):
+            payload = self._payload_template.copy()
+            payload["messages"] = [{"role": "user", "content": prompt}]
+            payload["options"] = {**self._payload_template["options"], "temperature": temperature}
+            return payload
+
         messages = []
         
         # Handle list of messages (Gemini/OpenAI style)
@@ -34,34 +79,29 @@ class LLMClient:
                     content = msg.get("content", "")
                 
                 messages.append({"role": role, "content": content})
-        # Handle raw string prompt
+        # Handle any other prompt type
         else:
             messages.append({"role": "user", "content": prompt})
 
         return {
-            "model": self.model,
+            **self._payload_template,
             "messages": messages,
-            "stream": False,
-            "format": "json",  # NATIVE JSON ENFORCEMENT
-            "options": {
-                "temperature": temperature,
-                "num_ctx": 4096,  # Increased context window
-            }
+            "options": {**self._payload_template["options"], "temperature": temperature}
         }
 
     async def generate(self, prompt, temperature: float = 0.0) -> Any:
         """Async generation."""
         payload = self._prepare_payload(prompt, temperature)
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.post(self.base_url, json=payload)
-                response.raise_for_status()
-                return self._parse_response(response.json())
-            except Exception as e:
-                print(f"LLM Error: {e}")
-                # Return empty valid JSON structure on failure to prevent crashes
-                return type('obj', (object,), {'text': '{}'})
+        client = await self._get_client()
+        try:
+            response = await client.post(self.base_url, json=payload)
+            response.raise_for_status()
+            return self._parse_response(json_loads(response.content))
+        except Exception as e:
+            print(f"LLM Error: {e}")
+            # Return empty valid JSON structure on failure to prevent crashes
+            return type('obj', (object,), {'text': '{}'})
 
     def generate_sync(self, prompt, temperature: float = 0.0) -> Any:
         """
@@ -71,10 +111,10 @@ class LLMClient:
         payload = self._prepare_payload(prompt, temperature)
         
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(self.base_url, json=payload)
-                response.raise_for_status()
-                return self._parse_response(response.json())
+            client = self._get_sync_client()
+            response = client.post(self.base_url, json=payload)
+            response.raise_for_status()
+            return self._parse_response(json_loads(response.content))
         except Exception as e:
             print(f"LLM Sync Error: {e}")
             return type('obj', (object,), {'text': '{}'})
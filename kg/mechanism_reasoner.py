@@ -3,93 +3,448 @@
 Mechanistic reasoning using pathways and LLMs.
 """
 
+import asyncio
 import logging
 import os
-import json
-from typing import List, Dict, Optional
+import re
+import string
+from contextlib import aclosing
+from typing import Any, Callable, List, Dict, Optional, Tuple
 from kg.semantic_router import DiseaseContext
 from kg.pathway_integrator import PathwayIntegrator
 from kg.ppi_integrator import PPIIntegrator
-import google.generativeai as genai
+from agents.base import cache_manager
+from kg.utils import json_loads
 import cerebras_llm as llm  # Cerebras-hosted LLM wrapper
 
 GEMINI_AVAILABLE = True
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Cached explanations are keyed on the prompt version: bump it when
+# MECHANISM_PROMPT changes so stale answers are not served.
+MECHANISM_PROMPT_VERSION = "3"
+MECHANISM_CACHE_TTL_SECONDS = 7 * 86400
+# Fallback JSON extraction if a reply is not bare JSON: a fenced ```json block, else the outermost {...}
+_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```|(\{.*\})", re.DOTALL)
+
+# Interaction partners shown to the LLM (capped inside the PPI integrator)
+PROMPT_MAX_INTERACTIONS = 10
+
+MECHANISM_BATCH_CONCURRENCY = 20  # Concurrent explanations per explain_targets_batch call
+# Upper bound on targets packed into one multi-target prompt, so the combined
+# reply stays well inside the model's output-token limit
+MAX_TARGETS_PER_CALL = 8
+
+if MSGSPEC_AVAILABLE:
+    class MechanismResult(msgspec.Struct):
+        """Expected shape of an LLM mechanism explanation (validated on decode)."""
+        mechanistic_fit: str
+        confidence: float
+        reasoning: dict = {}
+        risks: list = []
+        synergies: list = []
+        limitations: list = []
+    
+    class TargetMechanismResult(MechanismResult, kw_only=True):
+        """One entry of a multi-target reply."""
+        target: str
+    
+    class MechanismBatchResult(msgspec.Struct):
+        """Multi-target reply: {"results": [...]}."""
+        results: List[TargetMechanismResult]
+    
+    _DECODE_ERRORS = (ValueError, msgspec.DecodeError)
+else:
+    _DECODE_ERRORS = (ValueError,)
+
+
+def _decode_result(text: str) -> Dict:
+    """Decode one explanation; validated against MechanismResult when msgspec is installed."""
+    if MSGSPEC_AVAILABLE:
+        return msgspec.structs.asdict(msgspec.json.decode(text, type=MechanismResult))
+    return json_loads(text)
+
+
+def _decode_batch_result(text: str) -> List[Dict]:
+    """Decode a multi-target reply into its list of per-target explanations."""
+    if MSGSPEC_AVAILABLE:
+        decoded = msgspec.json.decode(text, type=MechanismBatchResult)
+        return [msgspec.structs.asdict(entry) for entry in decoded.results]
+    results = json_loads(text).get("results")
+    if not isinstance(results, list):
+        raise ValueError("multi-target reply has no 'results' list")
+    return [entry for entry in results if isinstance(entry, dict)]
+
+
+# Process-wide singletons shared by every MechanismReasoner instance
+_PATHWAY_INTEGRATOR: Optional[PathwayIntegrator] = None
+_PPI_INTEGRATOR: Optional[PPIIntegrator] = None
+
+
+def _get_integrators() -> Tuple[PathwayIntegrator, PPIIntegrator]:
+    """Return the shared pathway and PPI integrators."""
+    global _PATHWAY_INTEGRATOR, _PPI_INTEGRATOR
+    if _PATHWAY_INTEGRATOR is None:
+        _PATHWAY_INTEGRATOR = PathwayIntegrator()
+    if _PPI_INTEGRATOR is None:
+        _PPI_INTEGRATOR = PPIIntegrator()
+    return _PATHWAY_INTEGRATOR, _PPI_INTEGRATOR
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Pre-parse a str.format template once; the returned renderer only joins
+    the constant slices with the formatted fields.
+    """
+    parts = [
+        (literal, field_name, format_spec)
+        for literal, field_name, format_spec, _ in string.Formatter().parse(template)
+    ]
+    
+    def render(**fields) -> str:
+        out = []
+        for literal, field_name, format_spec in parts:
+            out.append(literal)
+            if field_name is not None:
+                out.append(format(fields[field_name], format_spec))
+        return "".join(out)
+    
+    return render
+
 
 class MechanismReasoner:
     """
     Generate mechanistic explanations for target-disease associations.
     """
     
-    MECHANISM_PROMPT = """You are a systems biology expert analyzing drug targets.
-
-TASK: Explain the COMPLETE mechanistic pathway from disease to target to phenotype.
-
-DISEASE CONTEXT:
-- Name: {disease_name}
-- Type: {disease_type}
-- Pathophysiology: {disease_description}
-- Disrupted Pathways: {disease_pathways}
-
-TARGET:
-- Gene: {target_symbol}
-- Pathways: {target_pathways}
-- Protein Interactions: {target_interactions}
-
-PATHWAY OVERLAP:
-- Common Pathways: {overlap_pathways}
-- Jaccard Similarity: {overlap_score:.2f}
-
-TASK: Generate a mechanistic explanation in this JSON format:
-{{
-  "mechanistic_fit": "HIGH" | "MEDIUM" | "LOW",
-  "confidence": 0.95,
-  "reasoning": {{
-    "disease_mechanism": "<How disease disrupts normal biology>",
-    "target_role": "<Where target sits in pathway>",
-    "intervention_effect": "<Predicted effect of targeting this protein>",
-    "pathway_cascade": ["Step 1", "Step 2", "Step 3"],
-    "phenotypic_outcome": "<Expected clinical outcome>"
-  }},
-  "risks": [
-    {{
-      "risk": "Off-target effect on pathway X",
-      "severity": "MODERATE",
-      "mitigation": "Use selective inhibitor"
-    }}
-  ],
-  "synergies": [
-    "<Targets or drugs that would synergize>"
-  ],
-  "limitations": [
-    "<What this target CANNOT address>"
-  ]
-}}
-
-Be specific and cite molecular mechanisms. Focus on CAUSAL relationships, not just associations.
+    _TARGET_SECTION = """TARGET: {target_symbol}
+Pathways: {target_pathways}
+Interactors (STRING score): {target_interactions}
+
+OVERLAP: {overlap_pathways} (Jaccard {overlap_score:.2f})
+"""
+    
+    _RESULT_KEYS = """- mechanistic_fit: "HIGH" | "MEDIUM" | "LOW"
+- confidence: number 0-1
+- reasoning: object with disease_mechanism, target_role, intervention_effect, pathway_cascade (list of steps), phenotypic_outcome
+- risks: list of objects with risk, severity, mitigation
+- synergies: list of synergizing targets or drugs
+- limitations: list of what this target cannot address
 """
     
+    # Stable content first (instructions, output schema, disease section) and the
+    # per-target section last, so every call for one disease shares a long common
+    # prefix that the provider's implicit prompt cache can reuse.
+    MECHANISM_PROMPT = """You are a systems biology expert. Explain the causal mechanism from disease to target to phenotype.
+Cite specific molecular mechanisms; focus on causal relationships, not associations.
+
+Reply with one JSON object with these keys:
+""" + _RESULT_KEYS + """
+DISEASE: {disease_name} ({disease_type})
+Pathophysiology: {disease_description}
+Disrupted pathways: {disease_pathways}
+
+""" + _TARGET_SECTION
+    
+    MECHANISM_BATCH_PROMPT = """You are a systems biology expert. For EACH target below, explain the causal mechanism from disease to target to phenotype.
+Cite specific molecular mechanisms; focus on causal relationships, not associations.
+
+Reply with one JSON object {{"results": [...]}} holding one entry per target, each with these keys:
+- target: the gene symbol exactly as given below
+""" + _RESULT_KEYS + """
+DISEASE: {disease_name} ({disease_type})
+Pathophysiology: {disease_description}
+Disrupted pathways: {disease_pathways}
+
+{target_sections}"""
+    
+    JSON_CORRECTION_PROMPT = "Your previous reply was not valid JSON. Reply with only the corrected JSON object."
+    
+    _render_mechanism_prompt = staticmethod(_compile_template(MECHANISM_PROMPT))
+    _render_mechanism_batch_prompt = staticmethod(_compile_template(MECHANISM_BATCH_PROMPT))
+    _render_target_section = staticmethod(_compile_template(_TARGET_SECTION))
+    
     def __init__(self, api_key: Optional[str] = None):
         if not GEMINI_AVAILABLE:
             raise ImportError("google-generativeai not installed")
         
         self.api_key = ""
-        genai.configure(api_key="")
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
         
-        self.pathway_integrator = PathwayIntegrator()
-        self.ppi_integrator = PPIIntegrator()
+        self.pathway_integrator, self.ppi_integrator = _get_integrators()
+        
+        # Disease-side prompt inputs, keyed by corrected disease name
+        self._disease_cache: Dict[str, Dict] = {}
+    
+    async def _prepare_disease_side(self, disease_context: DiseaseContext) -> Dict:
+        """Fetch and format the disease-only prompt inputs (shared by every target)."""
+        cache_key = disease_context.corrected_name
+        if cache_key in self._disease_cache:
+            return self._disease_cache[cache_key]
+        
+        disease_pathways = await self.pathway_integrator.get_disease_pathways(
+            disease_context.corrected_name
+        )
+        
+        disease_pathways_str = "; ".join([
+            p['name'] for p in disease_pathways[:5]
+        ]) or "none identified"
+        
+        disease_side = {
+            "pathways": disease_pathways,
+            "pathway_set": frozenset(filter(None, (p["pathway_id"] for p in disease_pathways))),
+            "pathways_str": disease_pathways_str,
+            "disease_type": disease_context.disease_type
+        }
+        self._disease_cache[cache_key] = disease_side
+        return disease_side
+    
+    @staticmethod
+    def _disease_cache_key(disease_context: DiseaseContext) -> str:
+        """
+        Canonical disease identity for the explanation cache.
+        
+        Prefers ontology IDs so paraphrased queries ("type 2 diabetes" vs
+        "T2DM") that resolve to the same disease share cached answers.
+        """
+        ontology_id = disease_context.efo_id or disease_context.mondo_id or disease_context.mesh_id
+        if ontology_id:
+            return ontology_id.strip().upper().replace(":", "_")
+        return " ".join(disease_context.corrected_name.casefold().split())
+    
+    @staticmethod
+    def _parse_json_reply(response_text: str, decode: Callable[[str], Any] = _decode_result) -> Any:
+        """Parse a JSON reply, falling back to regex extraction of the object."""
+        try:
+            return decode(response_text)
+        except _DECODE_ERRORS:
+            match = _JSON_RE.search(response_text)
+            if not match:
+                raise
+            return decode(match.group(1) or match.group(2))
+    
+    @staticmethod
+    def _disease_prompt_fields(disease_context: DiseaseContext, disease_side: Dict) -> Dict:
+        """Prompt fields shared by every target of one disease."""
+        return {
+            "disease_name": disease_context.corrected_name,
+            "disease_type": disease_side["disease_type"],
+            "disease_description": disease_context.description,
+            "disease_pathways": disease_side["pathways_str"]
+        }
+    
+    async def _fetch_target_data(self, target_symbol: str) -> Tuple[List[Dict], List[Dict]]:
+        """Fetch target pathways and top interaction partners concurrently."""
+        target_pathways, interactions = await asyncio.gather(
+            self.pathway_integrator.get_target_pathways(target_symbol),
+            self.ppi_integrator.get_protein_interactions(target_symbol, limit=PROMPT_MAX_INTERACTIONS)
+        )
+        return target_pathways, interactions
+    
+    def _prepare_target_side(
+        self,
+        target_symbol: str,
+        disease_context: DiseaseContext,
+        disease_side: Dict,
+        target_pathways: List[Dict],
+        interactions: List[Dict]
+    ) -> Dict:
+        """Pathway overlap, cache key, prompt fields and result metadata for one target."""
+        disease_pathway_set = disease_side["pathway_set"]
+        
+        # Calculate pathway overlap (Jaccard on hashed ID sets)
+        target_pathway_set = frozenset(filter(None, (p["pathway_id"] for p in target_pathways)))
+        overlap_ids = disease_pathway_set & target_pathway_set
+        union_size = len(disease_pathway_set) + len(target_pathway_set) - len(overlap_ids)
+        jaccard_similarity = len(overlap_ids) / union_size if union_size else 0
+        
+        # Format for LLM
+        target_pathways_str = "; ".join([
+            p['name'] for p in target_pathways[:5]
+        ]) or "none identified"
+        
+        target_interactions_str = "; ".join([
+            f"{i['partner']} ({i['score']:.2f})"
+            for i in interactions
+        ]) or "none found"
+        
+        overlap_pathways_str = "; ".join(
+            sorted(overlap_ids)[:10]
+        ) or "no shared pathways"
+        
+        return {
+            "cache_params": {
+                "prompt_version": MECHANISM_PROMPT_VERSION,
+                "target_symbol": target_symbol,
+                "disease": self._disease_cache_key(disease_context),
+                "disease_pathway_ids": sorted(disease_pathway_set),
+                "target_pathway_ids": sorted(target_pathway_set)
+            },
+            "prompt_fields": {
+                "target_symbol": target_symbol,
+                "target_pathways": target_pathways_str,
+                "target_interactions": target_interactions_str,
+                "overlap_pathways": overlap_pathways_str,
+                "overlap_score": jaccard_similarity
+            },
+            "metadata": {
+                "pathway_overlap_score": jaccard_similarity,
+                "num_disease_pathways": len(disease_side["pathways"]),
+                "num_target_pathways": len(target_pathways),
+                "num_interactions": len(interactions)
+            }
+        }
+    
+    @staticmethod
+    def _failed_result(error: Exception) -> Dict:
+        """Placeholder explanation returned when reasoning fails."""
+        return {
+            "mechanistic_fit": "UNKNOWN",
+            "confidence": 0.0,
+            "reasoning": {"error": str(error)},
+            "risks": [],
+            "synergies": [],
+            "limitations": ["Could not generate explanation"]
+        }
+    
+    async def explain_targets_batch(
+        self,
+        target_symbols: List[str],
+        disease_context: DiseaseContext,
+        concurrency: int = MECHANISM_BATCH_CONCURRENCY,
+        targets_per_call: int = 1
+    ) -> List[Dict]:
+        """
+        Explain many targets for one disease concurrently.
+        
+        Disease-side pathway data is fetched once and shared across targets.
+        With targets_per_call > 1 (capped at MAX_TARGETS_PER_CALL), targets are
+        packed into multi-target prompts so the disease section is sent once
+        per group instead of once per target.
+        Returns one explanation per target, in input order.
+        """
+        disease_side = await self._prepare_disease_side(disease_context)
+        semaphore = asyncio.Semaphore(concurrency)
+        targets_per_call = max(1, min(targets_per_call, MAX_TARGETS_PER_CALL))
+        
+        if targets_per_call > 1:
+            groups = [
+                target_symbols[i:i + targets_per_call]
+                for i in range(0, len(target_symbols), targets_per_call)
+            ]
+            
+            async def _explain_group(group: List[str]) -> List[Dict]:
+                async with semaphore:
+                    return await self._explain_target_group(group, disease_context, disease_side)
+            
+            group_results = await asyncio.gather(
+                *(_explain_group(group) for group in groups),
+                return_exceptions=True
+            )
+            results = []
+            for group, group_result in zip(groups, group_results):
+                if isinstance(group_result, Exception):
+                    results.extend([group_result] * len(group))
+                else:
+                    results.extend(group_result)
+        else:
+            async def _explain(target_symbol: str) -> Dict:
+                async with semaphore:
+                    return await self.explain_target_mechanism(
+                        target_symbol, disease_context, disease_side=disease_side
+                    )
+            
+            results = await asyncio.gather(
+                *(_explain(symbol) for symbol in target_symbols),
+                return_exceptions=True
+            )
+        
+        explanations = []
+        for symbol, result in zip(target_symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"❌ Mechanistic reasoning failed for {symbol}: {result}")
+                result = self._failed_result(result)
+            explanations.append(result)
+        return explanations
+    
+    async def _explain_target_group(
+        self,
+        target_symbols: List[str],
+        disease_context: DiseaseContext,
+        disease_side: Dict
+    ) -> List[Dict]:
+        """Explain several targets of one disease with a single multi-target LLM call."""
+        target_data = await asyncio.gather(
+            *(self._fetch_target_data(symbol) for symbol in target_symbols)
+        )
+        
+        explanations: Dict[str, Dict] = {}
+        pending = []
+        for symbol, (target_pathways, interactions) in zip(target_symbols, target_data):
+            target_side = self._prepare_target_side(
+                symbol, disease_context, disease_side, target_pathways, interactions
+            )
+            cached = cache_manager.get(
+                "mechanism_explanation", target_side["cache_params"],
+                max_age_seconds=MECHANISM_CACHE_TTL_SECONDS
+            )
+            if cached is not None:
+                explanations[symbol] = cached
+            elif symbol not in explanations:
+                explanations[symbol] = None
+                pending.append((symbol, target_side))
+        
+        if pending:
+            logger.info(f"🧬 Generating mechanistic explanations for {len(pending)} targets in one call")
+            prompt = self._render_mechanism_batch_prompt(
+                **self._disease_prompt_fields(disease_context, disease_side),
+                target_sections="\n".join(
+                    self._render_target_section(**target_side["prompt_fields"])
+                    for _, target_side in pending
+                )
+            )
+            response = await llm.generate(prompt, json_mode=True)
+            try:
+                replies = self._parse_json_reply(response.text.strip(), decode=_decode_batch_result)
+            except _DECODE_ERRORS as e:
+                logger.warning(f"⚠️ Invalid multi-target JSON ({e}); explaining targets individually")
+                replies = []
+            by_target = {reply.pop("target", None): reply for reply in replies}
+            
+            for symbol, target_side in pending:
+                result = by_target.get(symbol)
+                if result is None:
+                    # Model skipped or mangled this target: fall back to a single-target call
+                    explanations[symbol] = await self.explain_target_mechanism(
+                        symbol, disease_context, disease_side=disease_side
+                    )
+                    continue
+                result.update(target_side["metadata"])
+                cache_manager.set("mechanism_explanation", target_side["cache_params"], result)
+                explanations[symbol] = result
+        
+        return [explanations[symbol] for symbol in target_symbols]
     
     async def explain_target_mechanism(
         self,
         target_symbol: str,
-        disease_context: DiseaseContext
+        disease_context: DiseaseContext,
+        disease_side: Optional[Dict] = None,
+        on_chunk: Optional[Callable[[str], None]] = None
     ) -> Dict:
         """
         Generate comprehensive mechanistic explanation for a target.
         
+        disease_side: precomputed output of _prepare_disease_side (batch callers).
+        on_chunk: if given, the LLM reply is streamed and each text delta is
+            passed to it as it arrives (e.g. for progressive UI updates).
+        
         Returns:
         {
             "mechanistic_fit": "HIGH",
@@ -102,116 +457,80 @@ Be specific and cite molecular mechanisms. Focus on CAUSAL relationships, not ju
         """
         logger.info(f"🧬 Generating mechanistic explanation: {target_symbol} for {disease_context.corrected_name}")
         
-        # Gather pathway data
-        disease_pathways = await self.pathway_integrator.get_disease_pathways(
-            disease_context.corrected_name
-        )
-        
-        target_pathways = await self.pathway_integrator.get_target_pathways(
-            target_symbol
+        # Gather pathway and interaction data concurrently (independent fetches)
+        if disease_side is None:
+            disease_side, (target_pathways, interactions) = await asyncio.gather(
+                self._prepare_disease_side(disease_context),
+                self._fetch_target_data(target_symbol)
+            )
+        else:
+            target_pathways, interactions = await self._fetch_target_data(target_symbol)
+        target_side = self._prepare_target_side(
+            target_symbol, disease_context, disease_side, target_pathways, interactions
         )
         
-        # Calculate pathway overlap
-        disease_pathway_ids = [p["pathway_id"] for p in disease_pathways]
-        target_pathway_ids = [p["pathway_id"] for p in target_pathways]
-        
-        overlap = await self.pathway_integrator.find_pathway_overlap(
-            disease_pathway_ids,
-            target_pathway_ids
+        # Skip the LLM round-trip when this (target, disease, pathways) was explained before
+        cached = cache_manager.get(
+            "mechanism_explanation", target_side["cache_params"],
+            max_age_seconds=MECHANISM_CACHE_TTL_SECONDS
         )
-        
-        # Get protein interactions
-        interactions = await self.ppi_integrator.get_protein_interactions(target_symbol)
-        
-        # Format for LLM
-        disease_pathways_str = "\n".join([
-            f"  - {p['name']} ({p['source']})"
-            for p in disease_pathways[:5]
-        ]) or "No specific pathways identified"
-        
-        target_pathways_str = "\n".join([
-            f"  - {p['name']} ({p['source']})"
-            for p in target_pathways[:5]
-        ]) or "No specific pathways identified"
-        
-        target_interactions_str = "\n".join([
-            f"  - {i['partner']} (score: {i['score']:.2f})"
-            for i in interactions[:10]
-        ]) or "No interactions found"
-        
-        overlap_pathways_str = "\n".join([
-            f"  - {pid}"
-            for pid in overlap["overlap_pathways"]
-        ]) or "No pathway overlap"
-        
-        # Determine disease type
-        disease_type = disease_context.therapeutic_area
-        if disease_context.is_cancer:
-            disease_type = "Cancer"
-        elif disease_context.is_autoimmune:
-            disease_type = "Autoimmune"
-        elif disease_context.is_infectious:
-            disease_type = "Infectious"
+        if cached is not None:
+            return cached
         
         # Generate mechanistic explanation
-        prompt = self.MECHANISM_PROMPT.format(
-            disease_name=disease_context.corrected_name,
-            disease_type=disease_type,
-            disease_description=disease_context.description,
-            disease_pathways=disease_pathways_str,
-            target_symbol=target_symbol,
-            target_pathways=target_pathways_str,
-            target_interactions=target_interactions_str,
-            overlap_pathways=overlap_pathways_str,
-            overlap_score=overlap["jaccard_similarity"]
+        prompt = self._render_mechanism_prompt(
+            **self._disease_prompt_fields(disease_context, disease_side),
+            **target_side["prompt_fields"]
         )
         
         try:
-            response = await llm.generate(prompt)
-            response_text = response.text.strip()
+            # JSON mode: the reply is a bare JSON object, no markdown cleanup needed
+            result = None
+            if on_chunk is not None:
+                chunks = []
+                # aclosing: breaking out early must release the HTTP stream now, not at GC
+                async with aclosing(llm.generate_stream(prompt, json_mode=True)) as stream:
+                    async for delta in stream:
+                        chunks.append(delta)
+                        on_chunk(delta)
+                        # Only attempt a parse when the buffer could be complete;
+                        # stop reading as soon as the object closes
+                        tail = delta.rstrip()
+                        if tail and tail[-1] in "}]":
+                            try:
+                                result = _decode_result("".join(chunks))
+                                break
+                            except _DECODE_ERRORS:
+                                pass
+                response_text = "".join(chunks).strip()
+            else:
+                response = await llm.generate(prompt, json_mode=True)
+                response_text = response.text.strip()
             
-            # Clean JSON
-            if "```json" in response_text:
-                # Split on ```json and take the part after it
-                parts = response_text.split("```json")
-                if len(parts) > 1:
-                    # Now split on ending ```
-                    response_text = parts[1].split("```")[0].strip()
-
-            elif "```" in response_text:
-                # Handle generic code blocks ``` ... ```
-                parts = response_text.split("```")
-                if len(parts) >= 3:
-                    # The JSON is usually in parts[1]
-                    response_text = parts[1].strip()
-
-            # Method 2: Extract JSON object manually (first { to last })
-            if not response_text.startswith("{"):
-                start_idx = response_text.find("{")
-                end_idx = response_text.rfind("}")
-                if start_idx != -1 and end_idx != -1:
-                    response_text = response_text[start_idx:end_idx + 1]
-
-            
-            result = json.loads(response_text)
+            if result is None:
+                try:
+                    result = self._parse_json_reply(response_text)
+                except _DECODE_ERRORS as parse_error:
+                    # Malformed JSON is not transient: ask once for a corrected reply
+                    logger.warning(f"⚠️ Invalid JSON for {target_symbol} ({parse_error}); requesting correction")
+                    response = await llm.generate(
+                        [
+                            {"role": "user", "content": prompt},
+                            {"role": "assistant", "content": response_text},
+                            {"role": "user", "content": self.JSON_CORRECTION_PROMPT}
+                        ],
+                        json_mode=True
+                    )
+                    result = self._parse_json_reply(response.text.strip())
             
             # Add metadata
-            result["pathway_overlap_score"] = overlap["jaccard_similarity"]
-            result["num_disease_pathways"] = len(disease_pathways)
-            result["num_target_pathways"] = len(target_pathways)
-            result["num_interactions"] = len(interactions)
+            result.update(target_side["metadata"])
             
             logger.info(f"✅ Mechanistic fit: {result['mechanistic_fit']} (confidence: {result['confidence']:.2f})")
             
+            cache_manager.set("mechanism_explanation", target_side["cache_params"], result)
             return result
             
         except Exception as e:
             logger.error(f"❌ Mechanistic reasoning failed: {e}")
-            return {
-                "mechanistic_fit": "UNKNOWN",
-                "confidence": 0.0,
-                "reasoning": {"error": str(e)},
-                "risks": [],
-                "synergies": [],
-                "limitations": ["Could not generate explanation"]
-            }
+            return self._failed_result(e)
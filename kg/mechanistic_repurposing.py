@@ -21,16 +21,260 @@ Example output:
 import logging
 import httpx
 import asyncio
+import re
+import time
+import numpy as np
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, asdict
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from kg.pathway_integrator import PathwayIntegrator
+from kg.utils import HTTP2_AVAILABLE, json_loads
+from agents.base import cache_manager
 
 logger = logging.getLogger(__name__)
 
+OPENTARGETS_GRAPHQL_URL = "https://api.platform.opentargets.org/api/v4/graphql"
+TARGET_CONCURRENCY = 16  # Disease targets processed concurrently
+OPENTARGETS_MAX_QPS = 10  # Proactive pacing of GraphQL POSTs (requests per second)
+OPENTARGETS_MAX_RETRY_AFTER = 30.0  # Cap on server-requested back-off (seconds)
+TARGET_DRUGS_CACHE_TTL_SECONDS = 86400  # knownDrugs per target; symbol→Ensembl entries never expire
+TARGET_BATCH_SIZE = 15  # Targets per aliased multi-target GraphQL query
 
-@dataclass
+# Final ranking weights for (mechanistic_confidence, pathway_overlap, opentargets_score, phase / 4)
+_RANKING_WEIGHTS = np.array([0.35, 0.2, 0.35, 0.1])
+
+# knownDrugs selection shared by the single- and multi-target queries
+_TARGET_DRUGS_FIELDS = """
+            approvedSymbol
+            approvedName
+            knownDrugs(size: 10) {
+              rows {
+                drug {
+                  id
+                  name
+                  drugType
+                  maximumClinicalTrialPhase
+                  isApproved
+                }
+                disease {
+                  id
+                  name
+                }
+                mechanismOfAction
+                phase
+              }
+            }
+"""
+
+_DRUGS_QUERY = """
+query TargetDrugs($ensemblId: String!) {
+  target(ensemblId: $ensemblId) {%s}
+}
+""" % _TARGET_DRUGS_FIELDS
+
+_GENE_SEARCH_QUERY = """
+query GeneSearch($symbol: String!) {
+  search(queryString: $symbol, entityNames: ["target"]) {
+    hits {
+      id
+      entity
+      name
+    }
+  }
+}
+"""
+
+# Static halves of the POST bodies; only "variables" changes per request
+_DRUGS_QUERY_TEMPLATE = {"query": _DRUGS_QUERY}
+_GENE_SEARCH_TEMPLATE = {"query": _GENE_SEARCH_QUERY}
+
+
+@lru_cache(maxsize=None)
+def _batch_drugs_query(size: int) -> str:
+    """Aliased multi-target query: t0: target(ensemblId: $e0) {...} t1: ..."""
+    variable_defs = ", ".join(f"$e{i}: String!" for i in range(size))
+    aliases = "\n".join(
+        f"t{i}: target(ensemblId: $e{i}) {{{_TARGET_DRUGS_FIELDS}}}" for i in range(size)
+    )
+    return f"query TargetDrugsBatch({variable_defs}) {{\n{aliases}\n}}"
+
+
+# Indication keywords driving the safety rules (substring semantics: "immune"
+# also hits "autoimmune"; "cardiovascular" is listed ahead of "cardio")
+_SAFETY_RX = re.compile(r"cancer|tumor|cardiovascular|cardio|heart|diabetes|metabolic|immune|infection|sepsis")
+
+# Validation-plan templates, filled with {drug}, {target} and {disease}
+IN_VITRO_TEMPLATES = (
+    "Cell viability assay: Treat {disease}-relevant cell lines with {drug} at therapeutic concentrations",
+    "Mechanism validation: Measure {target} activity (Western blot, ELISA) after {drug} treatment",
+    "Functional assays: Assess cell proliferation, apoptosis, migration in disease models",
+    "Dose-response: Determine IC50 and optimal concentration range",
+)
+IN_VITRO_APPROVED_TEMPLATES = (
+    "Combination studies: Test {drug} synergy with standard-of-care {disease} treatments",
+)
+IN_VIVO_TEMPLATES = (
+    "Animal efficacy: Test {drug} in {disease} xenograft or syngeneic models",
+    "Pharmacodynamics: Measure {target} modulation in tumor/tissue biopsies",
+    "Dosing optimization: Determine optimal dose and schedule for {disease} indication",
+    "Survival benefit: Assess impact on disease progression and survival",
+)
+IN_VIVO_EARLY_PHASE_TEMPLATES = (
+    "Preclinical safety: Assess {drug} toxicity in relevant animal models before {disease} studies",
+    "Proof-of-concept: Single-arm efficacy study in {disease} animal model",
+)
+BIOMARKER_TEMPLATES = (
+    "Phospho-{target} (target engagement)",
+    "Downstream pathway markers (e.g., p-S6K, p-4EBP1 if mTOR pathway)",
+    "{disease} progression biomarkers (tumor markers, imaging)",
+    "Pharmacokinetic markers (drug levels in plasma/tissue)",
+)
+
+
+@lru_cache(maxsize=4096)
+def _validation_plan_cached(
+    drug_name: str,
+    target_symbol: str,
+    disease: str,
+    phase: int
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Pure core of _design_validation_experiments: (in_vitro, in_vivo, biomarkers)."""
+    ctx = {"drug": drug_name, "target": target_symbol, "disease": disease}
+    
+    in_vitro_templates = IN_VITRO_TEMPLATES
+    if phase >= 4:  # Approved drug
+        in_vitro_templates += IN_VITRO_APPROVED_TEMPLATES
+    
+    # Phase 2+ has safety data
+    in_vivo_templates = IN_VIVO_TEMPLATES if phase >= 2 else IN_VIVO_EARLY_PHASE_TEMPLATES
+    
+    return (
+        tuple(t.format_map(ctx) for t in in_vitro_templates),
+        tuple(t.format_map(ctx) for t in in_vivo_templates),
+        tuple(t.format_map(ctx) for t in BIOMARKER_TEMPLATES),
+    )
+
+
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+def _clean_pathway_names(shared_pathways: List[str]) -> Tuple[str, ...]:
+    """Display names for the first 5 shared pathways ("R-HSA-" dropped, "_" → " ")."""
+    return tuple(
+        p.replace("R-HSA-", "").translate(_UNDERSCORE_TO_SPACE) for p in shared_pathways[:5]
+    )
+
+
+@lru_cache(maxsize=4096)
+def _explain_link_cached(
+    drug_name: str,
+    target_symbol: str,
+    mechanism: str,
+    disease: str,
+    pathway_names: Tuple[str, ...],
+    shared_count: int,
+    pathway_overlap: float
+) -> str:
+    """Pure core of _explain_target_disease_link (pathway_names from _clean_pathway_names)."""
+    if pathway_overlap >= 0.3 and shared_count:
+        explanation = (
+            f"{drug_name} modulates {target_symbol} via {mechanism}. "
+            f"This target is implicated in {disease} through {shared_count} shared biological pathways, "
+            f"including: {', '.join(pathway_names[:2])}. "
+            f"The {pathway_overlap:.0%} pathway overlap suggests strong mechanistic relevance. "
+            f"Targeting {target_symbol} may disrupt disease-driving processes in {disease}."
+        )
+    else:
+        explanation = (
+            f"{drug_name} modulates {target_symbol} via {mechanism}. "
+            f"While pathway overlap is limited ({pathway_overlap:.0%}), "
+            f"{target_symbol} is associated with {disease} and may represent a novel therapeutic angle."
+        )
+    
+    return explanation
+
+
+class _PathwayBitsets:
+    """
+    Pathway sets as int bit-vectors for repeated Jaccard against one disease.
+    
+    Disease pathways take bits 0..n-1, so overlap bits decode straight back
+    to disease pathway IDs; target-only pathways get fresh bits as seen.
+    """
+
+    def __init__(self, disease_pathways: List[str]):
+        self._bit_of: Dict[str, int] = {}
+        self._ids: List[str] = []
+        self.disease_bits = self.encode(disease_pathways)
+
+    def encode(self, pathway_ids: List[str]) -> int:
+        bits = 0
+        for pathway_id in pathway_ids:
+            bit = self._bit_of.get(pathway_id)
+            if bit is None:
+                bit = self._bit_of[pathway_id] = len(self._ids)
+                self._ids.append(pathway_id)
+            bits |= 1 << bit
+        return bits
+
+    def overlap(self, target_pathways: List[str]) -> Tuple[float, List[str]]:
+        """Return (jaccard_similarity, overlap_pathways) against the disease set."""
+        target_bits = self.encode(target_pathways)
+        shared = self.disease_bits & target_bits
+        union = (self.disease_bits | target_bits).bit_count()
+        jaccard = shared.bit_count() / union if union else 0.0
+        
+        overlap_pathways = []
+        while shared:
+            low = shared & -shared
+            overlap_pathways.append(self._ids[low.bit_length() - 1])
+            shared ^= low
+        return jaccard, overlap_pathways
+
+
+class _AsyncRateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per `period` seconds.
+    
+    Used as `async with limiter:`; pause() blocks all callers, e.g. when the
+    server signals its rate limit is exhausted.
+    """
+    
+    def __init__(self, rate: int, period: float = 1.0):
+        self._rate = rate
+        self._period = period
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for `seconds` from now."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+    
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._tokens = min(
+                    self._rate, self._tokens + (now - self._updated) * self._rate / self._period
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self._period / self._rate)
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+@dataclass(slots=True)
 class RepurposingCandidate:
     """Structured repurposing candidate with mechanistic rationale."""
     # Drug identification
@@ -91,55 +335,171 @@ class MechanisticRepurposingEngine:
     def __init__(self):
         self.pathway_integrator = PathwayIntegrator()
         self._gene_cache = {}  # Cache gene symbol → Ensembl ID mapping
+        # Symbol lookups currently in flight, so concurrent callers share one query
+        self._gene_inflight: Dict[str, asyncio.Future] = {}
+        # Pooled OpenTargets client, created on first use and reused by every query
+        self._http: Optional[httpx.AsyncClient] = None
+        # Bounds concurrent per-target processing (HTTP fan-out)
+        self._target_sem = asyncio.Semaphore(TARGET_CONCURRENCY)
+        # Paces OpenTargets requests below the API limit instead of reacting to 429s
+        self._limiter = _AsyncRateLimiter(OPENTARGETS_MAX_QPS)
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled OpenTargets HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            )
+        return self._http
+
+    async def _post_graphql(self, body: Dict, timeout: Optional[float] = None) -> httpx.Response:
+        """POST to OpenTargets under the rate limiter, honouring Retry-After on 429."""
+        extra = {"timeout": timeout} if timeout is not None else {}
+        for attempt in range(3):
+            async with self._limiter:
+                response = await self._get_http().post(OPENTARGETS_GRAPHQL_URL, json=body, **extra)
+            
+            retry_after = self._retry_after_seconds(response)
+            if retry_after is not None:
+                self._limiter.pause(retry_after)
+            if response.status_code != 429 or attempt == 2:
+                return response
+        return response
+
+    @staticmethod
+    def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+        """Back-off the server asks for (429 or exhausted quota), if any."""
+        headers = response.headers
+        if response.status_code != 429 and headers.get("X-RateLimit-Remaining") != "0":
+            return None
+        try:
+            seconds = float(headers.get("Retry-After", 1.0))
+        except ValueError:
+            seconds = 1.0
+        return min(max(seconds, 0.0), OPENTARGETS_MAX_RETRY_AFTER)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients (call when the engine is no longer needed)."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        await self.pathway_integrator.aclose()
+
+    @staticmethod
+    def _target_ensembl(target: dict) -> Optional[str]:
+        """Ensembl ID of a disease target (both key spellings occur upstream)."""
+        return target.get("ensembl_id") or target.get("ensemblid")
 
     async def _process_single_target(
         self,
         idx: int,
+        total: int,
         target: dict,
         disease_name: str,
         disease_pathways: list,
         therapeutic_area: str,
-        min_phase: int
+        min_phase: int,
+        drugs_for_target: Optional[List[Dict]] = None,
+        pathway_bitsets: Optional[_PathwayBitsets] = None,
+        disease_terms: Optional[Tuple[str, frozenset]] = None
     ) -> list:
-        """Process a single target and return its drug candidates."""
+        """
+        Process a single target and return its drug candidates.
+        
+        Never raises (except on cancellation): a failed target is logged and
+        contributes no candidates, so callers can gather without return_exceptions.
+        """
+        try:
+            async with self._target_sem:
+                return await self._process_target_unbounded(
+                    idx, total, target, disease_name, disease_pathways, therapeutic_area, min_phase,
+                    drugs_for_target, pathway_bitsets, disease_terms
+                )
+        except Exception as e:
+            logger.warning("   Target %d failed: %r", idx, e)
+            return []
+
+    async def _process_target_unbounded(
+        self,
+        idx: int,
+        total: int,
+        target: dict,
+        disease_name: str,
+        disease_pathways: list,
+        therapeutic_area: str,
+        min_phase: int,
+        drugs_for_target: Optional[List[Dict]] = None,
+        pathway_bitsets: Optional[_PathwayBitsets] = None,
+        disease_terms: Optional[Tuple[str, frozenset]] = None
+    ) -> list:
+        """
+        Body of _process_single_target (caller holds the target semaphore).
+        
+        drugs_for_target: drugs prefetched by a batch query; fetched here if None.
+        pathway_bitsets: disease pathways pre-encoded for bitset Jaccard.
+        disease_terms: _disease_terms(disease_name), shared across targets.
+        """
         candidates = []
         
         target_symbol = target.get("symbol")
-        target_ensembl = target.get("ensembl_id") or target.get("ensemblid")
+        target_ensembl = self._target_ensembl(target)
         target_score = target.get("opentargets_score", 0.0)
         
-        logger.info(f"   [{idx}/30] Target: {target_symbol} (score: {target_score:.3f})")
+        logger.info("   [%d/%d] Target: %s (score: %.3f)", idx, total, target_symbol, target_score)
         
-        # Fetch pathway context for this target
-        target_pathways = await self.pathway_integrator.get_target_pathways(
-            gene_symbol=target_symbol
-        )
-        target_pathway_ids = [p["pathway_id"] for p in target_pathways]
-        
-        # Calculate pathway overlap with disease
-        pathway_overlap = await self.pathway_integrator.find_pathway_overlap(
-            disease_pathways=disease_pathways,
-            target_pathways=target_pathway_ids
-        )
+        # Query OpenTargets for drugs targeting this protein (unless prefetched);
+        # it only needs the Ensembl ID, so it runs while the pathway work below does
+        drug_task = None
+        if drugs_for_target is None:
+            drug_task = asyncio.create_task(self._fetch_drugs_for_target(
+                ensembl_id=target_ensembl,
+                min_phase=min_phase
+            ))
         
-        jaccard = pathway_overlap.get("jaccard_similarity", 0.0)
-        overlap_pathways = pathway_overlap.get("overlap_pathways", [])
+        try:
+            # Fetch pathway context for this target
+            target_pathways = await self.pathway_integrator.get_target_pathways(
+                gene_symbol=target_symbol
+            )
+            target_pathway_ids = [p["pathway_id"] for p in target_pathways]
+            
+            # Calculate pathway overlap with disease
+            if pathway_bitsets is not None:
+                jaccard, overlap_pathways = pathway_bitsets.overlap(target_pathway_ids)
+            else:
+                pathway_overlap = await self.pathway_integrator.find_pathway_overlap(
+                    disease_pathways=disease_pathways,
+                    target_pathways=target_pathway_ids
+                )
+                
+                jaccard = pathway_overlap.get("jaccard_similarity", 0.0)
+                overlap_pathways = pathway_overlap.get("overlap_pathways", [])
+        except BaseException:
+            if drug_task is not None:
+                drug_task.cancel()
+            raise
         
-        logger.info(f"      Pathway overlap: {jaccard:.2%} ({len(overlap_pathways)} shared pathways)")
+        logger.info("      Pathway overlap: %.2f%% (%d shared pathways)", jaccard * 100, len(overlap_pathways))
+        # Display names are the same for every drug of this target
+        pathway_names = _clean_pathway_names(overlap_pathways)
         
-        # Query OpenTargets for drugs targeting this protein
-        drugs_for_target = await self._fetch_drugs_for_target(
-            ensembl_id=target_ensembl,
-            min_phase=min_phase
-        )
+        if drug_task is not None:
+            drugs_for_target = await drug_task
         
-        logger.info(f"      Found {len(drugs_for_target)} drugs targeting {target_symbol}")
+        logger.info("      Found %d drugs targeting %s", len(drugs_for_target), target_symbol)
         
         # STEP 2: Filter and classify drugs
-        for drug in drugs_for_target:
+        if disease_terms is None:
+            disease_terms = self._disease_terms(disease_name)
+        already_treats = self._drugs_treat_disease_mask(drugs_for_target, disease_terms)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for drug, treats in zip(drugs_for_target, already_treats):
             # ❌ Skip if drug already treats query disease
-            if self._drug_treats_disease(drug["indication"], disease_name):
-                logger.debug(f"      ❌ {drug['name']}: Already treats {disease_name}")
+            if treats:
+                if debug_enabled:
+                    logger.debug("      ❌ %s: Already treats %s", drug["name"], disease_name)
                 continue
             
             # ✅ This is a repurposing candidate!
@@ -160,15 +520,16 @@ class MechanisticRepurposingEngine:
                     disease_pathways=disease_pathways,
                     shared_pathways=overlap_pathways,
                     pathway_overlap_score=jaccard,
-                    therapeutic_area=therapeutic_area
+                    therapeutic_area=therapeutic_area,
+                    pathway_names=pathway_names
                 )
                 
                 if candidate:
                     candidates.append(candidate)
-                    logger.info(f"         Confidence: {candidate.mechanistic_confidence:.1%}")
+                    logger.info("         Confidence: %.1f%%", candidate.mechanistic_confidence * 100)
             
             except Exception as e:
-                logger.warning(f"      Failed to build candidate for {drug['name']}: {e}")
+                logger.warning("      Failed to build candidate for %s: %s", drug["name"], e)
                 continue
         
         return candidates
@@ -181,7 +542,8 @@ class MechanisticRepurposingEngine:
         disease_pathways: List[str],
         therapeutic_area: Optional[str] = None,
         min_phase: int = 1,
-        top_n: int = 50
+        top_n: int = 50,
+        max_targets: int = 30
     ) -> List[RepurposingCandidate]:
         """
         Find repurposing candidates using mechanism-first approach.
@@ -194,58 +556,82 @@ class MechanisticRepurposingEngine:
             therapeutic_area: Therapeutic area (for safety assessment)
             min_phase: Minimum clinical phase (default: Phase 1)
             top_n: Maximum candidates to return
+            max_targets: Maximum disease targets to analyze (processed concurrently)
             
         Returns:
             List of mechanistic repurposing candidates with full rationale
         """
-        logger.info(f"🔬 MECHANISTIC REPURPOSING for {disease_name}")
-        logger.info(f"   Disease ID: {disease_id}")
-        logger.info(f"   Analyzing {len(disease_targets)} disease targets")
-        logger.info(f"   Analyzing {len(disease_pathways)} disease pathways")
-        logger.info(f"   Minimum phase: {min_phase}")
+        logger.info("🔬 MECHANISTIC REPURPOSING for %s", disease_name)
+        logger.info("   Disease ID: %s", disease_id)
+        logger.info("   Analyzing %d disease targets", len(disease_targets))
+        logger.info("   Analyzing %d disease pathways", len(disease_pathways))
+        logger.info("   Minimum phase: %s", min_phase)
            
         
+        selected_targets = disease_targets[:max_targets]
+        
+        # Prefetch drugs with one aliased GraphQL query per TARGET_BATCH_SIZE targets
+        ensembl_ids = [self._target_ensembl(target) for target in selected_targets]
+        batch_results = await asyncio.gather(*(
+            self._fetch_drugs_for_targets(ensembl_ids[i:i + TARGET_BATCH_SIZE], min_phase)
+            for i in range(0, len(ensembl_ids), TARGET_BATCH_SIZE)
+        ))
+        prefetched_drugs: Dict[str, List[Dict]] = {}
+        for batch_result in batch_results:
+            prefetched_drugs.update(batch_result)
+        
+        # Encode disease pathways once; each target's Jaccard is then popcounts
+        pathway_bitsets = _PathwayBitsets(disease_pathways)
+        # Disease name tokens are invariant across every drug of every target
+        disease_terms = self._disease_terms(disease_name)
+        
         tasks = [
             self._process_single_target(
                 idx=idx,
+                total=len(selected_targets),
                 target=target,
                 disease_name=disease_name,
                 disease_pathways=disease_pathways,
                 therapeutic_area=therapeutic_area,
-                min_phase=min_phase
+                min_phase=min_phase,
+                drugs_for_target=prefetched_drugs.get(ensembl_ids[idx - 1]),
+                pathway_bitsets=pathway_bitsets,
+                disease_terms=disease_terms
             )
-            for idx, target in enumerate(disease_targets[:5], 1)
+            for idx, target in enumerate(selected_targets, 1)
         ]
         
         # STEP 1: For each disease target, find ALL drugs (regardless of indication)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # (failures are logged per target and come back as empty lists)
+        results = await asyncio.gather(*tasks)
 
-        # Flatten results and handle exceptions
-        candidates = []
-        for idx, result in enumerate(results, 1):
-            if isinstance(result, BaseException):
-                logger.warning(f"   Target {idx} failed: {repr(result)}")
-                continue
-            
-            # CHECK 2: Ensure it is actually a list before extending
-            if isinstance(result, list):
-                candidates.extend(result)
-            else:
-                logger.warning(f"   Target {idx} returned unexpected type: {type(result)}")
-
-        # STEP 4: Rank and filter
-        candidates.sort(key=lambda c: (
-            c.mechanistic_confidence * 0.35 +
-            c.pathway_overlap_score * 0.2 +
-            c.opentargets_score * 0.35 +
-            (c.phase / 4.0) * 0.1
-        ), reverse=True)
+        # Flatten results
+        candidates = [candidate for result in results for candidate in result]
 
-        top_candidates = candidates[:top_n]
+        # STEP 4: Rank and filter (one matrix-vector product; partial top-N selection)
+        top_candidates = []
+        k = min(top_n, len(candidates))
+        if k > 0:
+            features = np.fromiter(
+                (
+                    value
+                    for c in candidates
+                    for value in (c.mechanistic_confidence, c.pathway_overlap_score,
+                                  c.opentargets_score, c.phase / 4.0)
+                ),
+                dtype=np.float64,
+                count=4 * len(candidates)
+            ).reshape(-1, 4)
+            scores = features @ _RANKING_WEIGHTS
+            
+            top_idx = np.argpartition(-scores, k - 1)[:k]
+            # Highest score first; equal scores within the top-N keep discovery order
+            top_idx = top_idx[np.lexsort((top_idx, -scores[top_idx]))]
+            top_candidates = [candidates[i] for i in top_idx]
 
-        logger.info(f"✅ MECHANISTIC REPURPOSING COMPLETE")
-        logger.info(f"   Found {len(candidates)} total candidates")
-        logger.info(f"   Returning top {len(top_candidates)} candidates")
+        logger.info("✅ MECHANISTIC REPURPOSING COMPLETE")
+        logger.info("   Found %d total candidates", len(candidates))
+        logger.info("   Returning top %d candidates", len(top_candidates))
 
         return top_candidates
     
@@ -261,119 +647,190 @@ class MechanisticRepurposingEngine:
         This is the key difference from discovery: we want drugs for ANY disease,
         then we'll filter OUT the ones already treating our query disease.
         """
-        query = """
-        query TargetDrugs($ensemblId: String!) {
-          target(ensemblId: $ensemblId) {
-            approvedSymbol
-            approvedName
-            knownDrugs(size: 10) {
-              rows {
-                drug {
-                  id
-                  name
-                  drugType
-                  maximumClinicalTrialPhase
-                  isApproved
-                }
-                disease {
-                  id
-                  name
-                }
-                mechanismOfAction
-                phase
-              }
-            }
-          }
-        }
-        """
-        
         if not min_phase:
             min_phase = 1
         
+        cache_params = {"ensembl_id": ensembl_id, "min_phase": min_phase}
+        cached = cache_manager.get(
+            "repurposing_target_drugs", cache_params, max_age_seconds=TARGET_DRUGS_CACHE_TTL_SECONDS
+        )
+        if cached is not None:
+            return cached["drugs"]
+        
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    "https://api.platform.opentargets.org/api/v4/graphql",
-                    json={"query": query, "variables": {"ensemblId": ensembl_id}}
-                )
-                
-                if response.status_code != 200:
-                    logger.warning(f"OpenTargets API returned {response.status_code}")
-                    return []
-                
-                data = response.json()
-                target_data = data.get("data", {}).get("target", {})
-                
-                if not target_data:
-                    return []
-                
-                rows = target_data.get("knownDrugs", {}).get("rows", [])
-                
-                drugs = []
-                for row in rows:
-                    drug_data = row.get("drug", {})
-                    disease_data = row.get("disease", {})
-                    
-                    # Normalize phase
-                    raw_phase = drug_data.get("maximumClinicalTrialPhase")
-                    row_phase = row.get("phase")
-                    
-                    phase = self._normalize_phase(raw_phase)
-                    row_phase_norm = self._normalize_phase(row_phase)
-                    phase = max(phase, row_phase_norm)
-                    
-                    if not isinstance(phase, int):
-                        phase = 0
-                    
-                    # Phase filter
-                    if phase < min_phase:
-                        continue
-                    
-                    drugs.append({
-                        "id": drug_data.get("id"),
-                        "name": drug_data.get("name", "Unknown"),
-                        "drug_type": drug_data.get("drugType", "Unknown"),
-                        "phase": phase,
-                        "approved": drug_data.get("isApproved", False),
-                        "indication": disease_data.get("name", "Unknown indication"),
-                        "indication_id": disease_data.get("id", ""),
-                        "mechanism": row.get("mechanismOfAction", "Unknown mechanism")
-                    })
-                
-                return drugs
+            response = await self._post_graphql(
+                {**_DRUGS_QUERY_TEMPLATE, "variables": {"ensemblId": ensembl_id}}
+            )
+            
+            if response.status_code != 200:
+                logger.warning("OpenTargets API returned %s", response.status_code)
+                return []
+            
+            data = json_loads(response.content)
+            target_data = data.get("data", {}).get("target", {})
+            
+            if not target_data:
+                return []
+            
+            rows = target_data.get("knownDrugs", {}).get("rows", [])
+            drugs = self._parse_drug_rows(rows, min_phase)
+            
+            cache_manager.set("repurposing_target_drugs", cache_params, {"drugs": drugs})
+            return drugs
         
         except Exception as e:
-            logger.error(f"Failed to fetch drugs for {ensembl_id}: {e}")
+            logger.error("Failed to fetch drugs for %s: %s", ensembl_id, e)
             return []
     
-    def _drug_treats_disease(self, indication: str, query_disease: str) -> bool:
+    def _parse_drug_rows(self, rows: List[Dict], min_phase: int) -> List[Dict]:
+        """Normalize knownDrugs rows into drug dicts, keeping phase >= min_phase."""
+        drugs = []
+        for row in rows:
+            drug_data = row.get("drug", {})
+            disease_data = row.get("disease", {})
+
+            # Normalize phase
+            raw_phase = drug_data.get("maximumClinicalTrialPhase")
+            row_phase = row.get("phase")
+
+            phase = self._normalize_phase(raw_phase)
+            row_phase_norm = self._normalize_phase(row_phase)
+            phase = max(phase, row_phase_norm)
+
+            if not isinstance(phase, int):
+                phase = 0
+
+            # Phase filter
+            if phase < min_phase:
+                continue
+
+            drugs.append({
+                "id": drug_data.get("id"),
+                "name": drug_data.get("name", "Unknown"),
+                "drug_type": drug_data.get("drugType", "Unknown"),
+                "phase": phase,
+                "approved": drug_data.get("isApproved", False),
+                "indication": disease_data.get("name", "Unknown indication"),
+                "indication_id": disease_data.get("id", ""),
+                "mechanism": row.get("mechanismOfAction", "Unknown mechanism")
+            })
+        
+        return drugs
+    
+    async def _fetch_drugs_for_targets(
+        self,
+        ensembl_ids: List[str],
+        min_phase: int
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch drugs for several targets with one aliased GraphQL query.
+        
+        Returns {ensembl_id: drugs} for every target answered (cached or fetched);
+        targets missing from the result should fall back to _fetch_drugs_for_target.
+        """
+        if not min_phase:
+            min_phase = 1
+        
+        results: Dict[str, List[Dict]] = {}
+        pending = []
+        for ensembl_id in dict.fromkeys(filter(None, ensembl_ids)):
+            cached = cache_manager.get(
+                "repurposing_target_drugs",
+                {"ensembl_id": ensembl_id, "min_phase": min_phase},
+                max_age_seconds=TARGET_DRUGS_CACHE_TTL_SECONDS
+            )
+            if cached is not None:
+                results[ensembl_id] = cached["drugs"]
+            else:
+                pending.append(ensembl_id)
+        
+        if not pending:
+            return results
+        
+        # One aliased query for every pending target; text is built once per batch size
+        query = _batch_drugs_query(len(pending))
+        variables = {f"e{i}": ensembl_id for i, ensembl_id in enumerate(pending)}
+        
+        try:
+            response = await self._post_graphql({"query": query, "variables": variables})
+            if response.status_code != 200:
+                logger.warning("OpenTargets batch query returned %s", response.status_code)
+                return results
+            
+            data = json_loads(response.content).get("data") or {}
+        except Exception as e:
+            logger.warning("OpenTargets batch query failed for %d targets: %s", len(pending), e)
+            return results
+        
+        for i, ensembl_id in enumerate(pending):
+            target_data = data.get(f"t{i}")
+            if target_data is None:
+                continue  # Unknown/errored target: leave it to the single-target path
+            rows = (target_data.get("knownDrugs") or {}).get("rows") or []
+            drugs = self._parse_drug_rows(rows, min_phase)
+            cache_manager.set(
+                "repurposing_target_drugs",
+                {"ensembl_id": ensembl_id, "min_phase": min_phase},
+                {"drugs": drugs}
+            )
+            results[ensembl_id] = drugs
+        
+        return results
+    
+    @staticmethod
+    def _disease_terms(query_disease: str) -> Tuple[str, frozenset]:
+        """Lowercased disease name and its key words (len > 3), built once per run."""
+        disease_lower = query_disease.lower()
+        return disease_lower, frozenset(w for w in disease_lower.split() if len(w) > 3)
+    
+    def _drug_treats_disease(self, indication: str, disease_lower: str, disease_words: frozenset) -> bool:
         """
         Check if drug already treats the query disease (strict matching).
         
         Returns True only if there's strong evidence the drug is already
         used for this disease (not a repurposing candidate).
+        disease_lower/disease_words come from _disease_terms.
         """
         if not indication or indication in ["Unknown indication", "Unknown", ""]:
             return False  # No indication = potential repurposing
         
         indication_lower = indication.lower()
-        disease_lower = query_disease.lower()
         
         # Exact substring match
         if disease_lower in indication_lower:
             return True
         
         # Check for significant word overlap (at least 2 key words)
-        disease_words = set(w for w in disease_lower.split() if len(w) > 3)
-        indication_words = set(w for w in indication_lower.split() if len(w) > 3)
+        if len(disease_words) < 2:
+            return False
         
-        overlap = disease_words.intersection(indication_words)
-        
-        if len(overlap) >= 2:
-            return True
+        overlap_count = 0
+        for w in set(indication_lower.split()):
+            if w in disease_words:  # disease_words only holds len > 3 words
+                overlap_count += 1
+                if overlap_count >= 2:
+                    return True
         
         return False
     
+    def _drugs_treat_disease_mask(
+        self,
+        drugs: List[Dict],
+        disease_terms: Tuple[str, frozenset]
+    ) -> List[bool]:
+        """
+        Batch form of _drug_treats_disease over one target's drug list.
+        
+        Each distinct indication is checked once (many rows share the same
+        indication); disease_terms comes from _disease_terms.
+        """
+        verdicts = {
+            indication: self._drug_treats_disease(indication, *disease_terms)
+            for indication in {drug["indication"] for drug in drugs}
+        }
+        
+        return [verdicts[drug["indication"]] for drug in drugs]
+    
     async def _build_mechanistic_candidate(
         self,
         drug: Dict,
@@ -385,7 +842,8 @@ class MechanisticRepurposingEngine:
         disease_pathways: List[str],
         shared_pathways: List[str],
         pathway_overlap_score: float,
-        therapeutic_area: Optional[str]
+        therapeutic_area: Optional[str],
+        pathway_names: Optional[Tuple[str, ...]] = None
     ) -> Optional[RepurposingCandidate]:
         """
         Build mechanistic repurposing candidate with full rationale.
@@ -405,7 +863,8 @@ class MechanisticRepurposingEngine:
             mechanism=mechanism,
             disease=proposed_disease,
             shared_pathways=shared_pathways,
-            pathway_overlap=pathway_overlap_score
+            pathway_overlap=pathway_overlap_score,
+            pathway_names=pathway_names
         )
         
         # STEP 2: Design experimental validation
@@ -492,7 +951,8 @@ class MechanisticRepurposingEngine:
         mechanism: str,
         disease: str,
         shared_pathways: List[str],
-        pathway_overlap: float
+        pathway_overlap: float,
+        pathway_names: Optional[Tuple[str, ...]] = None
     ) -> Dict:
         """
         Generate mechanistic explanation linking drug → target → disease.
@@ -501,27 +961,27 @@ class MechanisticRepurposingEngine:
         "Metformin activates AMPK, which inhibits mTOR signaling. This pathway
         is dysregulated in cancer, where mTOR drives tumor growth. By activating
         AMPK, metformin may suppress cancer cell proliferation."
+        
+        Text is memoized on the inputs it depends on (drugs sharing a target
+        and mechanism recur across a run); the returned dict is always fresh.
+        pathway_names may be passed in when already cleaned once per target.
         """
-        if pathway_overlap >= 0.3 and shared_pathways:
-            pathway_names = [p.replace("R-HSA-", "").replace("_", " ") for p in shared_pathways[:3]]
-            
-            explanation = (
-                f"{drug_name} modulates {target_symbol} via {mechanism}. "
-                f"This target is implicated in {disease} through {len(shared_pathways)} shared biological pathways, "
-                f"including: {', '.join(pathway_names[:2])}. "
-                f"The {pathway_overlap:.0%} pathway overlap suggests strong mechanistic relevance. "
-                f"Targeting {target_symbol} may disrupt disease-driving processes in {disease}."
-            )
-        else:
-            explanation = (
-                f"{drug_name} modulates {target_symbol} via {mechanism}. "
-                f"While pathway overlap is limited ({pathway_overlap:.0%}), "
-                f"{target_symbol} is associated with {disease} and may represent a novel therapeutic angle."
-            )
+        if pathway_names is None:
+            pathway_names = _clean_pathway_names(shared_pathways)
+        
+        explanation = _explain_link_cached(
+            drug_name,
+            target_symbol,
+            mechanism,
+            disease,
+            pathway_names,
+            len(shared_pathways),
+            pathway_overlap
+        )
         
         return {
             "explanation": explanation,
-            "pathway_names": [p.replace("R-HSA-", "").replace("_", " ") for p in shared_pathways[:5]],
+            "pathway_names": list(pathway_names),
             "confidence": min(pathway_overlap * 1.5, 1.0)
         }
     
@@ -540,47 +1000,14 @@ class MechanisticRepurposingEngine:
         - In vivo experiments
         - Biomarkers to measure
         """
-        # In vitro experiments
-        in_vitro = [
-            f"Cell viability assay: Treat {disease}-relevant cell lines with {drug_name} at therapeutic concentrations",
-            f"Mechanism validation: Measure {target_symbol} activity (Western blot, ELISA) after {drug_name} treatment",
-            f"Functional assays: Assess cell proliferation, apoptosis, migration in disease models",
-            f"Dose-response: Determine IC50 and optimal concentration range"
-        ]
-        
-        if phase >= 4:  # Approved drug
-            in_vitro.append(
-                f"Combination studies: Test {drug_name} synergy with standard-of-care {disease} treatments"
-            )
-        
-        # In vivo experiments
-        in_vivo = []
-        
-        if phase >= 2:  # Has safety data
-            in_vivo = [
-                f"Animal efficacy: Test {drug_name} in {disease} xenograft or syngeneic models",
-                f"Pharmacodynamics: Measure {target_symbol} modulation in tumor/tissue biopsies",
-                f"Dosing optimization: Determine optimal dose and schedule for {disease} indication",
-                f"Survival benefit: Assess impact on disease progression and survival"
-            ]
-        else:
-            in_vivo = [
-                f"Preclinical safety: Assess {drug_name} toxicity in relevant animal models before {disease} studies",
-                f"Proof-of-concept: Single-arm efficacy study in {disease} animal model"
-            ]
-        
-        # Biomarkers
-        biomarkers = [
-            f"Phospho-{target_symbol} (target engagement)",
-            f"Downstream pathway markers (e.g., p-S6K, p-4EBP1 if mTOR pathway)",
-            f"{disease} progression biomarkers (tumor markers, imaging)",
-            "Pharmacokinetic markers (drug levels in plasma/tissue)"
-        ]
+        in_vitro, in_vivo, biomarkers = _validation_plan_cached(
+            drug_name, target_symbol, disease, phase
+        )
         
         return {
-            "in_vitro": in_vitro,
-            "in_vivo": in_vivo,
-            "biomarkers": biomarkers
+            "in_vitro": list(in_vitro),
+            "in_vivo": list(in_vivo),
+            "biomarkers": list(biomarkers)
         }
     
     def _assess_repurposing_safety(
@@ -614,25 +1041,25 @@ class MechanisticRepurposingEngine:
                 f"Approved drug with known PK profile - dose may need adjustment for {proposed_indication}"
             )
         
-        # Therapeutic area considerations
-        original_lower = original_indication.lower()
-        proposed_lower = proposed_indication.lower()
+        # Therapeutic area considerations (one regex scan per indication)
+        orig_tags = frozenset(_SAFETY_RX.findall(original_indication.lower()))
+        prop_tags = frozenset(_SAFETY_RX.findall(proposed_indication.lower()))
         
         # Cancer repurposing
-        if "cancer" in proposed_lower or "tumor" in proposed_lower:
-            if "diabetes" in original_lower or "metabolic" in original_lower:
+        if {"cancer", "tumor"} & prop_tags:
+            if {"diabetes", "metabolic"} & orig_tags:
                 concerns.append("Monitor for metabolic disturbances in cancer patients")
-            if "cardiovascular" in original_lower or "heart" in original_lower:
+            if {"cardiovascular", "heart"} & orig_tags:
                 concerns.append("Monitor for cardiotoxicity (may be additive with chemotherapy)")
         
         # Cardiovascular repurposing
-        if "cardio" in proposed_lower or "heart" in proposed_lower:
-            if "cancer" in original_lower:
+        if {"cardio", "cardiovascular", "heart"} & prop_tags:
+            if "cancer" in orig_tags:
                 contraindications.append("Many cancer drugs are cardiotoxic - careful monitoring required")
         
-        # Immunology considerations
-        if "immune" in original_lower or "autoimmune" in original_lower:
-            if "infection" in proposed_lower or "sepsis" in proposed_lower:
+        # Immunology considerations (autoimmune is tagged "immune")
+        if "immune" in orig_tags:
+            if {"infection", "sepsis"} & prop_tags:
                 contraindications.append("Immunosuppression contraindicated in infectious diseases")
         
         # Biologics require special consideration
@@ -741,42 +1168,56 @@ class MechanisticRepurposingEngine:
         """
         Convert gene symbol to Ensembl ID.
         
-        Uses cache to avoid repeated queries.
+        Uses cache to avoid repeated queries; concurrent calls for the same
+        symbol await the lookup already in flight instead of issuing another.
         """
         if symbol in self._gene_cache:
             return self._gene_cache[symbol]
         
-        # Query OpenTargets for gene info
-        query = """
-        query GeneSearch($symbol: String!) {
-          search(queryString: $symbol, entityNames: ["target"]) {
-            hits {
-              id
-              entity
-              name
-            }
-          }
-        }
-        """
+        inflight = self._gene_inflight.get(symbol)
+        if inflight is not None:
+            # shield: a cancelled waiter must not cancel the shared lookup
+            return await asyncio.shield(inflight)
         
+        future = asyncio.get_running_loop().create_future()
+        self._gene_inflight[symbol] = future
+        ensembl_id = None
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    "https://api.platform.opentargets.org/api/v4/graphql",
-                    json={"query": query, "variables": {"symbol": symbol}}
-                )
+            ensembl_id = await self._lookup_ensembl(symbol)
+        finally:
+            del self._gene_inflight[symbol]
+            future.set_result(ensembl_id)
+        
+        return ensembl_id
+    
+    async def _lookup_ensembl(self, symbol: str) -> Optional[str]:
+        """Resolve a symbol via the file cache, then OpenTargets search."""
+        cached = cache_manager.get("repurposing_symbol_to_ensembl", {"symbol": symbol})
+        if cached is not None:
+            self._gene_cache[symbol] = cached["ensembl_id"]
+            return cached["ensembl_id"]
+        
+        # Query OpenTargets for gene info
+        try:
+            response = await self._post_graphql(
+                {**_GENE_SEARCH_TEMPLATE, "variables": {"symbol": symbol}},
+                timeout=10.0
+            )
+            
+            if response.status_code == 200:
+                data = json_loads(response.content)
+                hits = data.get("data", {}).get("search", {}).get("hits", [])
                 
-                if response.status_code == 200:
-                    data = response.json()
-                    hits = data.get("data", {}).get("search", {}).get("hits", [])
-                    
-                    for hit in hits:
-                        if hit.get("entity") == "target":
-                            ensembl_id = hit.get("id")
-                            self._gene_cache[symbol] = ensembl_id
-                            return ensembl_id
+                for hit in hits:
+                    if hit.get("entity") == "target":
+                        ensembl_id = hit.get("id")
+                        self._gene_cache[symbol] = ensembl_id
+                        cache_manager.set(
+                            "repurposing_symbol_to_ensembl", {"symbol": symbol}, {"ensembl_id": ensembl_id}
+                        )
+                        return ensembl_id
         
         except Exception as e:
-            logger.debug(f"Failed to resolve {symbol} to Ensembl ID: {e}")
+            logger.debug("Failed to resolve %s to Ensembl ID: %s", symbol, e)
         
         return None
@@ -6,16 +6,21 @@ Prevents recommending drugs with OPPOSITE mechanism (e.g., agonist instead of an
 """
 
 import httpx
+import asyncio
 import logging
-from typing import Optional, Dict, List
+import re
+from typing import Optional, Dict, List, Tuple
 from enum import Enum
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 import google.generativeai as genai
-import os
 
-logger = logging.getLogger(__name__)
+from agents.base import cache_manager
+from backend.app.config import get_settings
+from kg.utils import HTTP2_AVAILABLE, json_loads
 
-genai.configure(api_key="")
+logger = logging.getLogger(__name__)
 
 
 class MOAType(str, Enum):
@@ -28,6 +33,20 @@ class MOAType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# MOA keywords in priority order: when a text matches several, the earliest group wins
+_MOA_KEYWORDS = (
+    (MOAType.INHIBITOR, ("inhibitor", "inhibits", "inhibition")),
+    (MOAType.ANTAGONIST, ("antagonist", "antagonizes")),
+    (MOAType.AGONIST, ("agonist", "activates")),
+    (MOAType.BLOCKER, ("blocker", "blocks", "blocking")),
+    (MOAType.MODULATOR, ("modulator",)),
+)
+_MOA_BY_KEYWORD = {word: moa for moa, words in _MOA_KEYWORDS for word in words}
+_MOA_PRIORITY = {moa: rank for rank, (moa, _) in enumerate(_MOA_KEYWORDS)}
+# One alternation scanned in a single pass; longer keywords first so "antagonist" beats "agonist"
+_MOA_RX = re.compile("|".join(sorted(map(re.escape, _MOA_BY_KEYWORD), key=len, reverse=True)))
+
+
 class PathologyType(str, Enum):
     OVERACTIVE = "overactive"      # Need suppression/inhibition
     UNDERACTIVE = "underactive"    # Need activation
@@ -35,6 +54,11 @@ class PathologyType(str, Enum):
     UNKNOWN = "unknown"
 
 
+_PATH_MAP = {pathology.value: pathology for pathology in PathologyType}
+# First whole-word label in Gemini's answer ("underactive" never matches as "overactive")
+_PATH_RX = re.compile(r"\b(" + "|".join(_PATH_MAP) + r")\b")
+
+
 @dataclass
 class MOAValidationResult:
     is_appropriate: bool
@@ -45,6 +69,42 @@ class MOAValidationResult:
     recommendation: str
 
 
+# (pathology, drug MOA) → (is_appropriate, confidence, reasoning template, recommendation)
+_KEEP = "KEEP - MOA matches disease pathology"
+_REJECT = "REJECT - Opposite MOA (would worsen disease)"
+_DECISION_TABLE = {
+    **{
+        (PathologyType.OVERACTIVE, moa): (
+            True, 0.9, "{moa} is appropriate for overactive {target_symbol} in {disease_name}", _KEEP
+        )
+        for moa in (MOAType.INHIBITOR, MOAType.ANTAGONIST, MOAType.BLOCKER)
+    },
+    **{
+        (PathologyType.OVERACTIVE, moa): (
+            False, 0.9, "{moa} would WORSEN disease (activates already overactive {target_symbol})", _REJECT
+        )
+        for moa in (MOAType.AGONIST, MOAType.ACTIVATOR)
+    },
+    **{
+        (PathologyType.UNDERACTIVE, moa): (
+            True, 0.9, "{moa} is appropriate for underactive {target_symbol} in {disease_name}", _KEEP
+        )
+        for moa in (MOAType.AGONIST, MOAType.ACTIVATOR)
+    },
+    **{
+        (PathologyType.UNDERACTIVE, moa): (
+            False, 0.9, "{moa} would WORSEN disease (inhibits already underactive {target_symbol})", _REJECT
+        )
+        for moa in (MOAType.INHIBITOR, MOAType.ANTAGONIST, MOAType.BLOCKER)
+    },
+}
+# MODULATOR, UNKNOWN and dysregulated/unknown pathology: accept with lower confidence
+_UNCERTAIN_DECISION = (
+    True, 0.5, "MOA ({moa}) appropriateness uncertain for {pathology} {target_symbol}",
+    "UNCERTAIN - Accept with caution"
+)
+
+
 class MOAValidator:
     """
     Validates if drug MOA matches disease pathology.
@@ -58,10 +118,78 @@ class MOAValidator:
     """
     
     CHEMBL_API = "https://www.ebi.ac.uk/chembl/api/data"
+    MOA_BATCH_SIZE = 50          # Molecule IDs per molecule_chembl_id__in request
+    MOA_BATCH_WINDOW = 0.01      # Seconds single lookups wait to be coalesced into one batch
+    MECHANISM_PAGE_LIMIT = 1000
+    HTTP_TRANSPORT_RETRIES = 3   # Connection-level retries handled inside the transport
+    MOA_CACHE_TTL_SECONDS = 86400  # ChEMBL mechanisms only change with releases
+    VALIDATION_CONCURRENCY = 10  # validate_many: validations in flight at once
+    
+    # Static instructions first and per-call fields last, so repeated calls share
+    # a long identical prefix (eligible for Gemini implicit prompt caching)
+    PATHOLOGY_PROMPT = """You are a molecular pathology expert. Determine if the target below is OVERACTIVE or UNDERACTIVE in the disease.
+
+Classification Rules:
+- OVERACTIVE: Target is upregulated, hyperactive, or causing pathology through excessive activity
+  → Treatment should INHIBIT/BLOCK this target
+  → Examples: oncogenes in cancer, inflammatory mediators in autoimmune disease
+
+- UNDERACTIVE: Target is downregulated, deficient, or protective function is lost
+  → Treatment should ACTIVATE/ENHANCE this target
+  → Examples: tumor suppressors in cancer, insulin in diabetes
+
+- DYSREGULATED: Target activity is imbalanced (not simply high or low)
+  → Treatment needs MODULATION (not simple activation/inhibition)
+
+- UNKNOWN: Insufficient information to classify
+
+Respond with ONLY one word: overactive, underactive, dysregulated, or unknown
+
+Target: {target_symbol}
+Disease: {disease_name}
+Description: {description}
+Therapeutic Area: {therapeutic_area}"""
     
     def __init__(self):
-        self.gemini_model = genai.GenerativeModel("gemini-2.5-flash")
         self.timeout = httpx.Timeout(30.0)
+        # (target_symbol, disease key) → Gemini pathology classification
+        self._pathology_cache: Dict[Tuple[str, str], PathologyType] = {}
+        self._pathology_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        # Pooled ChEMBL client, created on first use so keep-alive connections are reused
+        self._http: Optional[httpx.AsyncClient] = None
+        # Single-drug lookups waiting to be flushed as one bulk request
+        self._moa_pending: List[Tuple[str, str, asyncio.Future]] = []
+        self._moa_flush_task: Optional[asyncio.Task] = None
+        # (chembl_id, target_symbol) → MOA, plus lookups in flight for stampede protection
+        self._moa_cache: Dict[Tuple[str, str], MOAType] = {}
+        self._moa_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+    
+    @cached_property
+    def gemini_model(self) -> genai.GenerativeModel:
+        """Gemini model, configured on first use (only complex pathology cases need it)."""
+        genai.configure(api_key=get_settings().gemini_api_key)
+        return genai.GenerativeModel("gemini-2.5-flash")
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled ChEMBL HTTP client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            transport = httpx.AsyncHTTPTransport(
+                retries=self.HTTP_TRANSPORT_RETRIES,
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+            self._http = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=transport,
+                headers={"Accept": "application/json"}
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the pooled ChEMBL client."""
+        if self._http is not None:
+            await self._http.aclose()
+        self._http = None
     
     async def validate_moa_appropriateness(
         self,
@@ -84,19 +212,20 @@ class MOAValidator:
         """
         logger.info(f"🎯 Validating MOA: {drug_chembl_id} for {disease_context.corrected_name}")
         
-        # Step 1: Get drug MOA from ChEMBL
-        drug_moa = await self._get_drug_moa_from_chembl(drug_chembl_id, target_symbol)
+        # Steps 1 + 2 are independent: drug MOA from ChEMBL and target pathology
+        # (possibly a Gemini call) run concurrently
+        drug_moa, target_pathology = await asyncio.gather(
+            self._get_drug_moa_from_chembl(drug_chembl_id, target_symbol),
+            self._determine_target_pathology(
+                target_symbol=target_symbol,
+                disease_context=disease_context
+            )
+        )
         
         if drug_moa == MOAType.UNKNOWN and mechanism_text:
             # Fallback: parse from mechanism text
             drug_moa = self._parse_moa_from_text(mechanism_text)
         
-        # Step 2: Determine target pathology
-        target_pathology = await self._determine_target_pathology(
-            target_symbol=target_symbol,
-            disease_context=disease_context
-        )
-        
         # Step 3: Validate match
         return self._validate_moa_match(
             drug_moa=drug_moa,
@@ -105,68 +234,225 @@ class MOAValidator:
             disease_name=disease_context.corrected_name
         )
     
+    async def validate_many(
+        self,
+        candidates: List[Dict],
+        disease_context
+    ) -> List[MOAValidationResult]:
+        """
+        Validate many candidates against one disease, VALIDATION_CONCURRENCY at a time.
+        
+        Args:
+            candidates: Dicts with drug_chembl_id, target_symbol and optional mechanism_text
+            disease_context: DiseaseContext
+        
+        Returns:
+            MOAValidationResult per candidate, in input order
+        """
+        semaphore = asyncio.Semaphore(self.VALIDATION_CONCURRENCY)
+        
+        async def validate_one(candidate: Dict) -> MOAValidationResult:
+            async with semaphore:
+                return await self.validate_moa_appropriateness(
+                    drug_chembl_id=candidate["drug_chembl_id"],
+                    target_symbol=candidate["target_symbol"],
+                    disease_context=disease_context,
+                    mechanism_text=candidate.get("mechanism_text")
+                )
+        
+        return await asyncio.gather(*(validate_one(candidate) for candidate in candidates))
+    
     async def _get_drug_moa_from_chembl(
         self,
         chembl_id: str,
         target_symbol: str
     ) -> MOAType:
-        """Query ChEMBL for drug mechanism"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                # Get drug mechanisms
-                response = await client.get(
-                    f"{self.CHEMBL_API}/mechanism.json",
-                    params={
-                        "molecule_chembl_id": chembl_id,
-                        "limit": 100
-                    },
-                    headers={"Accept": "application/json"}
-                )
-                
-                if response.status_code != 200:
-                    return MOAType.UNKNOWN
-                
-                data = response.json()
-                mechanisms = data.get("mechanisms", [])
-                
-                # Find mechanism for our target
-                for mech in mechanisms:
-                    target_name = mech.get("target_chembl_id", "")
-                    action_type = mech.get("action_type", "").lower()
-                    mechanism_of_action = mech.get("mechanism_of_action", "").lower()
-                    
-                    # Check if this mechanism is for our target
-                    # (Simple heuristic: target symbol in MOA text)
-                    if target_symbol.lower() in mechanism_of_action:
-                        return self._parse_moa_from_text(action_type or mechanism_of_action)
-                
-                # If no specific match, use first mechanism
-                if mechanisms:
-                    action_type = mechanisms[0].get("action_type", "").lower()
-                    return self._parse_moa_from_text(action_type)
-                
-                return MOAType.UNKNOWN
-                
-            except Exception as e:
-                logger.error(f"ChEMBL MOA query failed: {e}")
-                return MOAType.UNKNOWN
+        """
+        Query ChEMBL for drug mechanism.
+        
+        Results are cached in memory and in the file cache (TTL
+        MOA_CACHE_TTL_SECONDS); callers for a key already being fetched await
+        that fetch. Misses arriving within MOA_BATCH_WINDOW are coalesced into
+        one molecule_chembl_id__in request.
+        """
+        key = (chembl_id, target_symbol)
+        if key in self._moa_cache:
+            return self._moa_cache[key]
+        
+        inflight = self._moa_inflight.get(key)
+        if inflight is not None:
+            # shield: a cancelled waiter must not cancel the shared lookup
+            return await asyncio.shield(inflight)
+        
+        cache_params = {"chembl_id": chembl_id, "target_symbol": target_symbol}
+        cached = cache_manager.get("chembl_moa", cache_params, max_age_seconds=self.MOA_CACHE_TTL_SECONDS)
+        if cached is not None:
+            moa = MOAType(cached["moa"])
+            self._moa_cache[key] = moa
+            return moa
+        
+        future = asyncio.get_running_loop().create_future()
+        self._moa_inflight[key] = future
+        self._moa_pending.append((chembl_id, target_symbol, future))
+        if self._moa_flush_task is None:
+            self._moa_flush_task = asyncio.create_task(self._flush_moa_batch())
+        
+        try:
+            moa = await asyncio.shield(future)
+        finally:
+            self._moa_inflight.pop(key, None)
+        
+        # UNKNOWN may just be a failed request, so only definite answers are cached
+        if moa != MOAType.UNKNOWN:
+            self._moa_cache[key] = moa
+            cache_manager.set("chembl_moa", cache_params, {"moa": moa.value})
+        return moa
+    
+    async def _flush_moa_batch(self):
+        """Resolve every pending single-drug lookup with one bulk fetch."""
+        await asyncio.sleep(self.MOA_BATCH_WINDOW)
+        pending, self._moa_pending = self._moa_pending, []
+        self._moa_flush_task = None
+        
+        try:
+            grouped = await self._fetch_mechanisms_bulk([chembl_id for chembl_id, _, _ in pending])
+        except Exception as e:
+            logger.error(f"ChEMBL MOA query failed: {e}")
+            grouped = {}
+        
+        for chembl_id, target_symbol, future in pending:
+            if not future.done():
+                future.set_result(self._moa_from_mechanisms(grouped.get(chembl_id, []), target_symbol))
+    
+    async def get_drug_moas_bulk(
+        self,
+        chembl_ids: List[str],
+        target_symbol: str
+    ) -> Dict[str, MOAType]:
+        """Drug MOA for many ChEMBL IDs against one target, MOA_BATCH_SIZE IDs per request."""
+        grouped = await self._fetch_mechanisms_bulk(chembl_ids)
+        return {
+            chembl_id: self._moa_from_mechanisms(grouped.get(chembl_id, []), target_symbol)
+            for chembl_id in chembl_ids
+        }
+    
+    async def _fetch_mechanisms_bulk(self, chembl_ids: List[str]) -> Dict[str, List[Dict]]:
+        """Fetch ChEMBL mechanisms grouped by molecule_chembl_id (failed chunks are omitted)."""
+        unique_ids = list(dict.fromkeys(filter(None, chembl_ids)))
+        chunks = [
+            unique_ids[i:i + self.MOA_BATCH_SIZE]
+            for i in range(0, len(unique_ids), self.MOA_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(self._fetch_mechanism_chunk(chunk) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        grouped: Dict[str, List[Dict]] = {}
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(f"ChEMBL MOA query failed: {result}")
+                continue
+            for mech in result:
+                grouped.setdefault(mech.get("molecule_chembl_id"), []).append(mech)
+        return grouped
+    
+    async def _fetch_mechanism_chunk(self, chembl_ids: List[str]) -> List[Dict]:
+        """
+        All mechanism rows for up to MOA_BATCH_SIZE molecules, following pagination.
+        
+        Pages are stored with their ETag/Last-Modified and revalidated with a
+        conditional GET, so an unchanged page comes back as a body-less 304.
+        """
+        mechanisms = []
+        offset = 0
+        # Sorted so the same molecule set always maps to the same cached page
+        ids_param = ",".join(sorted(chembl_ids))
+        while True:
+            params = {
+                "molecule_chembl_id__in": ids_param,
+                "limit": self.MECHANISM_PAGE_LIMIT,
+                "offset": offset
+            }
+            cached = cache_manager.get("chembl_mechanism_page", params)
+            response = await self._get_mechanism_page(params, self._conditional_headers(cached))
+            
+            if response.status_code == 304 and cached is not None:
+                data = cached["data"]
+            elif response.status_code != 200:
+                logger.warning(f"ChEMBL mechanism query returned {response.status_code}")
+                return mechanisms
+            else:
+                data = json_loads(response.content)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    cache_manager.set("chembl_mechanism_page", params, {
+                        "data": data,
+                        "etag": etag,
+                        "last_modified": last_modified
+                    })
+            
+            mechanisms.extend(data.get("mechanisms", []))
+            
+            if not (data.get("page_meta") or {}).get("next"):
+                return mechanisms
+            offset += self.MECHANISM_PAGE_LIMIT
+    
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential_jitter(initial=0.2, max=2),
+        retry=retry_if_exception_type((httpx.TransportError, httpx.HTTPStatusError)),
+        reraise=True
+    )
+    async def _get_mechanism_page(self, params: Dict, headers: Dict[str, str]) -> httpx.Response:
+        """One mechanism page; 429/5xx and transport errors are retried with jittered backoff."""
+        response = await self._get_http().get(
+            f"{self.CHEMBL_API}/mechanism.json",
+            params=params,
+            headers=headers
+        )
+        if response.status_code == 429 or response.status_code >= 500:
+            response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _conditional_headers(cached: Optional[Dict]) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since validators for a cached page."""
+        if not cached:
+            return {}
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+    
+    def _moa_from_mechanisms(self, mechanisms: List[Dict], target_symbol: str) -> MOAType:
+        """Pick the MOA for target_symbol from one molecule's ChEMBL mechanisms."""
+        # Find mechanism for our target
+        for mech in mechanisms:
+            action_type = (mech.get("action_type") or "").lower()
+            mechanism_of_action = (mech.get("mechanism_of_action") or "").lower()
+            
+            # Check if this mechanism is for our target
+            # (Simple heuristic: target symbol in MOA text)
+            if target_symbol.lower() in mechanism_of_action:
+                return self._parse_moa_from_text(action_type or mechanism_of_action)
+        
+        # If no specific match, use first mechanism
+        if mechanisms:
+            action_type = (mechanisms[0].get("action_type") or "").lower()
+            return self._parse_moa_from_text(action_type)
+        
+        return MOAType.UNKNOWN
     
     def _parse_moa_from_text(self, text: str) -> MOAType:
         """Extract MOA type from text"""
-        text_lower = text.lower()
-        
-        if any(word in text_lower for word in ["inhibitor", "inhibits", "inhibition"]):
-            return MOAType.INHIBITOR
-        elif any(word in text_lower for word in ["antagonist", "antagonizes"]):
-            return MOAType.ANTAGONIST
-        elif any(word in text_lower for word in ["agonist", "activates"]):
-            return MOAType.AGONIST
-        elif any(word in text_lower for word in ["blocker", "blocks", "blocking"]):
-            return MOAType.BLOCKER
-        elif "modulator" in text_lower:
-            return MOAType.MODULATOR
-        else:
+        found = {_MOA_BY_KEYWORD[word] for word in _MOA_RX.findall(text.lower())}
+        if not found:
             return MOAType.UNKNOWN
+        return min(found, key=_MOA_PRIORITY.__getitem__)
     
     async def _determine_target_pathology(
         self,
@@ -204,32 +490,39 @@ class MOAValidator:
         target_symbol: str,
         disease_context
     ) -> PathologyType:
-        """Use Gemini for complex pathology classification"""
-        prompt = f"""You are a molecular pathology expert. Determine if this target is OVERACTIVE or UNDERACTIVE in the disease.
-
-Target: {target_symbol}
-Disease: {disease_context.corrected_name}
-Description: {disease_context.description}
-Therapeutic Area: {disease_context.therapeutic_area}
-
-Classification Rules:
-- OVERACTIVE: Target is upregulated, hyperactive, or causing pathology through excessive activity
-  → Treatment should INHIBIT/BLOCK this target
-  → Examples: oncogenes in cancer, inflammatory mediators in autoimmune disease
-
-- UNDERACTIVE: Target is downregulated, deficient, or protective function is lost
-  → Treatment should ACTIVATE/ENHANCE this target
-  → Examples: tumor suppressors in cancer, insulin in diabetes
-
-- DYSREGULATED: Target activity is imbalanced (not simply high or low)
-  → Treatment needs MODULATION (not simple activation/inhibition)
-
-- UNKNOWN: Insufficient information to classify
-
-Respond with ONLY one word: overactive, underactive, dysregulated, or unknown"""
+        """Use Gemini for complex pathology classification (memoized per target/disease)"""
+        cache_key = (target_symbol, self._disease_key(disease_context))
+        if cache_key in self._pathology_cache:
+            return self._pathology_cache[cache_key]
+        
+        # Concurrent callers for the same (target, disease) share one Gemini request
+        inflight = self._pathology_inflight.get(cache_key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._request_pathology(target_symbol, disease_context, cache_key)
+            )
+            self._pathology_inflight[cache_key] = inflight
+            inflight.add_done_callback(lambda _: self._pathology_inflight.pop(cache_key, None))
+        # shield: a cancelled waiter must not cancel the shared request
+        return await asyncio.shield(inflight)
+    
+    async def _request_pathology(
+        self,
+        target_symbol: str,
+        disease_context,
+        cache_key: Tuple[str, str]
+    ) -> PathologyType:
+        """One Gemini classification; definite answers are stored under cache_key."""
+        prompt = self.PATHOLOGY_PROMPT.format(
+            target_symbol=target_symbol,
+            disease_name=disease_context.corrected_name,
+            description=disease_context.description,
+            therapeutic_area=disease_context.therapeutic_area
+        )
 
         try:
-            response = self.gemini_model.generate_content(
+            # Native async call: the sync SDK method would block the event loop for the full LLM latency
+            response = await self.gemini_model.generate_content_async(
                 prompt,
                 generation_config=genai.GenerationConfig(
                     temperature=0.1,
@@ -237,19 +530,25 @@ Respond with ONLY one word: overactive, underactive, dysregulated, or unknown"""
                 )
             )
             
-            result = response.text.strip().lower()
-            
-            for pathology in PathologyType:
-                if pathology.value in result:
-                    logger.info(f"   Gemini classified {target_symbol} as {pathology.value}")
-                    return pathology
-            
-            return PathologyType.UNKNOWN
+            match = _PATH_RX.search(response.text.lower())
+            pathology = _PATH_MAP.get(match.group(1)) if match else PathologyType.UNKNOWN
+            if pathology != PathologyType.UNKNOWN:
+                logger.info(f"   Gemini classified {target_symbol} as {pathology.value}")
+                self._pathology_cache[cache_key] = pathology
+            return pathology
             
         except Exception as e:
             logger.error(f"Gemini pathology classification failed: {e}")
             return PathologyType.UNKNOWN
     
+    @staticmethod
+    def _disease_key(disease_context) -> str:
+        """Stable disease identity: ontology ID if resolved, else the normalized name."""
+        ontology_id = disease_context.efo_id or disease_context.mondo_id or disease_context.mesh_id
+        if ontology_id:
+            return ontology_id.strip().upper().replace(":", "_")
+        return " ".join(disease_context.corrected_name.casefold().split())
+    
     def _validate_moa_match(
         self,
         drug_moa: MOAType,
@@ -258,59 +557,25 @@ Respond with ONLY one word: overactive, underactive, dysregulated, or unknown"""
         disease_name: str
     ) -> MOAValidationResult:
         """Validate if MOA matches pathology"""
-        
-        # OVERACTIVE target → need INHIBITOR/ANTAGONIST/BLOCKER
-        if target_pathology == PathologyType.OVERACTIVE:
-            if drug_moa in [MOAType.INHIBITOR, MOAType.ANTAGONIST, MOAType.BLOCKER]:
-                return MOAValidationResult(
-                    is_appropriate=True,
-                    confidence=0.9,
-                    reasoning=f"{drug_moa.value} is appropriate for overactive {target_symbol} in {disease_name}",
-                    drug_moa=drug_moa,
-                    target_pathology=target_pathology,
-                    recommendation="KEEP - MOA matches disease pathology"
-                )
-            elif drug_moa in [MOAType.AGONIST, MOAType.ACTIVATOR]:
-                return MOAValidationResult(
-                    is_appropriate=False,
-                    confidence=0.9,
-                    reasoning=f"{drug_moa.value} would WORSEN disease (activates already overactive {target_symbol})",
-                    drug_moa=drug_moa,
-                    target_pathology=target_pathology,
-                    recommendation="REJECT - Opposite MOA (would worsen disease)"
-                )
-        
-        # UNDERACTIVE target → need AGONIST/ACTIVATOR
-        elif target_pathology == PathologyType.UNDERACTIVE:
-            if drug_moa in [MOAType.AGONIST, MOAType.ACTIVATOR]:
-                return MOAValidationResult(
-                    is_appropriate=True,
-                    confidence=0.9,
-                    reasoning=f"{drug_moa.value} is appropriate for underactive {target_symbol} in {disease_name}",
-                    drug_moa=drug_moa,
-                    target_pathology=target_pathology,
-                    recommendation="KEEP - MOA matches disease pathology"
-                )
-            elif drug_moa in [MOAType.INHIBITOR, MOAType.ANTAGONIST, MOAType.BLOCKER]:
-                return MOAValidationResult(
-                    is_appropriate=False,
-                    confidence=0.9,
-                    reasoning=f"{drug_moa.value} would WORSEN disease (inhibits already underactive {target_symbol})",
-                    drug_moa=drug_moa,
-                    target_pathology=target_pathology,
-                    recommendation="REJECT - Opposite MOA (would worsen disease)"
-                )
-        
-        # MODULATOR or UNKNOWN - accept with lower confidence
+        is_appropriate, confidence, reasoning, recommendation = _DECISION_TABLE.get(
+            (target_pathology, drug_moa), _UNCERTAIN_DECISION
+        )
         return MOAValidationResult(
-            is_appropriate=True,
-            confidence=0.5,
-            reasoning=f"MOA ({drug_moa.value}) appropriateness uncertain for {target_pathology.value} {target_symbol}",
+            is_appropriate=is_appropriate,
+            confidence=confidence,
+            reasoning=reasoning.format(
+                moa=drug_moa.value,
+                pathology=target_pathology.value,
+                target_symbol=target_symbol,
+                disease_name=disease_name
+            ),
             drug_moa=drug_moa,
             target_pathology=target_pathology,
-            recommendation="UNCERTAIN - Accept with caution"
+            recommendation=recommendation
         )
 
 
-# Singleton
-moa_validator = MOAValidator()
+@lru_cache(maxsize=None)
+def get_moa_validator() -> MOAValidator:
+    """Shared MOAValidator, created on first call rather than at import."""
+    return MOAValidator()
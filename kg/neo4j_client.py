@@ -1,69 +1,308 @@
 """Neo4j client for Route A knowledge graph."""
 import logging
-from neo4j import GraphDatabase
+import threading
+from functools import lru_cache
+from contextlib import contextmanager
+from neo4j import AsyncGraphDatabase, GraphDatabase
 from backend.app.config import get_settings
 from typing import List, Dict, Any, Optional
 from kg.ingest_opentargets import normalize_disease_id
 
 logger = logging.getLogger(__name__)
 
+NEO4J_MAX_POOL_SIZE = 50
+NEO4J_ACQUISITION_TIMEOUT = 60  # seconds to wait for a pooled connection
+NEO4J_BATCH_SIZE = 5000  # rows per UNWIND transaction (caps transaction memory)
+
+# Uniqueness constraints (each backed by an index) and lookup indexes for MERGE/MATCH keys
+SCHEMA_STATEMENTS = (
+    "CREATE CONSTRAINT disease_id IF NOT EXISTS FOR (d:Disease) REQUIRE d.id IS UNIQUE",
+    "CREATE CONSTRAINT target_id IF NOT EXISTS FOR (t:Target) REQUIRE t.id IS UNIQUE",
+    "CREATE CONSTRAINT candidate_id IF NOT EXISTS FOR (c:Candidate) REQUIRE c.id IS UNIQUE",
+    "CREATE CONSTRAINT drug_id IF NOT EXISTS FOR (d:Drug) REQUIRE d.id IS UNIQUE",
+    "CREATE INDEX target_symbol IF NOT EXISTS FOR (t:Target) ON (t.symbol)",
+)
+
+# Candidate stages accepted for each min_phase filter
+PHASE_STAGES = {
+    1: ["Phase 1", "Phase 2", "Phase 3", "approved"],
+    2: ["Phase 2", "Phase 3", "approved"],
+    3: ["Phase 3", "approved"],
+    4: ["approved"],
+}
+
+# One fixed, fully parameterized text so Neo4j reuses a single cached plan for
+# every filter combination (null/false parameters switch a filter off).
+# Associations are filtered before expanding to candidates, and rows are
+# aggregated per candidate, so no (candidate, target) tuple set needs DISTINCT.
+CANDIDATES_FOR_DISEASE_QUERY = """
+MATCH (d:Disease {id: $disease_id})
+MATCH (t:Target)-[ta:ASSOCIATED_WITH]->(d)
+WHERE ta.score > 0.0
+WITH t, ta
+MATCH (c:Candidate)-[:MODULATES]->(t)
+WHERE ($allowed_stages IS NULL OR c.stage IN $allowed_stages)
+  AND (NOT $oral_only OR c.formulation = 'oral')
+  AND (NOT $exclude_biologics OR c.type <> 'biologic')
+WITH c, collect(DISTINCT t.symbol) AS targets, avg(ta.score) AS score
+RETURN
+    c.id AS id,
+    c.name AS name,
+    c.stage AS stage,
+    targets,
+    score,
+    CASE WHEN c.source IS NULL THEN [] ELSE [c.source] END AS urls
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+# Write statements, shared by the sync and async clients
+DISEASE_MERGE_QUERY = """
+MERGE (d:Disease {id: $id})
+SET d.name = $name, d.updated_at = timestamp()
+"""
+
+TARGET_MERGE_QUERY = """
+MERGE (t:Target {id: $id})
+SET t.symbol = $symbol, t.name = $name, t.updated_at = timestamp()
+"""
+
+CANDIDATE_MERGE_QUERY = """
+MERGE (c:Candidate {id: $id})
+SET c.name = $name, c.stage = $stage, c.source = $source, c.updated_at = timestamp()
+"""
+
+TARGET_DISEASE_ASSOCIATION_QUERY = """
+MATCH (t:Target {id: $target_id})
+MATCH (d:Disease {id: $disease_id})
+MERGE (t)-[r:ASSOCIATED_WITH]->(d)
+SET r.score = $score + $mechanism_score, r.evidence = $evidence, r.updated_at = timestamp()
+"""
+
+CANDIDATE_TARGET_MODULATION_QUERY = """
+MATCH (c:Candidate {id: $candidate_id})
+MATCH (t:Target) WHERE t.symbol = $target_symbol  // Match by symbol!
+MERGE (c)-[r:MODULATES]->(t)
+SET r.type = $type, r.score = $score, r.updated_at = timestamp()
+"""
+
+TARGET_MECHANISM_QUERY = """
+MATCH (t:Target {id: $target_id})
+SET t.mechanism_reasoning = $mechanism_json, 
+    t.updated_at = timestamp()
+"""
+
+DRUG_MECHANISM_QUERY = """
+MATCH (d:Drug {id: $drug_id})
+SET d.mechanism_explanation = $mechanism_json,
+    d.updated_at = timestamp()
+"""
+
+DISEASES_UNWIND_QUERY = """
+UNWIND $rows AS r
+MERGE (d:Disease {id: r.id})
+SET d.name = r.name, d.updated_at = timestamp()
+"""
+
+TARGETS_UNWIND_QUERY = """
+UNWIND $rows AS r
+MERGE (t:Target {id: r.id})
+SET t.symbol = r.symbol, t.name = coalesce(r.name, ''), t.updated_at = timestamp()
+"""
+
+CANDIDATE_NODES_UNWIND_QUERY = """
+UNWIND $rows AS r
+MERGE (c:Candidate {id: r.id})
+SET c.name = r.name, c.stage = r.stage, c.source = coalesce(r.source, ''),
+    c.updated_at = timestamp()
+"""
+
+TARGET_ASSOCIATIONS_UNWIND_QUERY = """
+UNWIND $rows AS r
+MERGE (t:Target {id: r.target_id})
+SET t.symbol = r.symbol, t.name = r.name, t.updated_at = timestamp()
+WITH t, r
+MATCH (d:Disease {id: r.disease_id})
+MERGE (t)-[a:ASSOCIATED_WITH]->(d)
+SET a.score = r.score + r.mechanism_score, a.evidence = r.evidence, a.updated_at = timestamp()
+"""
+
+DRUG_MECHANISMS_UNWIND_QUERY = """
+UNWIND $rows AS r
+MATCH (d:Drug {id: r.drug_id})
+SET d.mechanism_explanation = r.mechanism_json,
+    d.updated_at = timestamp()
+"""
+
+DRUG_TARGETS_UNWIND_QUERY = """
+UNWIND $candidates AS cand
+MERGE (d:Drug {id: cand.candidate_id})
+SET d.name = cand.name,
+    d.stage = cand.stage,
+    d.source = cand.source
+
+WITH d, cand
+MATCH (t:Target {symbol: cand.target_symbol})
+MERGE (d)-[r:TARGETS]->(t)
+SET r.mechanism = cand.mechanism,
+    r.score = 0.5
+"""
+
+@lru_cache(maxsize=4096)
+def _norm(disease_id: str) -> str:
+    """normalize_disease_id is pure, so repeat lookups for the same disease are memoized."""
+    return normalize_disease_id(disease_id)
+
+# ensure_schema runs once per process, not once per client
+_schema_ready = False
+_schema_lock = threading.Lock()
+
 class Neo4jClient:
     """Manage Neo4j connections and queries."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.settings = get_settings()
+        # Per-node write logs are DEBUG unless verbose; bulk ingests call these per row
+        self._write_log_level = logging.INFO if verbose else logging.DEBUG
         self.driver = GraphDatabase.driver(
             self.settings.neo4j_uri,
             auth=(self.settings.neo4j_user, self.settings.neo4j_password),
+            max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+            connection_acquisition_timeout=NEO4J_ACQUISITION_TIMEOUT,
         )
         self.session_id = "session"
         logger.info(f"Connected to Neo4j: {self.settings.neo4j_uri}")
+        self.ensure_schema()
+    
+    def ensure_schema(self):
+        """Create constraints/indexes on first use so MERGE and symbol MATCHes are index seeks."""
+        global _schema_ready
+        with _schema_lock:
+            if _schema_ready:
+                return
+            try:
+                with self.driver.session(database=self.settings.neo4j_database) as session:
+                    for statement in SCHEMA_STATEMENTS:
+                        try:
+                            session.run(statement).consume()
+                        except Exception as e:
+                            # e.g. existing duplicate ids block a constraint; keep going
+                            logger.warning(f"Neo4j schema statement failed ({statement}): {e}")
+                _schema_ready = True
+            except Exception as e:
+                logger.warning(f"Could not ensure Neo4j schema: {e}")
     
     def close(self):
         """Close driver connection."""
         self.driver.close()
     
+    @contextmanager
+    def bulk(self):
+        """
+        One explicit transaction for many writes, committed on exit.
+        
+        Usage:
+            with client.bulk() as tx:
+                tx.run("MERGE ...", ...)
+                tx.run("MERGE ...", ...)
+        """
+        with self.driver.session(database=self.settings.neo4j_database) as session:
+            with session.begin_transaction() as tx:
+                yield tx
+                tx.commit()
+    
+    def _write_in_chunks(self, tx_fn, rows: List[Dict]):
+        """Run an UNWIND transaction function over rows, NEO4J_BATCH_SIZE rows per transaction."""
+        with self.driver.session(database=self.settings.neo4j_database) as session:
+            for start in range(0, len(rows), NEO4J_BATCH_SIZE):
+                session.execute_write(tx_fn, rows[start:start + NEO4J_BATCH_SIZE])
+    
+    def batch_create_diseases(self, rows: List[Dict]):
+        """Create many disease nodes with UNWIND writes.
+        
+        Args:
+            rows: [{"id": ..., "name": ...}, ...]
+        """
+        if not rows:
+            return
+        self._write_in_chunks(self._batch_create_diseases_tx, rows)
+        logger.info(f"Created {len(rows)} disease nodes")
+    
+    @staticmethod
+    def _batch_create_diseases_tx(tx, rows):
+        tx.run(DISEASES_UNWIND_QUERY, rows=rows)
+    
+    def batch_create_targets(self, rows: List[Dict]):
+        """Create many target nodes with UNWIND writes.
+        
+        Args:
+            rows: [{"id": ..., "symbol": ..., "name": ...}, ...]
+        """
+        if not rows:
+            return
+        self._write_in_chunks(self._batch_create_targets_tx, rows)
+        logger.info(f"Created {len(rows)} target nodes")
+    
+    @staticmethod
+    def _batch_create_targets_tx(tx, rows):
+        tx.run(TARGETS_UNWIND_QUERY, rows=rows)
+    
+    def batch_create_candidate_nodes(self, rows: List[Dict]):
+        """Create many candidate nodes with UNWIND writes.
+        
+        Args:
+            rows: [{"id": ..., "name": ..., "stage": ..., "source": ...}, ...]
+        """
+        if not rows:
+            return
+        self._write_in_chunks(self._batch_create_candidate_nodes_tx, rows)
+        logger.info(f"Created {len(rows)} candidate nodes")
+    
+    @staticmethod
+    def _batch_create_candidate_nodes_tx(tx, rows):
+        tx.run(CANDIDATE_NODES_UNWIND_QUERY, rows=rows)
+    
     def create_disease_node(self, disease_id: str, disease_name: str):
         """Create a disease node."""
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            session.run(
-                """
-                MERGE (d:Disease {id: $id})
-                SET d.name = $name, d.updated_at = timestamp()
-                """,
-                id=disease_id,
-                name=disease_name
+            session.execute_write(
+                self._write_tx,
+                DISEASE_MERGE_QUERY,
+                {
+                    "id": disease_id,
+                    "name": disease_name
+                }
             )
-        logger.warning(f"Created disease node: {disease_name}")
+        logger.log(self._write_log_level, "Created disease node: %s", disease_name)
     
     def create_target_node(self, target_id: str, target_symbol: str, target_name: str = ""):
         """Create a target node."""
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            session.run(
-                """
-                MERGE (t:Target {id: $id})
-                SET t.symbol = $symbol, t.name = $name, t.updated_at = timestamp()
-                """,
-                id=target_id,
-                symbol=target_symbol,
-                name=target_name
+            session.execute_write(
+                self._write_tx,
+                TARGET_MERGE_QUERY,
+                {
+                    "id": target_id,
+                    "symbol": target_symbol,
+                    "name": target_name
+                }
             )
-        logger.warning(f"Created target node: {target_symbol}")
+        logger.log(self._write_log_level, "Created target node: %s", target_symbol)
     
     def create_candidate_node(self, candidate_id: str, name: str, stage: str, source: str = ""):
         """Create a candidate drug node."""
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            session.run(
-                """
-                MERGE (c:Candidate {id: $id})
-                SET c.name = $name, c.stage = $stage, c.source = $source, c.updated_at = timestamp()
-                """,
-                id=candidate_id,
-                name=name,
-                stage=stage,
-                source=source
+            session.execute_write(
+                self._write_tx,
+                CANDIDATE_MERGE_QUERY,
+                {
+                    "id": candidate_id,
+                    "name": name,
+                    "stage": stage,
+                    "source": source
+                }
             )
-        logger.warning(f"Created candidate node: {name}")
+        logger.log(self._write_log_level, "Created candidate node: %s", name)
     
     def create_target_disease_association(
         self, 
@@ -75,20 +314,34 @@ class Neo4jClient:
     ):
         """Link target to disease."""
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            session.run(
-                """
-                MATCH (t:Target {id: $target_id})
-                MATCH (d:Disease {id: $disease_id})
-                MERGE (t)-[r:ASSOCIATED_WITH]->(d)
-                SET r.score = $score + $mechanism_score, r.evidence = $evidence, r.updated_at = timestamp()
-                """,
-                target_id=target_id,
-                disease_id=disease_id,
-                score=score,
-                evidence=evidence,
-                mechanism_score=mechanism_score
+            session.execute_write(
+                self._write_tx,
+                TARGET_DISEASE_ASSOCIATION_QUERY,
+                {
+                    "target_id": target_id,
+                    "disease_id": disease_id,
+                    "score": score,
+                    "evidence": evidence,
+                    "mechanism_score": mechanism_score
+                }
             )
-        logger.warning(f"Created association: Target->Disease")
+        logger.log(self._write_log_level, "Created association: Target(%s)->Disease(%s)", target_id, disease_id)
+    
+    def batch_create_target_and_association(self, rows: List[Dict]):
+        """Create target nodes and their disease associations in one UNWIND write.
+        
+        Args:
+            rows: [{"target_id", "symbol", "name", "disease_id", "score",
+                    "evidence", "mechanism_score"}, ...]
+        """
+        if not rows:
+            return
+        self._write_in_chunks(self._batch_create_target_and_association_tx, rows)
+        logger.info(f"Created {len(rows)} targets + associations")
+
+    @staticmethod
+    def _batch_create_target_and_association_tx(tx, rows):
+        tx.run(TARGET_ASSOCIATIONS_UNWIND_QUERY, rows=rows)
     
     def create_candidate_target_modulation(
         self,
@@ -99,19 +352,17 @@ class Neo4jClient:
     ):
         """Link candidate to target by SYMBOL."""
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            session.run(
-                """
-                MATCH (c:Candidate {id: $candidate_id})
-                MATCH (t:Target) WHERE t.symbol = $target_symbol  // Match by symbol!
-                MERGE (c)-[r:MODULATES]->(t)
-                SET r.type = $type, r.score = $score, r.updated_at = timestamp()
-                """,
-                candidate_id=candidate_id,
-                target_symbol=target_symbol, # Pass symbol
-                type=interaction_type,
-                score=score
+            session.execute_write(
+                self._write_tx,
+                CANDIDATE_TARGET_MODULATION_QUERY,
+                {
+                    "candidate_id": candidate_id,
+                    "target_symbol": target_symbol,  # Pass symbol
+                    "type": interaction_type,
+                    "score": score
+                }
             )
-        logger.warning(f"Created modulation: Candidate->Target({target_symbol})")
+        logger.log(self._write_log_level, "Created modulation: Candidate->Target(%s)", target_symbol)
     
     def query_candidates_for_disease(
         self,
@@ -123,98 +374,251 @@ class Neo4jClient:
     ) -> List[Dict[str, Any]]:
         """Query candidates for a disease."""
 
-        # Build filter clauses
-        filters = ["ta.score > 0.0"]
-
         # FIX: Use c.stage not c.phase, with proper string matching
+        allowed_stages = None
         if min_phase:
-            phase_mapping = {
-                1: "['Phase 1', 'Phase 2', 'Phase 3', 'approved']",
-                2: "['Phase 2', 'Phase 3', 'approved']",
-                3: "['Phase 3', 'approved']",
-                4: "['approved']"
-            }
-            allowed_stages = phase_mapping.get(min_phase, "['approved']")
-            filters.append(f"c.stage IN {allowed_stages}")
-
-        if oral_only:
-            filters.append("c.formulation = 'oral'")
-
-        if exclude_biologics:
-            filters.append("c.type <> 'biologic'")
-
-        where_clause = " AND ".join(filters)
-
-        query = f"""
-        MATCH (d:Disease {{id: $disease_id}})
-        MATCH (t:Target)-[ta:ASSOCIATED_WITH]->(d)
-        MATCH (c:Candidate)-[ct:MODULATES]->(t)
-        WHERE {where_clause}
-        RETURN DISTINCT
-            c.id as id,
-            c.name as name,
-            c.stage as stage,
-            collect(DISTINCT t.symbol) as targets,
-            avg(ta.score) as score,
-            collect(DISTINCT c.source) as urls
-        ORDER BY score DESC
-        LIMIT {limit}
-        """
+            allowed_stages = PHASE_STAGES.get(min_phase, ["approved"])
 
+        normalized_disease_id = _norm(disease_id)
+        # Managed read transaction: routable to cluster followers and retried on
+        # transient errors; records are materialized inside the transaction
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            normalized_disease_id = normalize_disease_id(disease_id)
-            result = session.run(query, disease_id=normalized_disease_id)
-            candidates = [dict(record) for record in result]
-            logger.info(f"Queried {len(candidates)} candidates for {disease_id}")
-            return candidates
+            candidates = session.execute_read(
+                self._read_records_tx,
+                CANDIDATES_FOR_DISEASE_QUERY,
+                {
+                    "disease_id": normalized_disease_id,
+                    "allowed_stages": allowed_stages,
+                    "oral_only": bool(oral_only),
+                    "exclude_biologics": bool(exclude_biologics),
+                    "limit": int(limit),
+                }
+            )
+        logger.info(f"Queried {len(candidates)} candidates for {disease_id}")
+        return candidates
+    
+    @staticmethod
+    def _read_records_tx(tx, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [dict(record) for record in tx.run(query, **params)]
+    
+    @staticmethod
+    def _write_tx(tx, query: str, params: Dict[str, Any]):
+        tx.run(query, **params).consume()
             
     def add_target_mechanism(self, target_id: str, mechanism_json: str):
         """Add mechanistic reasoning to target node."""
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            session.run(
-                """
-                MATCH (t:Target {id: $target_id})
-                SET t.mechanism_reasoning = $mechanism_json, 
-                    t.updated_at = timestamp()
-                """,
-                target_id=target_id,
-                mechanism_json=mechanism_json
+            session.execute_write(
+                self._write_tx,
+                TARGET_MECHANISM_QUERY,
+                {"target_id": target_id, "mechanism_json": mechanism_json}
             )
-            logger.info(f"✓ Added mechanism to target {target_id}")
+        logger.info(f"✓ Added mechanism to target {target_id}")
 
     def add_drug_mechanism(self, drug_id: str, mechanism_json: str):
-        """Add mechanistic explanation to drug/candidate node."""
+        """Add mechanistic explanation to a drug node."""
         with self.driver.session(database=self.settings.neo4j_database) as session:
-            session.run(
-                """
-                MATCH (c:Candidate {id: $drug_id})
-                SET c.mechanism_explanation = $mechanism_json,
-                    c.updated_at = timestamp()
-                """,
-                drug_id=drug_id,
-                mechanism_json=mechanism_json
+            session.execute_write(
+                self._write_tx,
+                DRUG_MECHANISM_QUERY,
+                {"drug_id": drug_id, "mechanism_json": mechanism_json}
             )
-            logger.info(f"✓ Added mechanism to drug {drug_id}")
+        logger.info(f"✓ Added mechanism to drug {drug_id}")
+
+    def batch_add_drug_mechanisms(self, rows: List[Dict]):
+        """Attach mechanistic explanations to many drug nodes in one UNWIND write.
+        
+        Args:
+            rows: [{"drug_id": ..., "mechanism_json": ...}, ...]
+        """
+        if not rows:
+            return
+        self._write_in_chunks(self._batch_add_drug_mechanisms_tx, rows)
+        logger.info(f"✓ Added mechanisms to {len(rows)} drugs")
+
+    @staticmethod
+    def _batch_add_drug_mechanisms_tx(tx, rows):
+        tx.run(DRUG_MECHANISMS_UNWIND_QUERY, rows=rows)
 
     def batch_create_candidates(self, candidates: List[Dict]):
-        """Batch create candidates and modulations in one transaction"""
-        with self.driver.session() as session:
-            session.execute_write(self._batch_create_tx, candidates)
-            logger.debug(f"Created {len(candidates)} candidates in Neo4j")
+        """Batch create candidates and modulations (NEO4J_BATCH_SIZE rows per transaction)"""
+        if not candidates:
+            return
+        self._write_in_chunks(self._batch_create_tx, candidates)
+        logger.debug(f"Created {len(candidates)} candidates in Neo4j")
 
     @staticmethod
     def _batch_create_tx(tx, candidates):
-        query = """
-        UNWIND $candidates AS cand
-        MERGE (d:Drug {id: cand.candidate_id})
-        SET d.name = cand.name,
-            d.stage = cand.stage,
-            d.source = cand.source
-        
-        WITH d, cand
-        MATCH (t:Target {symbol: cand.target_symbol})
-        MERGE (d)-[r:TARGETS]->(t)
-        SET r.mechanism = cand.mechanism,
-            r.score = 0.5
-        """
-        tx.run(query, candidates=candidates)
+        tx.run(DRUG_TARGETS_UNWIND_QUERY, candidates=candidates)
+
+
+class Neo4jAsyncClient:
+    """Async Neo4j client for FastAPI handlers; runs the same Cypher as Neo4jClient."""
+    
+    def __init__(self):
+        self.settings = get_settings()
+        self.driver = AsyncGraphDatabase.driver(
+            self.settings.neo4j_uri,
+            auth=(self.settings.neo4j_user, self.settings.neo4j_password),
+            max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+            connection_acquisition_timeout=NEO4J_ACQUISITION_TIMEOUT,
+        )
+        logger.info(f"Connected to Neo4j (async): {self.settings.neo4j_uri}")
+    
+    async def close(self):
+        """Close the driver connection."""
+        await self.driver.close()
+    
+    def _session(self):
+        return self.driver.session(database=self.settings.neo4j_database)
+    
+    async def ensure_schema(self):
+        """Create constraints/indexes once per process (shared with Neo4jClient)."""
+        global _schema_ready
+        if _schema_ready:
+            return
+        try:
+            async with self._session() as session:
+                for statement in SCHEMA_STATEMENTS:
+                    try:
+                        result = await session.run(statement)
+                        await result.consume()
+                    except Exception as e:
+                        logger.warning(f"Neo4j schema statement failed ({statement}): {e}")
+            _schema_ready = True
+        except Exception as e:
+            logger.warning(f"Could not ensure Neo4j schema: {e}")
+    
+    @staticmethod
+    async def _run_tx(tx, query: str, params: Dict[str, Any]):
+        result = await tx.run(query, **params)
+        await result.consume()
+    
+    @staticmethod
+    async def _read_records_tx(tx, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        result = await tx.run(query, **params)
+        return [dict(record) async for record in result]
+    
+    async def _write(self, query: str, **params):
+        """Run one write statement in a managed (retried) transaction."""
+        async with self._session() as session:
+            await session.execute_write(self._run_tx, query, params)
+    
+    async def _write_in_chunks(self, query: str, rows: List[Dict], param: str = "rows"):
+        """Run an UNWIND query over rows, NEO4J_BATCH_SIZE rows per transaction."""
+        async with self._session() as session:
+            for start in range(0, len(rows), NEO4J_BATCH_SIZE):
+                await session.execute_write(
+                    self._run_tx, query, {param: rows[start:start + NEO4J_BATCH_SIZE]}
+                )
+    
+    async def batch_create_diseases(self, rows: List[Dict]):
+        """Async Neo4jClient.batch_create_diseases."""
+        if rows:
+            await self._write_in_chunks(DISEASES_UNWIND_QUERY, rows)
+    
+    async def batch_create_targets(self, rows: List[Dict]):
+        """Async Neo4jClient.batch_create_targets."""
+        if rows:
+            await self._write_in_chunks(TARGETS_UNWIND_QUERY, rows)
+    
+    async def batch_create_candidate_nodes(self, rows: List[Dict]):
+        """Async Neo4jClient.batch_create_candidate_nodes."""
+        if rows:
+            await self._write_in_chunks(CANDIDATE_NODES_UNWIND_QUERY, rows)
+    
+    async def batch_create_target_and_association(self, rows: List[Dict]):
+        """Async Neo4jClient.batch_create_target_and_association."""
+        if rows:
+            await self._write_in_chunks(TARGET_ASSOCIATIONS_UNWIND_QUERY, rows)
+    
+    async def batch_add_drug_mechanisms(self, rows: List[Dict]):
+        """Async Neo4jClient.batch_add_drug_mechanisms."""
+        if rows:
+            await self._write_in_chunks(DRUG_MECHANISMS_UNWIND_QUERY, rows)
+    
+    async def batch_create_candidates(self, candidates: List[Dict]):
+        """Async Neo4jClient.batch_create_candidates."""
+        if candidates:
+            await self._write_in_chunks(DRUG_TARGETS_UNWIND_QUERY, candidates, param="candidates")
+    
+    async def create_disease_node(self, disease_id: str, disease_name: str):
+        """Create a disease node."""
+        await self._write(DISEASE_MERGE_QUERY, id=disease_id, name=disease_name)
+    
+    async def create_target_node(self, target_id: str, target_symbol: str, target_name: str = ""):
+        """Create a target node."""
+        await self._write(TARGET_MERGE_QUERY, id=target_id, symbol=target_symbol, name=target_name)
+    
+    async def create_candidate_node(self, candidate_id: str, name: str, stage: str, source: str = ""):
+        """Create a candidate drug node."""
+        await self._write(
+            CANDIDATE_MERGE_QUERY, id=candidate_id, name=name, stage=stage, source=source
+        )
+    
+    async def create_target_disease_association(
+        self,
+        target_id: str,
+        disease_id: str,
+        score: float = 0.5,
+        evidence: str = "",
+        mechanism_score: float = 0.0
+    ):
+        """Link target to disease."""
+        await self._write(
+            TARGET_DISEASE_ASSOCIATION_QUERY,
+            target_id=target_id,
+            disease_id=disease_id,
+            score=score,
+            evidence=evidence,
+            mechanism_score=mechanism_score
+        )
+    
+    async def create_candidate_target_modulation(
+        self,
+        candidate_id: str,
+        target_symbol: str,
+        interaction_type: str = "modulates",
+        score: float = 0.5
+    ):
+        """Link candidate to target by SYMBOL."""
+        await self._write(
+            CANDIDATE_TARGET_MODULATION_QUERY,
+            candidate_id=candidate_id,
+            target_symbol=target_symbol,
+            type=interaction_type,
+            score=score
+        )
+    
+    async def add_target_mechanism(self, target_id: str, mechanism_json: str):
+        """Add mechanistic reasoning to target node."""
+        await self._write(TARGET_MECHANISM_QUERY, target_id=target_id, mechanism_json=mechanism_json)
+    
+    async def add_drug_mechanism(self, drug_id: str, mechanism_json: str):
+        """Add mechanistic explanation to a drug node."""
+        await self._write(DRUG_MECHANISM_QUERY, drug_id=drug_id, mechanism_json=mechanism_json)
+    
+    async def query_candidates_for_disease(
+        self,
+        disease_id: str,
+        limit: int = 20,
+        min_phase: Optional[int] = None,
+        oral_only: bool = False,
+        exclude_biologics: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Query candidates for a disease without blocking the event loop."""
+        allowed_stages = PHASE_STAGES.get(min_phase, ["approved"]) if min_phase else None
+        async with self._session() as session:
+            candidates = await session.execute_read(
+                self._read_records_tx,
+                CANDIDATES_FOR_DISEASE_QUERY,
+                {
+                    "disease_id": _norm(disease_id),
+                    "allowed_stages": allowed_stages,
+                    "oral_only": bool(oral_only),
+                    "exclude_biologics": bool(exclude_biologics),
+                    "limit": int(limit),
+                }
+            )
+        logger.info(f"Queried {len(candidates)} candidates for {disease_id}")
+        return candidates
@@ -9,8 +9,14 @@ from typing import List, Dict, Optional, Tuple
 import logging
 import re
 
+from agents.base import cache_manager
+from kg.utils import HTTP2_AVAILABLE, async_lru
+
 logger = logging.getLogger(__name__)
 
+# UniProt accession format; other inputs are treated as gene symbols
+_UNIPROT_ACC_RE = re.compile(r'^[A-NR-ZOPQ][0-9][A-Z0-9]{3}[0-9]$')
+
 
 class PathwayIntegrator:
     """
@@ -22,16 +28,84 @@ class PathwayIntegrator:
     """
 
     UNIPROT_SEARCH_URL = "https://rest.uniprot.org/uniprotkb/search"
+    DISEASE_TARGET_LIMIT = 20        # Top targets used to infer disease pathways
+    TARGET_LOOKUP_CONCURRENCY = 16   # get_target_pathways calls in flight at once
+    UNIPROT_BATCH_SYMBOLS = 100      # Symbols per OR query (5 hits each stays within UniProt's 500 page size)
+    RESPONSE_CACHE_TTL_SECONDS = 7 * 86400  # Reactome/UniProt/KEGG data only change with releases
     # Minimal, polite headers to use for all external calls to avoid filtering/rate-limit surprises
     _DEFAULT_HEADERS = {
         "Accept": "application/json",
         "User-Agent": "pathway-integrator/1.0 (+https://example.org)"
     }
+    # KEGG answers in TSV, so its client only sends the User-Agent
+    _HOST_HEADERS = {
+        "reactome": _DEFAULT_HEADERS,
+        "uniprot": _DEFAULT_HEADERS,
+        "kegg": {"User-Agent": _DEFAULT_HEADERS["User-Agent"]},
+    }
 
     def __init__(self):
         self.reactome_url = "https://reactome.org/ContentService"
         self.kegg_url = "https://rest.kegg.jp"
         self.wikipathways_url = "https://webservice.wikipathways.org"
+        # One pooled keep-alive client per origin, created on first use
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def _client(self, host: str) -> httpx.AsyncClient:
+        """Pooled client for one origin ("reactome", "uniprot" or "kegg")."""
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=15.0,
+                headers=self._HOST_HEADERS[host],
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                http2=HTTP2_AVAILABLE
+            )
+            self._clients[host] = client
+        return client
+
+    async def aclose(self) -> None:
+        """Close every pooled client."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _cached_get(
+        self,
+        host: str,
+        url: str,
+        params: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        as_text: bool = False
+    ):
+        """
+        GET through the file cache (entries live RESPONSE_CACHE_TTL_SECONDS).
+
+        Returns the parsed JSON body (or the text, if as_text) and None for a
+        non-200 response; only successful responses are cached.
+        """
+        cache_params = {"url": url, "params": params or {}}
+        cached = cache_manager.get("pathway_http", cache_params, max_age_seconds=self.RESPONSE_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached["body"]
+
+        request_kwargs = {"params": params} if params else {}
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
+        response = await self._client(host).get(url, **request_kwargs)
+        if response.status_code != 200:
+            logger.debug("GET %s returned %s", url, response.status_code)
+            return None
+
+        body = response.text if as_text else response.json()
+        cache_manager.set("pathway_http", cache_params, {"body": body})
+        return body
 
     # -----------------------
     # Public methods (unchanged semantics)
@@ -41,14 +115,45 @@ class PathwayIntegrator:
         disease_targets: List[Dict]  # The 50 validated targets
     ) -> List[str]:
         """Get disease pathways by aggregating pathways from disease targets."""
-        all_pathway_ids = set()
-        
-        for target in disease_targets[:20]:  # Top 20 targets
-            gene_symbol = target.get("symbol")
-            target_pathways = await self.get_target_pathways(gene_symbol)
-            
-            for pathway in target_pathways:
-                all_pathway_ids.add(pathway["pathway_id"])
+        symbols = [target.get("symbol") for target in disease_targets[:self.DISEASE_TARGET_LIMIT]]
+        semaphore = asyncio.Semaphore(self.TARGET_LOOKUP_CONCURRENCY)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        async def no_pathways() -> List[Dict]:
+            return []
+
+        # 1) Reactome by gene symbol: one round-trip per target
+        direct = await asyncio.gather(
+            *(
+                bounded(self._direct_reactome_by_symbol(symbol))
+                if self._is_gene_symbol(symbol) else no_pathways()
+                for symbol in symbols
+            ),
+            return_exceptions=True
+        )
+        results = [r for r in direct if not isinstance(r, BaseException) and r]
+
+        # 2) Everything else goes through UniProt, resolved with one batched OR query
+        misses = [
+            symbol for symbol, r in zip(symbols, direct)
+            if isinstance(r, BaseException) or not r
+        ]
+        if misses:
+            pre_resolved = await self._resolve_uniprot_batch(misses)
+            results += await asyncio.gather(
+                *(bounded(self._target_pathways_via_uniprot(symbol, pre_resolved)) for symbol in misses),
+                return_exceptions=True
+            )
+
+        all_pathway_ids = {
+            pathway["pathway_id"]
+            for target_pathways in results
+            if not isinstance(target_pathways, BaseException)
+            for pathway in target_pathways
+        }
         
         logger.info(f"Inferred {len(all_pathway_ids)} disease pathways from targets")
         return list(all_pathway_ids)
@@ -60,71 +165,66 @@ class PathwayIntegrator:
     async def _query_reactome(self, disease_name: str) -> List[Dict]:
         """Query Reactome for disease pathways (search endpoint)."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{self.reactome_url}/search/query",
-                    params={"query": disease_name, "species": "Homo sapiens"},
-                    headers=self._DEFAULT_HEADERS
-                )
-
-                if response.status_code != 200:
-                    logger.debug("Reactome search returned %s", response.status_code)
-                    return []
-
-                results = response.json()
-                pathways = []
-
-                for entry in results.get("results", []):
-                    if entry.get("type") == "Pathway":
-                        pathway_id = entry.get("stId")
-                        pathway_details = await self._get_reactome_pathway_details(pathway_id)
-
-                        if pathway_details:
-                            pathways.append({
-                                "pathway_id": pathway_id,
-                                "name": entry.get("name"),
-                                "source": "reactome",
-                                "entities": pathway_details.get("entities", []),
-                                "description": entry.get("summation", "")
-                            })
-
-                logger.info(f"✓ Reactome: Found {len(pathways)} pathways for {disease_name}")
-                return pathways
+            results = await self._cached_get(
+                "reactome",
+                f"{self.reactome_url}/search/query",
+                params={"query": disease_name, "species": "Homo sapiens"}
+            )
+
+            if results is None:
+                return []
+
+            pathways = []
+
+            for entry in results.get("results", []):
+                if entry.get("type") == "Pathway":
+                    pathway_id = entry.get("stId")
+                    pathway_details = await self._get_reactome_pathway_details(pathway_id)
+
+                    if pathway_details:
+                        pathways.append({
+                            "pathway_id": pathway_id,
+                            "name": entry.get("name"),
+                            "source": "reactome",
+                            "entities": pathway_details.get("entities", []),
+                            "description": entry.get("summation", "")
+                        })
+
+            logger.info(f"✓ Reactome: Found {len(pathways)} pathways for {disease_name}")
+            return pathways
 
         except Exception as e:
             logger.warning(f"Reactome query failed: {e}")
             return []
 
+    @async_lru(maxsize=4096)
     async def _get_reactome_pathway_details(self, pathway_id: str) -> Optional[Dict]:
         """Get detailed information about a Reactome pathway (contained events -> participants)."""
         if not pathway_id:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{self.reactome_url}/data/pathway/{pathway_id}/containedEvents",
-                    headers=self._DEFAULT_HEADERS
-                )
-
-                if response.status_code != 200:
-                    logger.debug("Failed to fetch pathway details for %s : %s", pathway_id, response.status_code)
-                    return None
-
-                data = response.json()
-
-                entities = []
-                for event in data:
-                    if event.get("schemaClass") in ["Reaction", "BlackBoxEvent"]:
-                        for participant in event.get("input", []) + event.get("output", []):
-                            gene = participant.get("geneName") or participant.get("displayName") or participant.get("identifier")
-                            if gene:
-                                entities.append(gene)
-
-                return {
-                    "entities": list(set(entities)),
-                    "num_reactions": len(data)
-                }
+            data = await self._cached_get(
+                "reactome",
+                f"{self.reactome_url}/data/pathway/{pathway_id}/containedEvents"
+            )
+
+            if data is None:
+                logger.debug("Failed to fetch pathway details for %s", pathway_id)
+                return None
+
+            entities = []
+            for event in data:
+                if event.get("schemaClass") in ["Reaction", "BlackBoxEvent"]:
+                    for participant in event.get("input", []) + event.get("output", []):
+                        gene = participant.get("geneName") or participant.get("displayName") or participant.get("identifier")
+                        if gene:
+                            entities.append(gene)
+
+            return {
+                "entities": list(set(entities)),
+                "num_reactions": len(data)
+            }
 
         except Exception as e:
             logger.debug(f"Failed to get Reactome pathway details: {e}")
@@ -136,42 +236,47 @@ class PathwayIntegrator:
     async def _query_kegg(self, disease_name: str) -> List[Dict]:
         """Query KEGG for disease pathways."""
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(
-                    f"{self.kegg_url}/find/disease/{disease_name}"
-                )
-
-                if response.status_code != 200:
-                    return []
-
-                lines = response.text.strip().split("\n")
-                pathways = []
-
-                for line in lines[:5]:
-                    parts = line.split("\t")
-                    if len(parts) >= 2:
-                        disease_id = parts[0]
-                        disease_desc = parts[1]
-
-                        pathway_response = await client.get(
-                            f"{self.kegg_url}/link/pathway/{disease_id}"
-                        )
-
-                        if pathway_response.status_code == 200:
-                            for pathway_line in pathway_response.text.strip().split("\n"):
-                                pathway_parts = pathway_line.split("\t")
-                                if len(pathway_parts) >= 2:
-                                    pathway_id = pathway_parts[1].replace("path:", "")
-                                    pathways.append({
-                                        "pathway_id": pathway_id,
-                                        "name": f"KEGG pathway {pathway_id}",
-                                        "source": "kegg",
-                                        "disease_code": disease_id
-                                    })
-
-                logger.info(f"✓ KEGG: Found {len(pathways)} pathways for {disease_name}")
+            found = await self._cached_get(
+                "kegg", f"{self.kegg_url}/find/disease/{disease_name}", as_text=True
+            )
+
+            if found is None:
+                return []
+
+            lines = found.strip().split("\n")
+            disease_ids = [
+                parts[0] for parts in (line.split("\t") for line in lines[:5])
+                if len(parts) >= 2
+            ]
+            pathways = []
+            if not disease_ids:
                 return pathways
 
+            # One link call for all diseases ("+"-joined IDs); rows are "<disease>\tpath:<id>"
+            linked = await self._cached_get(
+                "kegg", f"{self.kegg_url}/link/pathway/{'+'.join(disease_ids)}", as_text=True
+            )
+
+            pathways_by_disease: Dict[str, List[str]] = {}
+            for pathway_line in (linked or "").strip().split("\n"):
+                pathway_parts = pathway_line.split("\t")
+                if len(pathway_parts) >= 2:
+                    pathways_by_disease.setdefault(pathway_parts[0], []).append(
+                        pathway_parts[1].replace("path:", "")
+                    )
+
+            for disease_id in disease_ids:
+                for pathway_id in pathways_by_disease.get(disease_id, []):
+                    pathways.append({
+                        "pathway_id": pathway_id,
+                        "name": f"KEGG pathway {pathway_id}",
+                        "source": "kegg",
+                        "disease_code": disease_id
+                    })
+
+            logger.info(f"✓ KEGG: Found {len(pathways)} pathways for {disease_name}")
+            return pathways
+
         except Exception as e:
             logger.warning(f"KEGG query failed: {e}")
             return []
@@ -179,6 +284,7 @@ class PathwayIntegrator:
     # -----------------------
     # Reactome mapping helpers
     # -----------------------
+    @async_lru(maxsize=4096)
     async def _map_uniprot_to_pathways(self, uniprot_acc: str) -> List[Dict]:
         if not uniprot_acc:
             return []
@@ -186,35 +292,34 @@ class PathwayIntegrator:
         uniprot_acc = uniprot_acc.strip()
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                url = f"{self.reactome_url}/data/mapping/UniProt/{uniprot_acc}/pathways"
-                resp = await client.get(url, headers=self._DEFAULT_HEADERS)
-                if resp.status_code != 200:
-                    logger.debug("Reactome mapping returned %s for %s", resp.status_code, uniprot_acc)
-                    return []
-                mapped = resp.json()
-                out = []
-                for m in mapped:
-                    out.append({
-                        "stId": m.get("stId"),
-                        "dbId": m.get("dbId"),
-                        "displayName": m.get("displayName"),
-                        "speciesName": m.get("speciesName")
-                    })
-                # debug: log count + small snippet
-                logger.debug("Reactome mapped count=%d for %s", len(out), uniprot_acc)
-                if len(out) > 0:
-                    logger.debug("Reactome mapped sample: %s", out[:3])
-                return out
+            url = f"{self.reactome_url}/data/mapping/UniProt/{uniprot_acc}/pathways"
+            mapped = await self._cached_get("reactome", url, timeout=10.0)
+            if mapped is None:
+                logger.debug("Reactome mapping failed for %s", uniprot_acc)
+                return []
+            out = []
+            for m in mapped:
+                out.append({
+                    "stId": m.get("stId"),
+                    "dbId": m.get("dbId"),
+                    "displayName": m.get("displayName"),
+                    "speciesName": m.get("speciesName")
+                })
+            # debug: log count + small snippet
+            logger.debug("Reactome mapped count=%d for %s", len(out), uniprot_acc)
+            if len(out) > 0:
+                logger.debug("Reactome mapped sample: %s", out[:3])
+            return out
         except Exception as e:
             logger.debug("Reactome map error for %s : %s", uniprot_acc, e)
             return []
+    @async_lru(maxsize=4096)
     async def _resolve_uniprot(self, gene_symbol: str) -> Optional[str]:
         if not gene_symbol:
             return None
 
         # slightly widened but same intent
-        if re.match(r'^[A-NR-ZOPQ][0-9][A-Z0-9]{3}[0-9]$', gene_symbol):
+        if _UNIPROT_ACC_RE.match(gene_symbol):
             return gene_symbol
 
         params = {
@@ -226,49 +331,153 @@ class PathwayIntegrator:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(self.UNIPROT_SEARCH_URL, params=params, headers=self._DEFAULT_HEADERS)
-                if resp.status_code != 200:
-                    logger.debug("UniProt search failed %s for %s", resp.status_code, gene_symbol)
-                    return None
-                body = resp.json()
-                results = body.get("results") or body.get("entries") or []
-                if not results:
-                    return None
-
-                # 1) Prefer reviewed (Swiss-Prot) entries
-                for r in results:
-                    entry_type = (r.get("entryType") or "").lower()
-                    acc = r.get("primaryAccession") or (r.get("accession") and r.get("accession")[0])
-                    if acc and "reviewed" in entry_type:
-                        logger.debug("UniProt: choosing reviewed accession %s for %s", acc, gene_symbol)
-                        return acc
-
-                # 2) Prefer accessions starting with 'P' (common for reviewed human records)
-                for r in results:
-                    acc = r.get("primaryAccession") or (r.get("accession") and r.get("accession")[0])
-                    if isinstance(acc, str) and acc.startswith("P"):
-                        logger.debug("UniProt: choosing P-* accession %s for %s", acc, gene_symbol)
-                        return acc
-
-                # 3) Fallback to first primaryAccession if nothing matched
-                first = results[0]
-                acc = first.get("primaryAccession") or (first.get("accession") and first.get("accession")[0])
-                logger.debug("UniProt: falling back to accession %s for %s", acc, gene_symbol)
-                return acc
+            body = await self._cached_get("uniprot", self.UNIPROT_SEARCH_URL, params=params, timeout=10.0)
+            if body is None:
+                logger.debug("UniProt search failed for %s", gene_symbol)
+                return None
+            results = body.get("results") or body.get("entries") or []
+            return self._pick_accession(results, gene_symbol)
 
         except Exception as e:
             logger.debug("Failed to resolve UniProt for %s : %s", gene_symbol, e)
             return None
 
+    @staticmethod
+    def _pick_accession(results: List[Dict], gene_symbol: str) -> Optional[str]:
+        """Choose one accession from a gene's UniProt hits (reviewed, then P-*, then first)."""
+        if not results:
+            return None
+
+        # 1) Prefer reviewed (Swiss-Prot) entries
+        for r in results:
+            entry_type = (r.get("entryType") or "").lower()
+            acc = r.get("primaryAccession") or (r.get("accession") and r.get("accession")[0])
+            if acc and "reviewed" in entry_type:
+                logger.debug("UniProt: choosing reviewed accession %s for %s", acc, gene_symbol)
+                return acc
+
+        # 2) Prefer accessions starting with 'P' (common for reviewed human records)
+        for r in results:
+            acc = r.get("primaryAccession") or (r.get("accession") and r.get("accession")[0])
+            if isinstance(acc, str) and acc.startswith("P"):
+                logger.debug("UniProt: choosing P-* accession %s for %s", acc, gene_symbol)
+                return acc
+
+        # 3) Fallback to first primaryAccession if nothing matched
+        first = results[0]
+        acc = first.get("primaryAccession") or (first.get("accession") and first.get("accession")[0])
+        logger.debug("UniProt: falling back to accession %s for %s", acc, gene_symbol)
+        return acc
+
+    async def _resolve_uniprot_batch(self, symbols: List[str]) -> Dict[str, str]:
+        """
+        Resolve many gene symbols with OR queries (UNIPROT_BATCH_SYMBOLS per request).
+
+        Hits are grouped by primary gene name and picked like _resolve_uniprot;
+        symbols without a hit are left out, so callers fall back per symbol.
+        """
+        # Accession-looking inputs are used as-is by get_target_pathways
+        pending = list(dict.fromkeys(
+            symbol.strip() for symbol in symbols if self._is_gene_symbol(symbol)
+        ))
+        resolved: Dict[str, str] = {}
+
+        for start in range(0, len(pending), self.UNIPROT_BATCH_SYMBOLS):
+            chunk = pending[start:start + self.UNIPROT_BATCH_SYMBOLS]
+            params = {
+                "query": "(" + " OR ".join(f"gene:{symbol}" for symbol in chunk) + ") AND organism_id:9606",
+                "fields": "accession,reviewed,gene_primary,id",
+                "format": "json",
+                "size": len(chunk) * 5
+            }
+            try:
+                body = await self._cached_get("uniprot", self.UNIPROT_SEARCH_URL, params=params, timeout=10.0)
+            except Exception as e:
+                logger.debug("Batch UniProt search failed: %s", e)
+                continue
+            if body is None:
+                continue
+
+            by_gene: Dict[str, List[Dict]] = {}
+            for r in body.get("results") or body.get("entries") or []:
+                genes = r.get("genes") or [{}]
+                gene_name = ((genes[0].get("geneName") or {}).get("value") or "").upper()
+                by_gene.setdefault(gene_name, []).append(r)
+
+            for symbol in chunk:
+                acc = self._pick_accession(by_gene.get(symbol.upper(), []), symbol)
+                if acc:
+                    resolved[symbol] = acc
+
+        logger.debug("Batch UniProt resolved %d/%d symbols", len(resolved), len(pending))
+        return resolved
+
     # -----------------------
-    # get_target_pathways (unchanged)
+    # get_target_pathways
     # -----------------------
-    async def get_target_pathways(self, gene_symbol: str) -> List[Dict]:
+    async def get_target_pathways(
+        self,
+        gene_symbol: str,
+        pre_resolved: Optional[Dict[str, str]] = None
+    ) -> List[Dict]:
+        """
+        Reactome pathways for a target.
+
+        Gene symbols are looked up directly by symbol; UniProt accessions, and
+        symbols Reactome does not know, go through the UniProt mapping path.
+        """
+        if self._is_gene_symbol(gene_symbol):
+            direct = await self._direct_reactome_by_symbol(gene_symbol)
+            if direct:
+                return direct
+        return await self._target_pathways_via_uniprot(gene_symbol, pre_resolved)
+
+    @staticmethod
+    def _is_gene_symbol(gene_symbol: Optional[str]) -> bool:
+        return bool(gene_symbol) and not _UNIPROT_ACC_RE.match(gene_symbol.strip())
+
+    @async_lru(maxsize=4096)
+    async def _direct_reactome_by_symbol(self, gene_symbol: str) -> List[Dict]:
+        """Pathways for a gene symbol from Reactome's entity endpoint (no UniProt step)."""
+        try:
+            pathways = await self._cached_get(
+                "reactome",
+                f"{self.reactome_url}/data/pathways/low/entity/{gene_symbol.strip()}/allForms",
+                params={"species": "Homo sapiens"}
+            )
+        except Exception as e:
+            logger.debug("Reactome symbol lookup failed for %s : %s", gene_symbol, e)
+            return []
+
+        if not isinstance(pathways, list):
+            return []
+
+        result = [
+            {
+                "pathway_id": p.get("stId"),
+                "name": p.get("displayName"),
+                "dbId": p.get("dbId"),
+                "species": p.get("speciesName"),
+                "source": "reactome"
+            }
+            for p in pathways
+        ]
+        if result:
+            logger.info(f"✓ Found {len(result)} pathways for target {gene_symbol} (by symbol)")
+        return result
+
+    async def _target_pathways_via_uniprot(
+        self,
+        gene_symbol: str,
+        pre_resolved: Optional[Dict[str, str]] = None
+    ) -> List[Dict]:
+        """UniProt resolution → Reactome mapping, retrying other UniProt hits if needed."""
         try:
             uniprot_acc = None
-            if gene_symbol and gene_symbol.upper().startswith(("P", "Q", "O")):
+            if gene_symbol and not self._is_gene_symbol(gene_symbol):
                 uniprot_acc = gene_symbol.strip()
+            elif pre_resolved and gene_symbol and gene_symbol.strip() in pre_resolved:
+                uniprot_acc = pre_resolved[gene_symbol.strip()]
             else:
                 uniprot_acc = await self._resolve_uniprot(gene_symbol)
 
@@ -290,23 +499,21 @@ class PathwayIntegrator:
                         "format": "json",
                         "size": 5
                     }
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        resp = await client.get(self.UNIPROT_SEARCH_URL, params=params, headers=self._DEFAULT_HEADERS)
-                        if resp.status_code == 200:
-                            body = resp.json()
-                            results = body.get("results") or body.get("entries") or []
-                            # iterate through candidate accessions and try mapping until one works
-                            for r in results:
-                                candidate = r.get("primaryAccession") or (r.get("accession") and r.get("accession")[0])
-                                if not candidate or candidate == uniprot_acc:
-                                    continue
-                                logger.debug("Trying alternate accession %s for mapping", candidate)
-                                mapped_alt = await self._map_uniprot_to_pathways(candidate)
-                                if mapped_alt:
-                                    mapped = mapped_alt
-                                    uniprot_acc = candidate
-                                    logger.debug("Found mapping for alternate accession %s", candidate)
-                                    break
+                    body = await self._cached_get("uniprot", self.UNIPROT_SEARCH_URL, params=params, timeout=10.0)
+                    if body is not None:
+                        results = body.get("results") or body.get("entries") or []
+                        # iterate through candidate accessions and try mapping until one works
+                        for r in results:
+                            candidate = r.get("primaryAccession") or (r.get("accession") and r.get("accession")[0])
+                            if not candidate or candidate == uniprot_acc:
+                                continue
+                            logger.debug("Trying alternate accession %s for mapping", candidate)
+                            mapped_alt = await self._map_uniprot_to_pathways(candidate)
+                            if mapped_alt:
+                                mapped = mapped_alt
+                                uniprot_acc = candidate
+                                logger.debug("Found mapping for alternate accession %s", candidate)
+                                break
                 except Exception as e:
                     logger.debug("Fallback UniProt re-query failed: %s", e)
 
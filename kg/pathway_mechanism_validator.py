@@ -12,6 +12,9 @@ from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
 from enum import Enum
 
+from agents.base import cache_manager
+from kg.utils import HTTP2_AVAILABLE
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,11 +51,32 @@ class PathwayMechanismValidator:
     
     REACTOME_API = "https://reactome.org/ContentService"
     TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+    RESPONSE_CACHE_TTL_SECONDS = 7 * 86400  # Reactome data only changes with releases
     
     # Thresholds
     HIGH_CONFIDENCE_THRESHOLD = 0.3
     MODERATE_CONFIDENCE_THRESHOLD = 0.15
     
+    def __init__(self):
+        # Pooled Reactome client, created on first use so keep-alive connections are reused
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled Reactome client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=self.TIMEOUT,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                http2=HTTP2_AVAILABLE
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the pooled Reactome client."""
+        if self._http is not None:
+            await self._http.aclose()
+        self._http = None
+    
     async def validate_mechanism(
         self,
         target_symbol: str,
@@ -141,26 +165,29 @@ class PathwayMechanismValidator:
         )
     
     async def _get_target_pathways(self, gene_symbol: str, species: str) -> List[Dict]:
-        """Query Reactome for gene-associated pathways"""
-        async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-            try:
-                response = await client.get(
-                    f"{self.REACTOME_API}/data/pathways/low/entity/{gene_symbol}/allForms",
-                    params={"species": species}
-                )
-                
-                if response.status_code == 404:
-                    logger.warning(f"Gene {gene_symbol} not found in Reactome")
-                    return []
-                
-                response.raise_for_status()
-                pathways = response.json()
-                
-                return pathways if isinstance(pathways, list) else []
-                
-            except Exception as e:
-                logger.error(f"Reactome target query failed for {gene_symbol}: {e}")
+        """Query Reactome for gene-associated pathways (file-cached for RESPONSE_CACHE_TTL_SECONDS)"""
+        url = f"{self.REACTOME_API}/data/pathways/low/entity/{gene_symbol}/allForms"
+        cache_params = {"url": url, "params": {"species": species}}
+        cached = cache_manager.get("pathway_http", cache_params, max_age_seconds=self.RESPONSE_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached["body"]
+        
+        try:
+            response = await self._get_http().get(url, params={"species": species})
+            
+            if response.status_code == 404:
+                logger.warning(f"Gene {gene_symbol} not found in Reactome")
                 return []
+            
+            response.raise_for_status()
+            pathways = response.json()
+            pathways = pathways if isinstance(pathways, list) else []
+            cache_manager.set("pathway_http", cache_params, {"body": pathways})
+            return pathways
+            
+        except Exception as e:
+            logger.error(f"Reactome target query failed for {gene_symbol}: {e}")
+            return []
     
     async def _get_disease_pathways(self, disease_name: str, species: str) -> List[Dict]:
         """
@@ -169,49 +196,49 @@ class PathwayMechanismValidator:
         Note: Reactome disease mapping is limited.
         Fallback strategy: search by disease keywords in pathway names.
         """
-        async with httpx.AsyncClient(timeout=self.TIMEOUT) as client:
-            try:
-                # Try direct query first
-                response = await client.get(
-                    f"{self.REACTOME_API}/data/diseases/{disease_name}"
-                )
-                
-                if response.status_code == 200:
-                    disease_data = response.json()
-                    # Extract pathway IDs from disease
-                    # (API structure varies, adapt as needed)
-                    return []
-                
-                # Fallback: Search pathways by disease keywords
-                search_response = await client.get(
-                    f"{self.REACTOME_API}/search/query",
-                    params={
-                        "query": disease_name,
-                        "species": species,
-                        "types": "Pathway"
-                    }
-                )
-                
-                if search_response.status_code == 200:
-                    search_results = search_response.json()
-                    
-                    pathway_list = []
-                    if "results" in search_results:
-                        for result in search_results["results"][:20]:  # Limit to top 20
-                            if result.get("type") == "Pathway":
-                                pathway_list.append({
-                                    "stId": result.get("stId"),
-                                    "displayName": result.get("name"),
-                                    "species": result.get("species", [{}])[0].get("displayName")
-                                })
-                    
-                    return pathway_list
-                
+        client = self._get_http()
+        try:
+            # Try direct query first
+            response = await client.get(
+                f"{self.REACTOME_API}/data/diseases/{disease_name}"
+            )
+            
+            if response.status_code == 200:
+                disease_data = response.json()
+                # Extract pathway IDs from disease
+                # (API structure varies, adapt as needed)
                 return []
+            
+            # Fallback: Search pathways by disease keywords
+            search_response = await client.get(
+                f"{self.REACTOME_API}/search/query",
+                params={
+                    "query": disease_name,
+                    "species": species,
+                    "types": "Pathway"
+                }
+            )
+            
+            if search_response.status_code == 200:
+                search_results = search_response.json()
                 
-            except Exception as e:
-                logger.error(f"Reactome disease query failed for {disease_name}: {e}")
-                return []
+                pathway_list = []
+                if "results" in search_results:
+                    for result in search_results["results"][:20]:  # Limit to top 20
+                        if result.get("type") == "Pathway":
+                            pathway_list.append({
+                                "stId": result.get("stId"),
+                                "displayName": result.get("name"),
+                                "species": result.get("species", [{}])[0].get("displayName")
+                            })
+                
+                return pathway_list
+            
+            return []
+            
+        except Exception as e:
+            logger.error(f"Reactome disease query failed for {disease_name}: {e}")
+            return []
 
 
 # Singleton
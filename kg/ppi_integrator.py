@@ -4,9 +4,14 @@ Integrate protein-protein interaction data for network analysis.
 """
 
 import httpx
-from typing import List, Dict
+import asyncio
+import heapq
+from operator import itemgetter
+from typing import List, Dict, Optional
 import logging
 
+from kg.utils import HTTP2_AVAILABLE, async_lru
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,17 +23,45 @@ class PPIIntegrator:
     - IntAct: Curated interactions
     """
     
+    LOOKUP_CONCURRENCY = 16  # find_common_interactors: STRING calls in flight at once
+    
     def __init__(self):
         self.string_url = "https://string-db.org/api"
         self.biogrid_url = "https://webservice.thebiogrid.org"
+        # Pooled STRING client, created on first use so keep-alive connections are reused
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the pooled STRING client, creating it on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                http2=HTTP2_AVAILABLE
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the pooled STRING client."""
+        if self._http is not None:
+            await self._http.aclose()
+        self._http = None
     
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    @async_lru(maxsize=4096)
     async def get_protein_interactions(
         self, 
         gene_symbol: str,
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        limit: Optional[int] = None
     ) -> List[Dict]:
         """
-        Get high-confidence protein interactions.
+        Get high-confidence protein interactions (the `limit` highest-scoring, if given).
         
         Returns:
         [
@@ -42,39 +75,51 @@ class PPIIntegrator:
         ]
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.string_url}/json/network",
-                    data={
-                        "identifiers": gene_symbol,
-                        "species": 9606,  # Homo sapiens
-                        "required_score": int(confidence_threshold * 1000)
-                    }
-                )
-                
-                if response.status_code != 200:
-                    return []
-                
-                interactions = response.json()
-                
-                result = []
-                for interaction in interactions:
-                    partner = interaction.get("preferredName_B")
-                    if partner != gene_symbol:
-                        result.append({
-                            "partner": partner,
-                            "score": interaction.get("score", 0) / 1000.0,
-                            "evidence": self._parse_string_evidence(interaction),
-                            "source": "STRING"
-                        })
-                
-                logger.info(f"✓ Found {len(result)} interactions for {gene_symbol}")
-                return result
-                
+            response = await self._get_http().post(
+                f"{self.string_url}/json/network",
+                data={
+                    "identifiers": gene_symbol,
+                    "species": 9606,  # Homo sapiens
+                    "required_score": int(confidence_threshold * 1000)
+                }
+            )
+            
+            if response.status_code != 200:
+                return []
+            
+            interactions = response.json()
+            
+            result = []
+            for interaction in interactions:
+                partner = interaction.get("preferredName_B")
+                score = self._string_score(interaction)
+                if partner != gene_symbol and score >= confidence_threshold:
+                    result.append({
+                        "partner": partner,
+                        "score": score,
+                        "evidence": self._parse_string_evidence(interaction),
+                        "source": "STRING"
+                    })
+            
+            # Keep the strongest partners, not the first ones STRING happened to list
+            if limit is not None and len(result) > limit:
+                result = heapq.nlargest(limit, result, key=itemgetter("score"))
+            
+            logger.info(f"✓ Found {len(result)} interactions for {gene_symbol}")
+            return result
+            
         except Exception as e:
             logger.warning(f"STRING query failed: {e}")
             return []
     
+    @staticmethod
+    def _string_score(interaction: Dict) -> float:
+        """Combined STRING score on a 0-1 scale (the JSON API already reports 0-1; TSV uses 0-1000)."""
+        score = interaction.get("score", 0)
+        if score > 1:
+            score /= 1000.0
+        return score
+    
     def _parse_string_evidence(self, interaction: Dict) -> List[str]:
         """Extract evidence types from STRING interaction."""
         evidence = []
@@ -97,18 +142,10 @@ class PPIIntegrator:
         Find proteins that interact with multiple targets in the list.
         These are potential combination therapy targets or biomarkers.
         """
-        all_interactions = {}
-        
-        for gene in gene_list:
-            interactions = await self.get_protein_interactions(gene)
-            for interaction in interactions:
-                partner = interaction["partner"]
-                if partner not in all_interactions:
-                    all_interactions[partner] = []
-                all_interactions[partner].append({
-                    "source_target": gene,
-                    "score": interaction["score"]
-                })
+        all_interactions = await self._fetch_partners_batch(gene_list)
+        if all_interactions is None:
+            # Batched call failed: fall back to one STRING call per gene
+            all_interactions = await self._fetch_partners_per_gene(gene_list)
         
         # Filter for proteins interacting with 2+ targets
         common = [
@@ -127,3 +164,68 @@ class PPIIntegrator:
         
         logger.info(f"✓ Found {len(common)} common interactors across {len(gene_list)} targets")
         return common
+    
+    async def _fetch_partners_batch(
+        self,
+        gene_list: List[str],
+        confidence_threshold: float = 0.7
+    ) -> Optional[Dict[str, List[Dict]]]:
+        """
+        Partners of every gene from one STRING interaction_partners call.
+        
+        Returns {partner: [{"source_target", "score"}, ...]}, or None if the call failed.
+        """
+        try:
+            response = await self._get_http().post(
+                f"{self.string_url}/json/interaction_partners",
+                data={
+                    "identifiers": "\r".join(gene_list),
+                    "species": 9606,  # Homo sapiens
+                    "required_score": int(confidence_threshold * 1000)
+                }
+            )
+            if response.status_code != 200:
+                logger.warning(f"STRING batch query returned {response.status_code}")
+                return None
+            interactions = response.json()
+        except Exception as e:
+            logger.warning(f"STRING batch query failed: {e}")
+            return None
+        
+        all_interactions: Dict[str, List[Dict]] = {}
+        seen = set()
+        for interaction in interactions:
+            # preferredName_A is the queried protein, preferredName_B its partner
+            source = interaction.get("preferredName_A")
+            partner = interaction.get("preferredName_B")
+            score = self._string_score(interaction)
+            if not source or partner == source or score < confidence_threshold or (source, partner) in seen:
+                continue
+            seen.add((source, partner))
+            all_interactions.setdefault(partner, []).append({
+                "source_target": source,
+                "score": score
+            })
+        return all_interactions
+    
+    async def _fetch_partners_per_gene(self, gene_list: List[str]) -> Dict[str, List[Dict]]:
+        """Partners of every gene via get_protein_interactions, LOOKUP_CONCURRENCY calls at a time."""
+        semaphore = asyncio.Semaphore(self.LOOKUP_CONCURRENCY)
+        
+        async def lookup(gene: str) -> List[Dict]:
+            async with semaphore:
+                return await self.get_protein_interactions(gene)
+        
+        results = await asyncio.gather(*(lookup(gene) for gene in gene_list), return_exceptions=True)
+        
+        all_interactions: Dict[str, List[Dict]] = {}
+        for gene, interactions in zip(gene_list, results):
+            if isinstance(interactions, BaseException):
+                logger.warning(f"STRING query failed for {gene}: {interactions}")
+                continue
+            for interaction in interactions:
+                all_interactions.setdefault(interaction["partner"], []).append({
+                    "source_target": gene,
+                    "score": interaction["score"]
+                })
+        return all_interactions
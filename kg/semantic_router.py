@@ -7,6 +7,7 @@ import logging
 import json
 from typing import Optional, List
 from dataclasses import dataclass
+from functools import cached_property
 import cerebras_llm as llm  # Cerebras-hosted LLM wrapper
 
 # Initialize Logger
@@ -31,6 +32,17 @@ class DiseaseContext:
     confidence: float
     # We don't store the chain_of_thought, but we parse it to allow the LLM to think
 
+    @cached_property
+    def disease_type(self) -> str:
+        """Coarse disease class: Cancer/Autoimmune/Infectious, else the therapeutic area."""
+        if self.is_cancer:
+            return "Cancer"
+        if self.is_autoimmune:
+            return "Autoimmune"
+        if self.is_infectious:
+            return "Infectious"
+        return self.therapeutic_area
+
 class GeminiSemanticRouter:
     """
     Disease Resolution for Local LLMs.
@@ -274,13 +274,19 @@ class AutomatedTargetValidator:
             except Exception as e:
                 logger.warning(f"⚠️ Could not initialize Gemini filter: {e}")
         
-        for target in targets[:3]:
-            result = await self.validate_target(
+        batch = targets[:3]
+        
+        # Evidence lookups are independent per target - run them concurrently
+        results = await asyncio.gather(*[
+            self.validate_target(
                 gene_symbol=target["symbol"],
                 disease_name=disease_name,
                 uniprot_id=target.get("uniprot_id")
             )
-            
+            for target in batch
+        ])
+        
+        for target, result in zip(batch, results):
             if result["is_valid"]:
                 # ✅ Apply Gemini mechanism filter if available
                 if gemini_filter:
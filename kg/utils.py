@@ -1,10 +1,81 @@
 import re
-from typing import Union, Optional
+import json
+import asyncio
+import functools
+from collections import OrderedDict
+from typing import Any, Union, Optional
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401  (enables httpx HTTP/2 support)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON (bytes or str), using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def async_lru(maxsize: int = 4096):
+    """
+    Per-instance LRU memoization for async methods, keyed on the call arguments.
+
+    The task is cached before it is awaited, so concurrent identical calls share
+    one execution. Falsy results (None/[]: failed or empty lookups) and
+    exceptions are not kept, so they are retried on the next call.
+    """
+    def decorator(method):
+        attr = f"_{method.__name__}_lru"
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            cache = self.__dict__.get(attr)
+            if cache is None:
+                cache = self.__dict__[attr] = OrderedDict()
+            key = (args, tuple(sorted(kwargs.items())))
+
+            task = cache.get(key)
+            if task is None:
+                task = asyncio.ensure_future(method(self, *args, **kwargs))
+                cache[key] = task
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+                def evict_unless_useful(done: asyncio.Future) -> None:
+                    if done.cancelled() or done.exception() is not None or not done.result():
+                        if cache.get(key) is done:
+                            del cache[key]
+
+                task.add_done_callback(evict_unless_useful)
+            else:
+                cache.move_to_end(key)
+
+            # shield: a cancelled caller must not cancel the shared call
+            return await asyncio.shield(task)
+
+        return wrapper
+    return decorator
+
+
 def normalize_phase(phase: Union[int, str, None]) -> int:
     """
     Convert any phase format to integer 0-4.
@@ -6,6 +6,8 @@ from contextlib import asynccontextmanager
 from backend.app.config import get_settings
 from backend.app.routes import route_a
 from backend.app.middleware.logging import LoggingMiddleware
+from kg.ingest_opentargets import close_client as close_opentargets_client
+import cerebras_llm
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 import os
@@ -88,6 +90,8 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting Route A system. Neo4j: {settings.neo4j_uri}")
     yield
     logger.info("Shutting down Route A system")
+    await close_opentargets_client()
+    await cerebras_llm.aclose()
 
 
 def create_app() -> FastAPI: